@@ -0,0 +1,222 @@
+"""
+Tipizirano ucitavanje tekstualnih kolona (CSV i slicni izvori).
+
+Umesto da se za svaku celiju redom probaju int, float i datum (sa izuzecima),
+tip kolone se jednom odredi iz uzorka i za nju se koristi unapred izabran
+konvertor. Konvertor vraca isto sto i `parse_cell`; kada celija ne odgovara
+tipu kolone, ta jedna celija ide kroz `parse_cell`. Zato tip kolone utice
+samo na brzinu, nikada na vrednosti.
+
+Izvor moze da dobije i semu (kolona -> tip). Tada se tipovi ne odredjuju,
+vec se deklarisani tip primenjuje strogo: "str" kolona ostaje string (npr.
+"007" se ne pretvara u 7), a celija koja ne odgovara tipu je greska.
+"""
+import json
+import os
+import re
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from .graph import parse_value
+
+INT = "int"
+FLOAT = "float"
+DATE = "date"
+STR = "str"
+TYPES = (INT, FLOAT, DATE, STR)
+
+# koliko redova se gleda pri odredjivanju tipa kolone
+SAMPLE_SIZE = 100
+
+_DIGIT = re.compile(r"\d")
+_FLOAT_WITHOUT_DIGITS = {"nan", "inf", "infinity"}
+
+
+def parse_cell(value: str) -> Any:
+    """
+    Vrednost jedne (neprazne) celije: int, float, datum (datetime) ili string.
+    Isto sto je ranije davalo parsiranje u CSV plugin-u pa ponovo u `Node`.
+    """
+    value = value.strip()
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        pass
+    return parse_value(value)
+
+
+def _to_int(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return parse_cell(value)
+
+
+def _to_float(value: str) -> Any:
+    # bez '.', 'e' i 'E' string moze biti i int, a int ima prednost
+    if "." in value or "e" in value or "E" in value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return parse_cell(value)
+
+
+def _to_date(value: str) -> Any:
+    # "YYYY-MM-DD" nikada nije broj, pa je fromisoformat isto sto i strptime
+    if len(value) == 10 and value[4] == "-":
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return parse_cell(value)
+
+
+def _to_str(value: str) -> Any:
+    # bez cifara vrednost ne moze biti ni broj ni datum (osim nan/inf)
+    if _DIGIT.search(value) is None and value.lower().lstrip("+-") not in _FLOAT_WITHOUT_DIGITS:
+        return value
+    return parse_cell(value)
+
+
+CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    INT: _to_int,
+    FLOAT: _to_float,
+    DATE: _to_date,
+    STR: _to_str,
+}
+
+
+def _declared_date(value: str) -> datetime:
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return datetime.fromisoformat(value)
+    raise ValueError(f"Datum mora biti YYYY-MM-DD: {value!r}")
+
+
+# konvertori za deklarisane tipove: bez pogadjanja, pogresna celija je ValueError
+DECLARED_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    INT: int,
+    FLOAT: float,
+    DATE: _declared_date,
+    STR: str,
+}
+
+# Python tip vrednosti deklarisanog tipa (za indekse atributa)
+PYTHON_TYPES: Dict[str, type] = {INT: int, FLOAT: float, DATE: datetime, STR: str}
+
+
+def load_schema(schema: Union[None, str, Dict[str, str]]) -> Optional[Dict[str, str]]:
+    """
+    Sema iz parametra plugin-a: recnik, JSON tekst, "kolona:tip,kolona:tip"
+    ili putanja do JSON fajla pored podataka. Bez seme vraca None.
+    """
+    if not schema:
+        return None
+    if isinstance(schema, str):
+        text = schema.strip()
+        if os.path.isfile(text):
+            with open(text, encoding="utf-8") as f:
+                schema = json.load(f)
+        elif text.startswith("{"):
+            schema = json.loads(text)
+        else:
+            schema = {}
+            for part in text.split(","):
+                column, sep, kind = part.partition(":")
+                if not sep:
+                    raise ValueError(f"Neispravna sema, ocekuje se kolona:tip: {part.strip()!r}")
+                schema[column.strip()] = kind
+    if not isinstance(schema, dict):
+        raise ValueError("Sema mora biti mapa kolona -> tip")
+
+    result = {}
+    for column, kind in schema.items():
+        kind = str(kind).strip().lower()
+        if kind not in TYPES:
+            raise ValueError(f"Nepoznat tip kolone '{column}': {kind} (dozvoljeni: {', '.join(TYPES)})")
+        result[str(column)] = kind
+    return result
+
+
+def coerce_value(value: Any, kind: str) -> Any:
+    """Vec ucitana vrednost (npr. iz JSON-a) kao vrednost deklarisanog tipa."""
+    if value is None or type(value) is PYTHON_TYPES[kind]:
+        return value
+    if isinstance(value, str):
+        return DECLARED_CONVERTERS[kind](value.strip())
+    if kind == STR:
+        return str(value)
+    if kind == FLOAT and type(value) is int:
+        return float(value)
+    raise ValueError(f"Vrednost {value!r} ne odgovara tipu '{kind}'")
+
+
+def infer_type(values: Iterable[str]) -> str:
+    """Najuzi tip koji odgovara svim (nepraznim) vrednostima iz uzorka."""
+    kinds = set()
+    for value in values:
+        parsed = parse_cell(value)
+        if not isinstance(parsed, (int, float, datetime)):
+            return STR
+        kinds.add(DATE if isinstance(parsed, datetime) else FLOAT if isinstance(parsed, float) else INT)
+    if not kinds:
+        return STR
+    if kinds == {INT}:
+        return INT
+    if kinds <= {INT, FLOAT}:
+        return FLOAT
+    if kinds == {DATE}:
+        return DATE
+    return STR
+
+
+class ColumnConverters:
+    """
+    Konvertor po koloni; kolona koja nije bila u uzorku (ili u semi) koristi STR konvertor.
+    Sa `declared=True` tipovi dolaze iz seme i primenjuju se strogo.
+    """
+
+    def __init__(self, types: Dict[str, str], declared: bool = False):
+        self.types = dict(types)
+        self.declared = declared
+        converters = DECLARED_CONVERTERS if declared else CONVERTERS
+        self._converters = {column: converters[kind] for column, kind in self.types.items()}
+
+    @classmethod
+    def infer(cls, rows: List[Dict[str, str]], columns: Optional[Iterable[str]] = None) -> "ColumnConverters":
+        sample = rows[:SAMPLE_SIZE]
+        if columns is None:
+            columns = sample[0].keys() if sample else ()
+        types = {}
+        for column in columns:
+            values = [row[column].strip() for row in sample if row.get(column) and row[column].strip()]
+            types[column] = infer_type(values)
+        return cls(types)
+
+    def converter(self, column: str) -> Callable[[str], Any]:
+        return self._converters.get(column, _to_str)
+
+    def convert_row(self, row: Dict[str, str], skip: Iterable[str] = ()) -> Dict[str, Any]:
+        """Neprazne celije reda (osim kolona iz `skip`) kao tipizirane vrednosti."""
+        result = {}
+        converters = self._converters
+        for column, value in row.items():
+            if not value or column in skip:
+                continue
+            value = value.strip()
+            if value:
+                try:
+                    result[column] = converters.get(column, _to_str)(value)
+                except ValueError:
+                    raise ValueError(
+                        f"Vrednost {value!r} u koloni '{column}' nije tipa '{self.types[column]}'"
+                    ) from None
+        return result
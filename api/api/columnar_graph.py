@@ -0,0 +1,525 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .graph import Graph, Node, Edge
+
+_MISSING = object()
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_INT64_MIN, _INT64_MAX = -(2 ** 63), 2 ** 63 - 1
+
+
+class _Column:
+    """Kolona jednog atributa; `present[i]` kaze da li red i ima vrednost."""
+    kind = "object"
+
+    def __init__(self, size: int = 0):
+        self.present = bytearray(size)
+
+    def __len__(self):
+        return len(self.present)
+
+    def accepts(self, value) -> bool:
+        return True
+
+    def append(self, value):
+        self.present.append(1)
+        self._append(value)
+
+    def append_missing(self):
+        self.present.append(0)
+        self._append_missing()
+
+    def get(self, i: int):
+        if not self.present[i]:
+            return _MISSING
+        return self._get(i)
+
+    def set(self, i: int, value):
+        self.present[i] = 1
+        self._set(i, value)
+
+    def nbytes(self) -> int:
+        return len(self.present) + self._nbytes()
+
+
+class _ObjectColumn(_Column):
+    """Rezervna kolona za mesovite tipove (bool, liste, date, ...)."""
+    kind = "object"
+
+    def __init__(self, size: int = 0):
+        super().__init__(size)
+        self.values: List[Any] = [None] * size
+
+    def _append(self, value):
+        self.values.append(value)
+
+    def _append_missing(self):
+        self.values.append(None)
+
+    def _get(self, i):
+        return self.values[i]
+
+    def _set(self, i, value):
+        self.values[i] = value
+
+    def _nbytes(self):
+        return 8 * len(self.values)
+
+
+class _ArrayColumn(_Column):
+    typecode = "q"
+
+    def __init__(self, size: int = 0):
+        super().__init__(size)
+        self.values = array(self.typecode, bytes(array(self.typecode).itemsize * size))
+
+    def _append_missing(self):
+        self.values.append(0)
+
+    def _set(self, i, value):
+        self.values[i] = value
+
+    def _nbytes(self):
+        return self.values.itemsize * len(self.values)
+
+
+class _Int64Column(_ArrayColumn):
+    kind = "int64"
+    typecode = "q"
+
+    def accepts(self, value):
+        return type(value) is int and _INT64_MIN <= value <= _INT64_MAX
+
+    def _append(self, value):
+        self.values.append(value)
+
+    def _get(self, i):
+        return self.values[i]
+
+
+class _Float64Column(_ArrayColumn):
+    kind = "float64"
+    typecode = "d"
+
+    def accepts(self, value):
+        return type(value) is float
+
+    def _append(self, value):
+        self.values.append(value)
+
+    def _get(self, i):
+        return self.values[i]
+
+
+class _DatetimeColumn(_ArrayColumn):
+    """datetime64[us]: broj mikrosekundi od 1970-01-01 (samo naivni datumi)."""
+    kind = "datetime64"
+    typecode = "q"
+
+    def accepts(self, value):
+        return type(value) is datetime and value.tzinfo is None
+
+    def _append(self, value):
+        self.values.append((value - _EPOCH) // _MICROSECOND)
+
+    def _set(self, i, value):
+        self.values[i] = (value - _EPOCH) // _MICROSECOND
+
+    def _get(self, i):
+        return _EPOCH + timedelta(microseconds=self.values[i])
+
+
+class _StrColumn(_ArrayColumn):
+    """Recnicki kodiran string: kodovi u int32 nizu, svaki string se cuva jednom."""
+    kind = "str"
+    typecode = "i"
+
+    def __init__(self, size: int = 0):
+        super().__init__(size)
+        self.dictionary: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def accepts(self, value):
+        return type(value) is str
+
+    def _code(self, value) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.dictionary)
+            self.dictionary.append(value)
+        return code
+
+    def _append(self, value):
+        self.values.append(self._code(value))
+
+    def _set(self, i, value):
+        self.values[i] = self._code(value)
+
+    def _get(self, i):
+        return self.dictionary[self.values[i]]
+
+    def _nbytes(self):
+        return super()._nbytes() + sum(len(s) + 49 for s in self.dictionary)
+
+
+def _column_for(value, size: int) -> _Column:
+    for cls in (_Int64Column, _Float64Column, _StrColumn, _DatetimeColumn):
+        column = cls(size)
+        if column.accepts(value):
+            return column
+    return _ObjectColumn(size)
+
+
+class ColumnSet:
+    """
+    Skup tipiziranih kolona za atribute cvorova ili ivica.
+    Kolona dobija tip po prvoj vrednosti; ako kasnije stigne vrednost drugog
+    tipa, kolona se prebacuje u _ObjectColumn (tip vrednosti se nikad ne menja).
+    """
+
+    def __init__(self):
+        self.columns: Dict[str, _Column] = {}
+        self.size = 0
+
+    def append_row(self, data: Optional[Dict[str, Any]]):
+        data = data or {}
+        for name, column in self.columns.items():
+            if name not in data:
+                column.append_missing()
+        for name, value in data.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = _column_for(value, self.size)
+            elif not column.accepts(value):
+                column = self.columns[name] = self._to_object(column)
+            column.append(value)
+        self.size += 1
+
+    def update_row(self, i: int, data: Dict[str, Any]):
+        for name, value in data.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = _column_for(value, self.size)
+            elif not column.accepts(value):
+                column = self.columns[name] = self._to_object(column)
+            column.set(i, value)
+
+    def row(self, i: int) -> Dict[str, Any]:
+        result = {}
+        for name, column in self.columns.items():
+            value = column.get(i)
+            if value is not _MISSING:
+                result[name] = value
+        return result
+
+    def kinds(self) -> Dict[str, str]:
+        return {name: column.kind for name, column in self.columns.items()}
+
+    def nbytes(self) -> int:
+        return sum(column.nbytes() + len(name) + 49 for name, column in self.columns.items())
+
+    @staticmethod
+    def _to_object(column: _Column) -> _ObjectColumn:
+        converted = _ObjectColumn()
+        for i in range(len(column)):
+            value = column.get(i)
+            if value is _MISSING:
+                converted.append_missing()
+            else:
+                converted.append(value)
+        return converted
+
+
+class _NodeSequence(Sequence):
+    """Lista cvorova koja pravi Node objekte tek pri pristupu."""
+
+    def __init__(self, graph: "ColumnarGraph"):
+        self._graph = graph
+
+    def __len__(self):
+        return len(self._graph._ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._graph._make_node(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._graph._make_node(i)
+
+    def __iter__(self) -> Iterator[Node]:
+        make = self._graph._make_node
+        for i in range(len(self)):
+            yield make(i)
+
+
+class _EdgeSequence(Sequence):
+    """Lista ivica koja pravi Edge objekte tek pri pristupu."""
+
+    def __init__(self, graph: "ColumnarGraph"):
+        self._graph = graph
+
+    def __len__(self):
+        return len(self._graph._src)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._graph._make_edge(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._graph._make_edge(i)
+
+    def __iter__(self) -> Iterator[Edge]:
+        make = self._graph._make_edge
+        for i in range(len(self)):
+            yield make(i)
+
+
+class ColumnarGraph(Graph):
+    """
+    Alternativni, kolonski nacin cuvanja grafa za velike skupove podataka.
+
+    Cvorovi su interno gusti celobrojni indeksi (pozicija u `_ids`), ivice su
+    dva int32 niza (source/target indeksi) i float64 niz tezina, a atributi se
+    cuvaju po koloni (int64 / float64 / recnicki kodiran str / datetime64).
+
+    `nodes` i `edges` vracaju sekvence koje prave Node/Edge objekte tek pri
+    citanju, pa FilterService, SearchService i vizualizeri rade bez izmena.
+    Dodavanje cvorova i ivica radi direktno nad kolonama; ostale izmene
+    (edit/delete/dodela lista) prvo pretvaraju graf u obican objektni model.
+    """
+
+    def __init__(self, name: str = None, directed: bool = True):
+        self._columnar = False
+        super().__init__(name=name, directed=directed)
+        self._columnar = True
+        self._ids: List[str] = []
+        self._id_index: Dict[str, int] = {}
+        self._labels = _StrColumn()
+        self.node_columns = ColumnSet()
+        self._src = array("i")
+        self._dst = array("i")
+        self._weights = array("d")
+        self._edge_keys: Set[int] = set()
+        self.edge_columns = ColumnSet()
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "ColumnarGraph":
+        columnar = cls(name=graph.name, directed=graph.directed)
+        for node in graph.nodes:
+            columnar.add_node(node)
+        for edge in graph.edges:
+            columnar.add_edge(edge)
+        return columnar
+
+    def copy(self) -> Graph:
+        """Nezavisna kopija; dok je graf kolonski, i kopija je kolonska."""
+        if not self._columnar:
+            return super().copy()
+        graph = ColumnarGraph.from_graph(self)
+        graph.schema = dict(self.schema)
+        graph._csr = dict(self._csr)
+        return graph
+
+    # --- pravljenje objekata pri citanju ---
+
+    def _make_node(self, i: int) -> Node:
+        node = Node(id=self._ids[i], label=self._labels.get(i))
+        node.data = self.node_columns.row(i)
+        return node
+
+    def _make_edge(self, i: int) -> Edge:
+        edge = Edge(source=self._ids[self._src[i]], target=self._ids[self._dst[i]], weight=self._weights[i])
+        edge.data = self.edge_columns.row(i)
+        return edge
+
+    def _materialize(self):
+        """Prebacuje graf u objektni model (pre izmena koje kolone ne podrzavaju)."""
+        if not self._columnar:
+            return
+        nodes, edges = list(_NodeSequence(self)), list(_EdgeSequence(self))
+        self._columnar = False
+        Graph.nodes.fset(self, nodes)
+        Graph.edges.fset(self, edges)
+        self._ids, self._id_index = [], {}
+        self._labels = _StrColumn()
+        self.node_columns, self.edge_columns = ColumnSet(), ColumnSet()
+        self._src, self._dst, self._weights = array("i"), array("i"), array("d")
+        self._edge_keys = set()
+
+    # --- liste i indeksi ---
+
+    @property
+    def nodes(self):
+        if self._columnar:
+            return _NodeSequence(self)
+        return Graph.nodes.fget(self)
+
+    @nodes.setter
+    def nodes(self, nodes):
+        self._materialize()
+        Graph.nodes.fset(self, nodes)
+
+    @property
+    def edges(self):
+        if self._columnar:
+            return _EdgeSequence(self)
+        return Graph.edges.fget(self)
+
+    @edges.setter
+    def edges(self, edges):
+        self._materialize()
+        Graph.edges.fset(self, edges)
+
+    def _edge_key(self, source: int, target: int) -> int:
+        return (source << 32) | target
+
+    def index_of(self, node_id) -> Optional[int]:
+        if not self._columnar:
+            return super().index_of(node_id)
+        return self._id_index.get(node_id)
+
+    def _id_at(self, i: int):
+        if not self._columnar:
+            return super()._id_at(i)
+        return self._ids[i]
+
+    def _endpoint_arrays(self) -> Tuple[array, array]:
+        if not self._columnar:
+            return super()._endpoint_arrays()
+        return self._src, self._dst
+
+    def get_node(self, node_id) -> Optional[Node]:
+        if not self._columnar:
+            return super().get_node(node_id)
+        i = self._id_index.get(node_id)
+        return None if i is None else self._make_node(i)
+
+    def has_node(self, node_id) -> bool:
+        if not self._columnar:
+            return super().has_node(node_id)
+        return node_id in self._id_index
+
+    def _edge_position(self, source, target) -> Optional[int]:
+        s, t = self._id_index.get(source), self._id_index.get(target)
+        if s is None or t is None or self._edge_key(s, t) not in self._edge_keys:
+            return None
+        for neighbor, e in zip(self.neighbor_indices(s), self.edge_indices(s)):
+            if neighbor == t:
+                return e
+        return None
+
+    def get_edge(self, source, target) -> Optional[Edge]:
+        if not self._columnar:
+            return super().get_edge(source, target)
+        i = self._edge_position(source, target)
+        return None if i is None else self._make_edge(i)
+
+    def has_edge(self, source, target) -> bool:
+        if not self._columnar:
+            return super().has_edge(source, target)
+        s, t = self._id_index.get(source), self._id_index.get(target)
+        return s is not None and t is not None and self._edge_key(s, t) in self._edge_keys
+
+    def successors(self, node_id) -> Set[str]:
+        if not self._columnar:
+            return super().successors(node_id)
+        return set(self.neighbors(node_id, "out"))
+
+    def predecessors(self, node_id) -> Set[str]:
+        if not self._columnar:
+            return super().predecessors(node_id)
+        return set(self.neighbors(node_id, "in"))
+
+    # --- izmene ---
+
+    def update_node_data(self, node_id, data: Dict[str, Any]) -> bool:
+        if not self._columnar:
+            return super().update_node_data(node_id, data)
+        i = self._id_index.get(node_id)
+        if i is None:
+            return False
+        self.node_columns.update_row(i, data)
+        self.node_changed(node_id)
+        return True
+
+    def add_node(self, node: Node) -> bool:
+        if not self._columnar:
+            return super().add_node(node)
+        if node.id in self._id_index:
+            print(f"Node {node.id} already exists!")
+            return False
+        self._id_index[node.id] = len(self._ids)
+        self._ids.append(node.id)
+        self._labels.append(node.label)
+        self.node_columns.append_row(node.data)
+        if self._search_blobs is not None:
+            self._search_blobs.append(None)
+            self._search_buffer = None
+        self._invalidate()
+        return True
+
+    def add_edge(self, edge: Edge) -> bool:
+        if not self._columnar:
+            return super().add_edge(edge)
+        s, t = self._id_index.get(edge.source), self._id_index.get(edge.target)
+        if s is None or t is None:
+            return False
+        key = self._edge_key(s, t)
+        if key in self._edge_keys:
+            return False
+        self._edge_keys.add(key)
+        self._src.append(s)
+        self._dst.append(t)
+        self._weights.append(edge.weight)
+        self.edge_columns.append_row(edge.data)
+        self._invalidate()
+        return True
+
+    def add_edges(self, edges) -> List[Edge]:
+        if not self._columnar:
+            return super().add_edges(edges)
+        dangling = []
+        for edge in edges:
+            if edge.source not in self._id_index or edge.target not in self._id_index:
+                dangling.append(edge)
+            else:
+                self.add_edge(edge)
+        return dangling
+
+    def edit_node(self, node_id, **properties):
+        self._materialize()
+        return super().edit_node(node_id, **properties)
+
+    def delete_node(self, node_id) -> bool:
+        self._materialize()
+        return super().delete_node(node_id)
+
+    def edit_edge(self, edge_id: Tuple[str, str], **properties):
+        self._materialize()
+        return super().edit_edge(edge_id, **properties)
+
+    def delete_edge(self, edge_id: Tuple[str, str]) -> bool:
+        self._materialize()
+        return super().delete_edge(edge_id)
+
+    def delete_edges_at(self, positions) -> int:
+        self._materialize()
+        return super().delete_edges_at(positions)
+
+    def clear_graph(self):
+        self._materialize()
+        super().clear_graph()
+
+    def memory_usage(self) -> int:
+        """Priblizan broj bajtova koje zauzimaju kolone (bez Python overhead-a samog objekta)."""
+        if not self._columnar:
+            return 0
+        ids = sum(len(i) + 49 for i in self._ids) + 8 * len(self._ids)
+        arrays = sum(a.itemsize * len(a) for a in (self._src, self._dst, self._weights))
+        return ids + self._labels.nbytes() + self.node_columns.nbytes() + arrays + self.edge_columns.nbytes()
@@ -1,7 +1,8 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import Any, List, Dict
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Tuple
 from enum import Enum
-from .graph import Graph 
+from .graph import Edge, Graph, Node
 
 #dodajemo model za opis ulaznog parametra
 #korisno jer moramo reći platformi koji tip ulaza očekujemo (fajl, tekst, url)
@@ -26,12 +27,102 @@ class PluginParameter:
         self.is_required = is_required
         self.default_value = default_value
 
+class LoadCancelled(Exception):
+    """Ucitavanje je prekinuto na zahtev korisnika (`LoadProgress.cancel`)."""
+
+
+class LoadProgress:
+    """
+    Napredak ucitavanja koji plugin prijavljuje (`DataSourcePlugin.report_progress`):
+    broj procitanih redova/elemenata i bajtova. Sluzi i kao zeton za prekid:
+    posle `cancel()` sledeca prijava napretka baca LoadCancelled.
+    """
+
+    def __init__(self, callback: Optional[Callable[["LoadProgress"], None]] = None):
+        self.rows = 0
+        self.bytes = 0
+        self.total_bytes: Optional[int] = None
+        self._callback = callback
+        self._cancelled = threading.Event()
+
+    def update(self, rows: int = 0, position: Optional[int] = None, total: Optional[int] = None):
+        self.check()
+        self.rows += rows
+        if position is not None:
+            self.bytes = position
+        if total is not None:
+            self.total_bytes = total
+        if self._callback is not None:
+            self._callback(self)
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def check(self):
+        if self._cancelled.is_set():
+            raise LoadCancelled("Ucitavanje je prekinuto.")
+
+    def to_dict(self) -> Dict[str, Any]:
+        fraction = None
+        if self.total_bytes:
+            fraction = min(1.0, self.bytes / self.total_bytes)
+        return {"rows": self.rows, "bytes": self.bytes, "total_bytes": self.total_bytes, "fraction": fraction}
+
+
+class GraphBatch:
+    """
+    Deo grafa koji daje `DataSourcePlugin.parse_iter`; delove redom slaze `GraphBuilder`.
+
+      - nodes: novi cvorovi (cvor sa id-jem koji vec postoji se preskace),
+      - updates: (id, data) koji se dopisuju u data postojeceg cvora,
+      - edges: ivice (postojeca se preskace, ivica bez nekog kraja se ne dodaje).
+
+    Podesavanja grafa (None = bez promene): `name`, `schema` i `directed`;
+    ako usmerenost nije zadata, graf je neusmeren kad svaka ivica ima suprotnu,
+    a tada se druga ivica svakog para brise (osim sa `keep_reverse_edges`).
+    Podrazumevani `parse_iter` daje ceo graf iz `parse` kao `graph`.
+    """
+
+    def __init__(self, nodes: Iterable[Node] = (), edges: Iterable[Edge] = (),
+                 updates: Iterable[Tuple[Any, Dict[str, Any]]] = (), graph: Optional[Graph] = None,
+                 name: Optional[str] = None, schema: Optional[Dict[str, str]] = None,
+                 directed: Optional[bool] = None, keep_reverse_edges: Optional[bool] = None):
+        self.nodes = nodes
+        self.edges = edges
+        self.updates = updates
+        self.graph = graph
+        self.name = name
+        self.schema = schema
+        self.directed = directed
+        self.keep_reverse_edges = keep_reverse_edges
+
+
 class DataSourcePlugin(ABC):
     """
     Apstraktna bazna klasa za sve Data Source plugin-ove.
     Definiše ugovor koji svaki plugin mora da poštuje.
     """
 
+    # da li platforma sme da cuva snapshot ucitanog grafa (izvor koji je vec
+    # binarni graf nema sta da dobije od kesa)
+    cacheable: bool = True
+
+    # napredak i zeton za prekid; platforma ga postavlja pre citanja kad ucitava u pozadini
+    progress: Optional[LoadProgress] = None
+
+    def report_progress(self, rows: int = 0, position: Optional[int] = None, total: Optional[int] = None):
+        """
+        Prijava napretka iz `parse`/`parse_iter`: `rows` novih redova/elemenata, `position`
+        procitanih bajtova, `total` velicina ulaza. Bez `progress` ne radi nista;
+        ako je ucitavanje prekinuto, baca LoadCancelled.
+        """
+        if self.progress is not None:
+            self.progress.update(rows, position, total)
+
     @abstractmethod
     def name(self) -> str:
         """
@@ -58,4 +149,12 @@ class DataSourcePlugin(ABC):
         Returns:
             Graph: Instanciran i popunjen objekat grafa.
         """
-        pass
\ No newline at end of file
+        pass
+
+    def parse_iter(self, parameters: Dict[str, Any]) -> Iterator[GraphBatch]:
+        """
+        Graf u delovima (GraphBatch), redom kojim se citaju iz izvora; platforma
+        ih slaze `GraphBuilder`-om dok citanje traje. Podrazumevano je ceo graf
+        iz `parse` jedan deo, pa plugin koji ne implementira ovu metodu radi kao i ranije.
+        """
+        yield GraphBatch(graph=self.parse(parameters))
\ No newline at end of file
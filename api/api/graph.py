@@ -1,5 +1,11 @@
-from typing import Any, Dict, List
-from datetime import datetime
+import logging
+from array import array
+from collections import Counter
+from itertools import accumulate
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from datetime import date, datetime
+
+logger = logging.getLogger(__name__)
 
 def parse_value(value):
     """Automatski pokušava da pretvori value u int, float, date, ili ostavi kao string."""
@@ -20,11 +26,36 @@ def parse_value(value):
             pass
     return value 
 
+# Separatori u tekstu za pretragu: izmedju polja jednog cvora i izmedju cvorova
+SEARCH_FIELD_SEPARATOR = "\x00"
+SEARCH_NODE_SEPARATOR = "\x01"
+
+
+def search_fields(node: "Node") -> Iterator[str]:
+    """Tekstovi cvora po kojima se pretrazuje (mala slova): nazivi atributa i vrednosti."""
+    for key, value in node.data.items():
+
+        if key.lower() == "id":
+            continue
+
+        yield key.lower()
+
+        if isinstance(value, (str, int, float)):
+            yield str(value).lower()
+
+        elif isinstance(value, (date, datetime)):
+            yield value.isoformat().lower()
+
+
 class Node:
-    def __init__(self, id: str, label: str = "", data: Dict[str, Any] = None):
+    def __init__(self, id: str, label: str = "", data: Dict[str, Any] = None, parsed: bool = False):
         self.id = id
         self.label = label
-        self.data = {k: parse_value(v) for k, v in (data or {}).items()}
+        # parsed=True: vrednosti su vec tipizirane (npr. column_types), recnik se preuzima bez kopiranja
+        if parsed:
+            self.data = data if data is not None else {}
+        else:
+            self.data = {k: parse_value(v) for k, v in (data or {}).items()}
 
     def to_dict(self):
         return {
@@ -35,11 +66,14 @@ class Node:
 
 
 class Edge:
-    def __init__(self, source: str, target: str, weight: float = 1.0, data: Dict[str, Any] = None):
+    def __init__(self, source: str, target: str, weight: float = 1.0, data: Dict[str, Any] = None, parsed: bool = False):
         self.source = source
         self.target = target
         self.weight = weight
-        self.data = {k: parse_value(v) for k, v in (data or {}).items()}
+        if parsed:
+            self.data = data if data is not None else {}
+        else:
+            self.data = {k: parse_value(v) for k, v in (data or {}).items()}
 
     def to_dict(self):
         return {
@@ -51,24 +85,319 @@ class Edge:
 
 
 class Graph:
+    """
+    Graf sa hes indeksima nad cvorovima i ivicama.
+
+    `nodes` i `edges` ostaju obicne liste (vizualizeri ih samo iteriraju),
+    a pored njih se odrzavaju:
+      - id -> gusti celobrojni indeks (pozicija cvora u `nodes`),
+      - (source, target) -> Edge recnik,
+      - ulazni/izlazni skupovi suseda po cvoru.
+    Sve metode koje menjaju graf azuriraju indekse, pa su add_node/add_edge
+    i provere postojanja O(1). Liste ne treba menjati direktno (append/remove),
+    vec preko metoda ili dodelom cele liste (`graph.nodes = [...]`).
+
+    Za obilazak suseda i indukciju podgrafa graf lenjo gradi CSR
+    (compressed sparse row) adjacency u oba smera; svaka izmena ga ponistava
+    i uvecava `version`.
+    """
+
     def __init__(self, name: str = None, directed: bool = True, nodes: List[Node] = None, edges: List[Edge] = None):
         self.name = name
         self.directed = directed
+        # deklarisani tipovi atributa (atribut -> "int"/"float"/"date"/"str"), ako ih je izvor zadao
+        self.schema: Dict[str, str] = {}
+        self._nodes: List[Node] = []
+        self._edges: List[Edge] = []
+        self._node_index: Dict[str, int] = {}
+        self._edge_index: Dict[Tuple[str, str], Edge] = {}
+        self._out: Dict[str, Set[str]] = {}
+        self._in: Dict[str, Set[str]] = {}
+        self._csr: Dict[str, Tuple[array, array, array]] = {}
+        self._search_blobs: Optional[List[Optional[str]]] = None
+        self._search_buffer: Optional[Tuple[str, array]] = None
+        self.version = 0
         self.nodes = nodes or []
         self.edges = edges or []
 
-    def add_node(self, node: Node):
-        if any(n.id == node.id for n in self.nodes):
+    # --- liste i indeksi ---
+
+    @property
+    def nodes(self) -> List[Node]:
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: List[Node]):
+        self._nodes = list(nodes)
+        self._node_index = {}
+        for i, node in enumerate(self._nodes):
+            self._node_index.setdefault(node.id, i)
+        self._search_blobs = None
+        self._search_buffer = None
+        self._invalidate()
+
+    @property
+    def edges(self) -> List[Edge]:
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges: List[Edge]):
+        # ivica ciji source ili target ne postoji se ne dodaje (kao u add_edges)
+        node_index = self._node_index
+        self._edges = []
+        self._edge_index = {}
+        self._out = {}
+        self._in = {}
+        dangling = 0
+        for edge in edges:
+            if edge.source not in node_index or edge.target not in node_index:
+                dangling += 1
+                continue
+            self._edges.append(edge)
+            self._index_edge(edge)
+        if dangling:
+            logger.warning(f"Nije dodato {dangling} ivica: kraj ne postoji medju cvorovima")
+        self._invalidate()
+
+    def _invalidate(self):
+        """Poziva se posle svake izmene: CSR vise ne vazi."""
+        self._csr = {}
+        self.version += 1
+
+    def _index_edge(self, edge: Edge):
+        self._edge_index.setdefault((edge.source, edge.target), edge)
+        self._out.setdefault(edge.source, set()).add(edge.target)
+        self._in.setdefault(edge.target, set()).add(edge.source)
+
+    def _unindex_edge(self, edge: Edge):
+        del self._edge_index[(edge.source, edge.target)]
+        self._out[edge.source].discard(edge.target)
+        self._in[edge.target].discard(edge.source)
+
+    def index_of(self, node_id) -> Optional[int]:
+        """Gusti indeks cvora (pozicija u `nodes`) ili None."""
+        return self._node_index.get(node_id)
+
+    def _id_at(self, i: int):
+        return self._nodes[i].id
+
+    def get_node(self, node_id) -> Optional[Node]:
+        i = self._node_index.get(node_id)
+        return None if i is None else self._nodes[i]
+
+    def has_node(self, node_id) -> bool:
+        return node_id in self._node_index
+
+    def get_edge(self, source, target) -> Optional[Edge]:
+        return self._edge_index.get((source, target))
+
+    def has_edge(self, source, target) -> bool:
+        return (source, target) in self._edge_index
+
+    def successors(self, node_id) -> Set[str]:
+        """Id-jevi cvorova do kojih vodi ivica iz node_id."""
+        return self._out.get(node_id, set())
+
+    def predecessors(self, node_id) -> Set[str]:
+        """Id-jevi cvorova iz kojih vodi ivica ka node_id."""
+        return self._in.get(node_id, set())
+
+    # --- CSR adjacency ---
+
+    def _endpoint_arrays(self) -> Tuple[array, array]:
+        # -1: kraj vise nije cvor grafa (npr. posle dodele `nodes`)
+        index = self._node_index
+        sources = array("i", [index.get(e.source, -1) for e in self._edges])
+        targets = array("i", [index.get(e.target, -1) for e in self._edges])
+        return sources, targets
+
+    def csr(self, direction: str = "out") -> Tuple[array, array, array]:
+        """
+        Vraca (offsets, neighbors, edge_ids) za smer "out" ili "in".
+        Susedi cvora i su neighbors[offsets[i]:offsets[i + 1]], a edge_ids na
+        istim pozicijama su indeksi odgovarajucih ivica u `edges`.
+        """
+        if direction not in ("out", "in"):
+            raise ValueError(f"Nepoznat smer: {direction}")
+        if direction not in self._csr:
+            sources, targets = self._endpoint_arrays()
+            if direction == "in":
+                sources, targets = targets, sources
+            edge_ids = range(len(sources))
+            if -1 in sources or -1 in targets:
+                # ivica bez nekog kraja nije u CSR-u
+                edge_ids = [e for e in edge_ids if sources[e] >= 0 and targets[e] >= 0]
+                counts = Counter(sources[e] for e in edge_ids)
+            else:
+                counts = Counter(sources)
+            offsets = array("i", [0])
+            offsets.extend(accumulate(counts.get(i, 0) for i in range(len(self.nodes))))
+            # stabilno sortiranje cuva redosled ivica unutar jednog cvora
+            order = sorted(edge_ids, key=sources.__getitem__)
+            neighbors = array("i", [targets[e] for e in order])
+            self._csr[direction] = (offsets, neighbors, array("i", order))
+        return self._csr[direction]
+
+    def preload_csr(self, direction: str, csr: Tuple[array, array, array]):
+        """
+        Postavlja vec izracunat CSR (npr. procitan iz binarnog fajla) za tekucu
+        verziju grafa; vazi do prve izmene kao i izracunat.
+        """
+        if direction not in ("out", "in"):
+            raise ValueError(f"Nepoznat smer: {direction}")
+        offsets, neighbors, edge_ids = csr
+        if len(offsets) != len(self.nodes) + 1 or not len(neighbors) == len(edge_ids) == len(self.edges):
+            raise ValueError("CSR ne odgovara grafu")
+        self._csr[direction] = (offsets, neighbors, edge_ids)
+
+    def csr_ready(self, direction: str = "out") -> bool:
+        """Da li je CSR za dati smer vec napravljen (za tekucu verziju grafa)."""
+        return direction in self._csr
+
+    def neighbor_indices(self, i: int, direction: str = "out") -> array:
+        offsets, neighbors, _ = self.csr(direction)
+        return neighbors[offsets[i]:offsets[i + 1]]
+
+    def edge_indices(self, i: int, direction: str = "out") -> array:
+        offsets, _, edge_ids = self.csr(direction)
+        return edge_ids[offsets[i]:offsets[i + 1]]
+
+    def neighbors(self, node_id, direction: str = "out") -> List[str]:
+        i = self.index_of(node_id)
+        if i is None:
+            return []
+        return [self._id_at(j) for j in self.neighbor_indices(i, direction)]
+
+    def induced_edges(self, node_indices: Iterable[int]) -> List[Edge]:
+        """Ivice izmedju zadatih cvorova, u redosledu iz `edges`."""
+        node_indices = list(node_indices)
+        offsets, neighbors, edge_ids = self.csr("out")
+        selected = bytearray(len(offsets) - 1)
+        for i in node_indices:
+            selected[i] = 1
+        found = []
+        for i in node_indices:
+            for p in range(offsets[i], offsets[i + 1]):
+                if selected[neighbors[p]]:
+                    found.append(edge_ids[p])
+        edges = self.edges
+        return [edges[e] for e in sorted(found)]
+
+    def induced_subgraph(self, node_indices: Iterable[int], name: str = None) -> "Graph":
+        """Novi graf sa zadatim cvorovima (po indeksu) i svim ivicama medju njima."""
+        node_indices = sorted(set(node_indices))
+        nodes = self.nodes
+        return Graph(
+            name=name if name is not None else self.name,
+            directed=self.directed,
+            nodes=[nodes[i] for i in node_indices],
+            edges=self.induced_edges(node_indices),
+        )
+
+    # --- tekst za pretragu ---
+
+    def search_blob(self, i: int) -> str:
+        """
+        Kesirani tekst za pretragu cvora i: polja (mala slova) spojena sa
+        SEARCH_FIELD_SEPARATOR, pa pogodak ne moze da preskoci granicu polja.
+        """
+        blobs = self._search_blobs
+        if blobs is None or len(blobs) != len(self.nodes):
+            blobs = self._search_blobs = [None] * len(self.nodes)
+            self._search_buffer = None
+        blob = blobs[i]
+        if blob is None:
+            blob = blobs[i] = SEARCH_FIELD_SEPARATOR.join(search_fields(self.nodes[i]))
+        return blob
+
+    def search_buffer(self) -> Tuple[str, array]:
+        """
+        Tekstovi svih cvorova u jednom stringu (razdvojeni SEARCH_NODE_SEPARATOR)
+        i tabela pocetaka: tekst cvora i pocinje na starts[i].
+        """
+        if self._search_buffer is None or self._search_blobs is None:
+            blobs = [self.search_blob(i) for i in range(len(self.nodes))]
+            starts = array("q", [0])
+            starts.extend(accumulate(len(blob) + 1 for blob in blobs[:-1]))
+            self._search_buffer = (SEARCH_NODE_SEPARATOR.join(blobs), starts)
+        return self._search_buffer
+
+    def node_changed(self, node_id):
+        """Javlja grafu da su podaci cvora promenjeni (ponistava njegov tekst za pretragu)."""
+        i = self.index_of(node_id)
+        if i is not None and self._search_blobs is not None and i < len(self._search_blobs):
+            self._search_blobs[i] = None
+        self._search_buffer = None
+        self._invalidate()
+
+    # --- izmene ---
+
+    def update_node_data(self, node_id, data: Dict[str, Any]) -> bool:
+        """Dopisuje `data` u atribute postojeceg cvora (vrednosti se ne parsiraju)."""
+        node = self.get_node(node_id)
+        if node is None:
+            return False
+        node.data.update(data)
+        self.node_changed(node_id)
+        return True
+
+    def add_node(self, node: Node) -> bool:
+        if node.id in self._node_index:
             print(f"Node {node.id} already exists!")
-            return
-        self.nodes.append(node)
+            return False
+        self._node_index[node.id] = len(self._nodes)
+        self._nodes.append(node)
+        if self._search_blobs is not None:
+            self._search_blobs.append(None)
+            self._search_buffer = None
+        self._invalidate()
+        return True
 
-    def add_edge(self, edge: Edge):
-        if any(e.source == edge.source and e.target == edge.target for e in self.edges):
-            return
-        if not any(n.id == edge.source for n in self.nodes) or not any(n.id == edge.target for n in self.nodes):
-            return
-        self.edges.append(edge)
+    def add_edge(self, edge: Edge) -> bool:
+        if (edge.source, edge.target) in self._edge_index:
+            return False
+        if edge.source not in self._node_index or edge.target not in self._node_index:
+            return False
+        self._edges.append(edge)
+        self._index_edge(edge)
+        self._invalidate()
+        return True
+
+    def add_edges(self, edges: Iterable[Edge]) -> List[Edge]:
+        """
+        Dodaje vise ivica u jednom prolazu (CSR se ponistava jednom, na kraju).
+        Ivica koja vec postoji se preskace kao u add_edge; vraca ivice ciji
+        source ili target ne postoji (one nisu dodate).
+        """
+        node_index, edge_index = self._node_index, self._edge_index
+        dangling = []
+        added = False
+        for edge in edges:
+            if edge.source not in node_index or edge.target not in node_index:
+                dangling.append(edge)
+                continue
+            if (edge.source, edge.target) in edge_index:
+                continue
+            self._edges.append(edge)
+            self._index_edge(edge)
+            added = True
+        if added:
+            self._invalidate()
+        return dangling
+
+    def copy(self) -> "Graph":
+        """
+        Nezavisna kopija: novi Node i Edge objekti sa svojim recnicima atributa
+        (same vrednosti su nepromenljive, pa se ne kopiraju). CSR vazi i za kopiju.
+        """
+        graph = Graph(
+            name=self.name, directed=self.directed,
+            nodes=[Node(n.id, n.label, dict(n.data), parsed=True) for n in self.nodes],
+            edges=[Edge(e.source, e.target, e.weight, dict(e.data), parsed=True) for e in self.edges],
+        )
+        graph.schema = dict(self.schema)
+        graph._csr = dict(self._csr)
+        return graph
 
     def to_dict(self):
         return {
@@ -79,53 +408,89 @@ class Graph:
         }
     
     def edit_node(self, node_id, **properties):
-        node = self.nodes.get(node_id)
+        node = self.get_node(node_id)
         if not node:
             print(f"Node {node_id} does not exist!")
             return
-        node.properties.update(properties)
+        node.data.update(properties)
+        self.node_changed(node_id)
 
-    def delete_node(self, node_id):
-        node = self.nodes.get(node_id)
-        if not node:
+    def delete_node(self, node_id) -> bool:
+        i = self._node_index.get(node_id)
+        if i is None:
             print(f"Node {node_id} does not exist!")
-            return
-        if node.edges:
-            print(f"Cannot delete node {node_id}, it has connected edges: {node.edges}")
-            return
-        del self.nodes[node_id]
+            return False
+        if self._out.get(node_id) or self._in.get(node_id):
+            print(f"Cannot delete node {node_id}, it has connected edges.")
+            return False
+        del self._nodes[i]
+        del self._node_index[node_id]
+        if self._search_blobs is not None:
+            del self._search_blobs[i]
+            self._search_buffer = None
+        # cvorovi posle obrisanog se pomeraju za jedno mesto
+        for j in range(i, len(self._nodes)):
+            self._node_index[self._nodes[j].id] = j
+        self._out.pop(node_id, None)
+        self._in.pop(node_id, None)
+        self._invalidate()
+        return True
 
-    def edit_edge(self, edge_id, **properties):
-        edge = self.edges.get(edge_id)
+    def edit_edge(self, edge_id: Tuple[str, str], **properties):
+        edge = self._edge_index.get(edge_id)
         if not edge:
             print(f"Edge {edge_id} does not exist!")
             return
-        edge.properties.update(properties)
+        edge.data.update(properties)
+        self._invalidate()
 
-    def delete_edge(self, edge_id):
-        edge = self.edges.get(edge_id)
+    def delete_edge(self, edge_id: Tuple[str, str]) -> bool:
+        edge = self._edge_index.get(edge_id)
         if not edge:
             print(f"Edge {edge_id} does not exist!")
-            return
-        node1_id, node2_id = edge.nodes
-        self.nodes[node1_id].edges.discard(edge_id)
-        self.nodes[node2_id].edges.discard(edge_id)
-        del self.edges[edge_id]
+            return False
+        self._edges.remove(edge)
+        self._unindex_edge(edge)
+        self._invalidate()
+        return True
+
 
+    def delete_edges_at(self, positions: Iterable[int]) -> int:
+        """
+        Brise ivice na zadatim (rastucim) pozicijama u `edges` u jednom prolazu
+        i vraca broj obrisanih. Za masovno brisanje umesto delete_edge u petlji.
+        """
+        edges = self._edges
+        positions = iter(positions)
+        drop = next(positions, -1)
+        write = 0
+        for read, edge in enumerate(edges):
+            if read == drop:
+                self._unindex_edge(edge)
+                drop = next(positions, -1)
+                continue
+            edges[write] = edge
+            write += 1
+        removed = len(edges) - write
+        del edges[write:]
+        if removed:
+            self._invalidate()
+        return removed
     
     def filter_nodes(self, condition):
         # Ovo je jednostavan filter, može se proširiti
         filtered = []
-        for node in self.nodes.values():
+        for node in self._nodes:
             try:
-                if eval(condition, {}, node.properties):
+                if eval(condition, {}, node.data):
                     filtered.append(node)
             except Exception as e:
                 pass
+        return filtered
 
     def search_nodes(self, key, value):
-        result = [node for node in self.nodes.values() if node.properties.get(key) == value]
+        return [node for node in self._nodes if node.data.get(key) == value]
 
     def clear_graph(self):
-        self.nodes.clear()
-        self.edges.clear()
+        self.nodes = []
+        self.edges = []
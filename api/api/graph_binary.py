@@ -0,0 +1,324 @@
+"""
+Kompaktan binarni zapis grafa (Graph) na disku.
+
+Fajl se cita bez parsiranja teksta (osim kratkog JSON opisa na pocetku):
+sve ostalo su nizovi fiksne sirine koji se citaju direktno iz mapiranog fajla.
+
+Raspored fajla (svi brojevi su little-endian):
+
+    bajtovi 0-7    MAGIC = b"GRAPHBIN"
+    bajtovi 8-11   verzija formata (uint32, trenutno 1)
+    bajtovi 12-15  duzina meta opisa u bajtovima (uint32)
+    16 ...         meta opis: UTF-8 JSON objekat (opisan dole)
+    podaci         od prve pozicije deljive sa 8 posle meta opisa: sekcije,
+                   svaka poravnata na 8 bajtova (izmedju su nule)
+
+Sekcija je niz brojeva jednog tipa; `meta["sections"][k] = [pozicija, duzina]`
+je k-ta sekcija (pozicija od pocetka podataka, duzina u bajtovima). Ostali
+kljucevi meta opisa upucuju na sekcije po rednom broju:
+
+    name, directed, schema     ime grafa, usmerenost i deklarisani tipovi atributa
+    nodes, edges               broj cvorova i ivica
+    strings                    [blok, pocetci]: svi razliciti stringovi spojeni u jedan
+                               UTF-8 blok (uint8) i pozicija pocetka svakog stringa
+                               u dekodiranom tekstu (uint64, jedan vise nego stringova)
+    node_id, node_label        kolone (vidi dole) sa id-jem i labelom svakog cvora
+    node_data                  grupe atributa cvorova (vidi dole)
+    edge_source, edge_target   int32 indeksi krajnjih cvorova (pozicija u nizu cvorova)
+    edge_weight, edge_data     kolona tezina i grupe atributa ivica
+    adjacency                  opciono: {"out": [offsets, neighbors, edge_ids], "in": [...]},
+                               int32 CSR u istom obliku kao Graph.csr
+
+Kolona je opis {"kind": vrsta, ...} vrednosti istog reda:
+
+    none       bez sekcije, {"count": n}
+    bool       uint8 (0/1)
+    int        int64
+    float      float64
+    str        uint32 indeks u tabeli stringova
+    date       int32 redni broj dana (date.toordinal)
+    datetime   uint32 indeks stringa u ISO formatu
+    json       uint32 indeks JSON teksta (liste, recnici, int van int64 opsega)
+    mixed      {"tags": sekcija uint8 sa indeksom vrste u KINDS za svaku vrednost,
+                "parts": {vrsta: kolona}} - vrednosti jedne vrste redom, po koloni za vrstu
+
+Grupa atributa je {"keys": [...], "members": sekcija uint32, "columns": [...]}:
+data recnici sa istim nizom kljuceva (istim redom) cine jednu grupu, `members`
+su indeksi cvorova (ivica) u grupi, a za svaki kljuc postoji kolona sa
+vrednostima clanova redom.
+"""
+import json
+import os
+import struct
+import sys
+from array import array
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from api.api.graph import Edge, Graph, Node
+from api.api.input_file import InputFile
+
+MAGIC = b"GRAPHBIN"
+VERSION = 1
+_HEADER = struct.Struct("<8sII")
+_ALIGN = 8
+
+# vrste kolona; redosled je i oznaka tipa u mesovitoj koloni
+KINDS = ("none", "bool", "int", "float", "str", "date", "datetime", "json")
+_KIND_CODE = {kind: code for code, kind in enumerate(KINDS)}
+_INT64 = (-(1 << 63), (1 << 63) - 1)
+# niz fiksne sirine po vrsti kolone (None: kolona nema podatke)
+_ARRAY_TYPE = {"none": None, "bool": "B", "int": "q", "float": "d", "str": "I",
+               "date": "i", "datetime": "I", "json": "I"}
+
+
+def _kind(value: Any) -> str:
+    if value is None:
+        return "none"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if _INT64[0] <= value <= _INT64[1] else "json"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    return "json"
+
+
+class _Writer:
+    """Skuplja sekcije i tabelu stringova pre upisa."""
+
+    def __init__(self):
+        self.strings: Dict[str, int] = {}
+        self.sections: List[bytes] = []
+
+    def string(self, value: str) -> int:
+        ref = self.strings.get(value)
+        if ref is None:
+            ref = self.strings[value] = len(self.strings)
+        return ref
+
+    def section(self, data: array) -> int:
+        if sys.byteorder != "little":
+            data = array(data.typecode, data)
+            data.byteswap()
+        self.sections.append(data.tobytes())
+        return len(self.sections) - 1
+
+    def column(self, values: List[Any]) -> Dict[str, Any]:
+        """Opis kolone (vrsta i sekcije) za vrednosti istog reda."""
+        kinds = set(map(_kind, values))
+        if len(kinds) > 1:
+            codes = array("B", (_KIND_CODE[_kind(v)] for v in values))
+            parts = {kind: self.column([v for v in values if _kind(v) == kind]) for kind in sorted(kinds)}
+            return {"kind": "mixed", "tags": self.section(codes), "parts": parts}
+        kind = kinds.pop() if kinds else "none"
+        if kind == "none":
+            return {"kind": kind, "count": len(values)}
+        if kind in ("str", "datetime", "json"):
+            if kind == "datetime":
+                values = [v.isoformat() for v in values]
+            elif kind == "json":
+                values = [json.dumps(v, ensure_ascii=False) for v in values]
+            data = array("I", map(self.string, values))
+        elif kind == "date":
+            data = array("i", (v.toordinal() for v in values))
+        else:
+            data = array(_ARRAY_TYPE[kind], values)
+        return {"kind": kind, "data": self.section(data)}
+
+    def groups(self, datas: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """data recnici grupisani po nizu kljuceva; kolone su po grupi."""
+        members: Dict[Tuple[str, ...], List[int]] = {}
+        for i, data in enumerate(datas):
+            members.setdefault(tuple(data), []).append(i)
+        groups = []
+        for keys, indices in members.items():
+            groups.append({
+                "keys": list(keys),
+                "members": self.section(array("I", indices)),
+                "columns": [self.column([datas[i][key] for i in indices]) for key in keys],
+            })
+        return groups
+
+
+def write_graph(graph: Graph, path: str, adjacency: bool = False):
+    """
+    Upisuje graf u `path` (preko privremenog fajla, pa zamenom). Sa
+    `adjacency=True` upisuje i CSR u oba smera, pa ga ucitan graf ne racuna.
+    ValueError/TypeError ako graf sadrzi ivicu bez cvora ili vrednost
+    koja ne moze da se zapise.
+    """
+    writer = _Writer()
+    nodes, edges = graph.nodes, graph.edges
+    sources, targets = array("i"), array("i")
+    for edge in edges:
+        s, t = graph.index_of(edge.source), graph.index_of(edge.target)
+        if s is None or t is None:
+            raise ValueError(f"Ivica ({edge.source}, {edge.target}) nema cvor u grafu")
+        sources.append(s)
+        targets.append(t)
+
+    meta = {
+        "name": graph.name,
+        "directed": graph.directed,
+        "schema": graph.schema,
+        "nodes": len(nodes),
+        "edges": len(edges),
+        "node_id": writer.column([n.id for n in nodes]),
+        "node_label": writer.column([n.label for n in nodes]),
+        "node_data": writer.groups([n.data for n in nodes]),
+        "edge_source": writer.section(sources),
+        "edge_target": writer.section(targets),
+        "edge_weight": writer.column([e.weight for e in edges]),
+        "edge_data": writer.groups([e.data for e in edges]),
+    }
+    if adjacency:
+        meta["adjacency"] = {
+            direction: [writer.section(array("i", part)) for part in graph.csr(direction)]
+            for direction in ("out", "in")
+        }
+
+    strings = list(writer.strings)
+    starts = array("Q", [0])
+    for s in strings:
+        starts.append(starts[-1] + len(s))
+    meta["strings"] = [writer.section(array("B", "".join(strings).encode("utf-8", "surrogatepass"))),
+                       writer.section(starts)]
+
+    # pozicije sekcija su od pocetka podataka (prvi poravnat bajt posle meta podataka)
+    meta["sections"] = sections = []
+    position = 0
+    for data in writer.sections:
+        sections.append([position, len(data)])
+        position = _aligned(position + len(data))
+    encoded = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+    base = _aligned(_HEADER.size + len(encoded))
+
+    temporary = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, VERSION, len(encoded)))
+            f.write(encoded)
+            for (offset, _), data in zip(sections, writer.sections):
+                f.write(b"\0" * (base + offset - f.tell()))
+                f.write(data)
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def _aligned(position: int) -> int:
+    return -(-position // _ALIGN) * _ALIGN
+
+
+class _Reader:
+    """Citanje sekcija direktno iz mapiranog fajla."""
+
+    def __init__(self, source: InputFile):
+        if source.size < _HEADER.size:
+            raise ValueError("Fajl nije binarni graf")
+        magic, version, meta_size = _HEADER.unpack(source.view[:_HEADER.size])
+        if magic != MAGIC:
+            raise ValueError("Fajl nije binarni graf")
+        if version != VERSION:
+            raise ValueError(f"Nepodrzana verzija binarnog grafa: {version}")
+        self.meta = json.loads(source.text(_HEADER.size, _HEADER.size + meta_size))
+        self.sections = self.meta["sections"]
+        self.view = source.view[_aligned(_HEADER.size + meta_size):]
+        if self.sections and sum(self.sections[-1]) > len(self.view):
+            raise ValueError("Binarni graf je odsecen")
+        data, starts = self.meta["strings"]
+        text = str(self.bytes(data), "utf-8", "surrogatepass")
+        starts = self.array(starts, "Q")
+        self.strings = [text[a:b] for a, b in zip(starts, starts[1:])]
+
+    def bytes(self, section: int) -> memoryview:
+        offset, size = self.sections[section]
+        return self.view[offset:offset + size]
+
+    def array(self, section: int, typecode: str) -> List[Any]:
+        if sys.byteorder == "little":
+            return self.bytes(section).cast(typecode).tolist()
+        return self.typed_array(section, typecode).tolist()
+
+    def typed_array(self, section: int, typecode: str) -> array:
+        """Sekcija kopirana u array (jedan memcpy iz mape)."""
+        data = array(typecode)
+        data.frombytes(self.bytes(section))
+        if sys.byteorder != "little":
+            data.byteswap()
+        return data
+
+    def column(self, column: Dict[str, Any]) -> List[Any]:
+        kind = column["kind"]
+        if kind == "mixed":
+            parts = {_KIND_CODE[k]: iter(self.column(part)) for k, part in column["parts"].items()}
+            return [next(parts[code]) for code in self.array(column["tags"], "B")]
+        if kind == "none":
+            return [None] * column["count"]
+        values = self.array(column["data"], _ARRAY_TYPE[kind])
+        if kind == "bool":
+            return [v != 0 for v in values]
+        if kind == "date":
+            return list(map(date.fromordinal, values))
+        if kind in ("str", "datetime", "json"):
+            strings = self.strings
+            if kind == "str":
+                return [strings[ref] for ref in values]
+            # isti string (npr. isti datum) se dekodira jednom
+            decode = datetime.fromisoformat if kind == "datetime" else json.loads
+            decoded: Dict[int, Any] = {}
+            for ref in set(values):
+                decoded[ref] = decode(strings[ref])
+            return [decoded[ref] for ref in values]
+        return values
+
+    def datas(self, groups: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+        datas: List[Optional[Dict[str, Any]]] = [None] * count
+        for group in groups:
+            members = self.array(group["members"], "I")
+            keys = group["keys"]
+            if not keys:
+                for i in members:
+                    datas[i] = {}
+                continue
+            rows = zip(*(self.column(c) for c in group["columns"]))
+            for i, row in zip(members, rows):
+                datas[i] = dict(zip(keys, row))
+        return datas
+
+
+def read_graph(path: str) -> Graph:
+    """Graf iz fajla koji je upisao write_graph. ValueError ako fajl nije takav."""
+    with InputFile(path) as source:
+        reader = _Reader(source)
+        meta = reader.meta
+        ids = reader.column(meta["node_id"])
+        labels = reader.column(meta["node_label"])
+        datas = reader.datas(meta["node_data"], meta["nodes"])
+        nodes = [Node(id=i, label=l, data=d, parsed=True) for i, l, d in zip(ids, labels, datas)]
+
+        sources = reader.array(meta["edge_source"], "i")
+        targets = reader.array(meta["edge_target"], "i")
+        weights = reader.column(meta["edge_weight"])
+        datas = reader.datas(meta["edge_data"], meta["edges"])
+        edges = [Edge(source=ids[s], target=ids[t], weight=w, data=d, parsed=True)
+                 for s, t, w, d in zip(sources, targets, weights, datas)]
+        adjacency = {
+            direction: tuple(reader.typed_array(part, "i") for part in parts)
+            for direction, parts in meta.get("adjacency", {}).items()
+        }
+        del reader
+
+    graph = Graph(name=meta["name"], directed=meta["directed"], nodes=nodes, edges=edges)
+    graph.schema = meta["schema"]
+    for direction, csr in adjacency.items():
+        graph.preload_csr(direction, csr)
+    return graph
@@ -0,0 +1,115 @@
+"""
+Slaganje grafa od delova (`GraphBatch`) koje daje `DataSourcePlugin.parse_iter`.
+
+Delovi se dodaju redom kojim stizu, pa plugin ne drzi ceo graf niti zna sta
+je vec ucitano: ponovljeni cvorovi i ivice se ovde preskacu, indeksi grafa
+rastu usput, a usmerenost se prati brojanjem ivica kojima jos nije vidjena
+suprotna ivica.
+"""
+import logging
+from array import array
+from typing import Iterable, List, Optional
+
+from .data_source import GraphBatch
+from .graph import Edge, Graph
+
+logger = logging.getLogger(__name__)
+
+
+class GraphBuilder:
+
+    def __init__(self, graph: Optional[Graph] = None):
+        self.graph = graph
+        self.directed: Optional[bool] = None      # None: odredjuje se iz ivica
+        self.keep_reverse_edges = False
+        self.unmatched = 0                        # ivice (bez petlji) kojima jos nije vidjena suprotna ivica
+        self.reverse_edges = array("i")           # pozicije drugih ivica u paru (brisu se ako je graf neusmeren)
+        self.dangling: List[Edge] = []            # ivice ciji source ili target ne postoji
+
+    def add(self, batch: GraphBatch):
+        if batch.graph is not None:
+            if self.graph is None:
+                # ceo graf odjednom (podrazumevani parse_iter): preuzima se bez kopiranja
+                self.graph = batch.graph
+                self.directed = batch.graph.directed
+                return
+            whole = batch.graph
+            if len(self.graph.nodes) == 0:
+                # zadat prazan graf (npr. ColumnarGraph): preuzimaju se i podesavanja grafa
+                batch = GraphBatch(nodes=whole.nodes, edges=whole.edges, name=whole.name,
+                                   schema=whole.schema or None, directed=whole.directed)
+            else:
+                batch = GraphBatch(nodes=whole.nodes, edges=whole.edges)
+        if self.graph is None:
+            self.graph = Graph()
+        g = self.graph
+        if batch.name is not None:
+            g.name = batch.name
+        if batch.schema is not None:
+            g.schema = batch.schema
+        if batch.directed is not None:
+            self.directed = batch.directed
+        if batch.keep_reverse_edges is not None:
+            self.keep_reverse_edges = batch.keep_reverse_edges
+
+        for node in batch.nodes:
+            if not g.has_node(node.id):
+                g.add_node(node)
+        for node_id, data in batch.updates:
+            g.update_node_data(node_id, data)
+
+        if self.directed is not None:
+            # usmerenost je zadata: ivice se dodaju odjednom, bez pracenja parova
+            self.dangling += g.add_edges(batch.edges)
+            return
+        for edge in batch.edges:
+            source, target = edge.source, edge.target
+            if not (g.has_node(source) and g.has_node(target)):
+                self.dangling.append(edge)
+                continue
+            if g.has_edge(source, target):
+                continue
+            g.add_edge(edge)
+
+            if source == target:
+                continue
+            if g.has_edge(target, source):
+                self.unmatched -= 1
+                self.reverse_edges.append(len(g.edges) - 1)
+            else:
+                self.unmatched += 1
+
+    def finish(self) -> Graph:
+        if self.graph is None:
+            self.graph = Graph()
+        if self.directed is None:
+            # Neusmeren graf: svaka ivica ima suprotnu; uklanjaju se duplikati B-A za vec postojece A-B
+            self.graph.directed = self.unmatched > 0
+            if not self.graph.directed and not self.keep_reverse_edges:
+                self.graph.delete_edges_at(self.reverse_edges)
+        else:
+            self.graph.directed = self.directed
+        if self.dangling:
+            # kraj koji se pojavio tek posle ivice vise ne nedostaje
+            missing = self.missing_nodes()
+            logger.warning(
+                f"Nije ucitano {len(self.dangling)} ivica: kraj ne postoji medju cvorovima"
+                + (f" (nedostaju npr. {', '.join(map(str, missing))})" if missing else "")
+            )
+        return self.graph
+
+    def missing_nodes(self, limit: int = 5) -> List:
+        """Prvih `limit` nepostojecih krajeva ivica iz `dangling`."""
+        missing = {}
+        for edge in self.dangling:
+            for node_id in (edge.source, edge.target):
+                if not self.graph.has_node(node_id):
+                    missing[node_id] = None
+            if len(missing) >= limit:
+                break
+        return list(missing)[:limit]
+
+    def build(self, batches: Iterable[GraphBatch]) -> Graph:
+        for batch in batches:
+            self.add(batch)
+        return self.finish()
@@ -0,0 +1,124 @@
+"""
+Citanje ulaznih fajlova za data source plugin-ove, bez kopiranja kroz tekstualni I/O.
+
+Obican fajl se mapira u memoriju (mmap): `view` i njegovi isecci (memoryview)
+pokazuju direktno na stranice fajla, a tekst se dekodira jednom, tek iz
+isecka koji je potreban. Cevi (pipe, /dev/stdin) i kompresovani fajlovi
+(gzip, bz2, xz) ne mogu da se mapiraju; oni se procitaju (i raspakuju) u
+memoriju, a ostatak interfejsa je isti.
+
+Isecci vaze samo dok je fajl otvoren (unutar `with`).
+"""
+import bz2
+import gzip
+import lzma
+import mmap
+import os
+import stat
+from typing import Iterator, List, Optional, Tuple
+
+# potpis kompresovanog formata -> citac nad binarnim fajlom
+COMPRESSED = (
+    (b"\x1f\x8b", lambda f: gzip.GzipFile(fileobj=f)),
+    (b"BZh", bz2.BZ2File),
+    (b"\xfd7zXZ\x00", lzma.LZMAFile),
+)
+
+# priblizna velicina bloka koji se dekodira odjednom (blok se zavrsava na kraju reda)
+BLOCK_SIZE = 1 << 20
+
+
+class InputFile:
+    """Bajtovi ulaznog fajla: mmap kad je moguce, inace procitan (i raspakovan) sadrzaj."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        try:
+            info = os.fstat(self._file.fileno())
+            head = self._file.peek(6)[:6]
+            reader = next((r for magic, r in COMPRESSED if head.startswith(magic)), None)
+            if reader is None and stat.S_ISREG(info.st_mode) and info.st_size > 0:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._data = self._map
+            elif reader is not None:
+                with reader(self._file) as compressed:
+                    self._data = compressed.read()
+            else:
+                self._data = self._file.read()
+        except Exception:
+            self._file.close()
+            raise
+        self.view = memoryview(self._data)
+        self.size = len(self._data)
+        # kraj poslednjeg bloka koji je dao `blocks` (za prijavu napretka)
+        self.position = 0
+
+    @property
+    def mapped(self) -> bool:
+        """Da li su bajtovi mapirani iz fajla (a ne procitani u memoriju)."""
+        return self._map is not None
+
+    # --- pretraga i isecci ---
+
+    def find(self, sub: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return self._data.find(sub, start, self.size if end is None else end)
+
+    def line_end(self, position: int) -> int:
+        """Pozicija iza prvog '\\n' od `position` (ili kraj fajla)."""
+        found = self._data.find(b"\n", position)
+        return self.size if found == -1 else found + 1
+
+    def text(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Bajtovi [start, end) dekodirani kao UTF-8, direktno iz isecka."""
+        return str(self.view[start:end], "utf-8")
+
+    def blocks(self, start: int = 0, end: Optional[int] = None, block_size: int = BLOCK_SIZE,
+               whole_lines: bool = True) -> Iterator[str]:
+        """
+        Dekodirani blokovi od ~`block_size` bajtova; svaki se zavrsava na kraju reda.
+        Sa `whole_lines=False` blok je tacno te velicine, skracen do granice UTF-8
+        znaka (za tekst bez novih redova, npr. minifikovan JSON).
+        """
+        end = self.size if end is None else end
+        data = self._data
+        while start < end:
+            if whole_lines:
+                stop = min(self.line_end(min(start + block_size, end) - 1), end)
+            else:
+                stop = min(start + block_size, end)
+                # bajt 10xxxxxx je nastavak visebajtnog znaka
+                while start < stop < end and data[stop] & 0xC0 == 0x80:
+                    stop -= 1
+            self.position = stop
+            yield self.text(start, stop)
+            start = stop
+
+    def line_ranges(self, parts: int, start: int = 0) -> List[Tuple[int, int]]:
+        """Deli [start, kraj) na najvise `parts` opsega bajtova poravnatih na pocetak reda."""
+        size = self.size
+        bounds = [start]
+        for k in range(1, parts):
+            bounds.append(self.line_end(start + (size - start) * k // parts))
+        bounds.append(size)
+        bounds = sorted(set(bounds))
+        return list(zip(bounds, bounds[1:]))
+
+    # --- zatvaranje ---
+
+    def close(self):
+        self.view.release()
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # neki isecak je jos ziv; mapa se zatvara kad on nestane
+                pass
+        self._file.close()
+
+    def __enter__(self) -> "InputFile":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
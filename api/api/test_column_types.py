@@ -0,0 +1,74 @@
+import unittest
+from datetime import datetime
+from api.api.column_types import CONVERTERS, ColumnConverters, coerce_value, infer_type, load_schema, parse_cell
+from api.api.graph import Node, parse_value
+
+
+class TestColumnTypes(unittest.TestCase):
+
+    VALUES = [
+        "42", "-7", "1_000", "007", "3.14", "1e5", "2E-3", ".5", "nan", "-inf", "Infinity",
+        "2020-01-05", "2020-1-5", "2020-W01-1", "2020-01-05T10:30", "20200105", "0000-00-00",
+        "HR", "Novi Sad", "abc1", "1.2.3", "e", "-", "true",
+    ]
+
+    def test_every_converter_matches_parse_cell(self):
+        for kind, convert in CONVERTERS.items():
+            for value in self.VALUES:
+                with self.subTest(kind=kind, value=value):
+                    expected = parse_cell(value)
+                    result = convert(value)
+                    self.assertEqual(type(result), type(expected))
+                    if expected == expected:  # nan
+                        self.assertEqual(result, expected)
+
+    def test_parse_cell_matches_old_two_step_parsing(self):
+        from data_source_csv.data_source_csv.plugin import parse_value as csv_parse_value
+        for value in self.VALUES:
+            with self.subTest(value=value):
+                old = Node(id="x", data={"v": csv_parse_value(value)}).data["v"]
+                new = parse_cell(value)
+                self.assertEqual(type(new), type(old))
+                if old == old:  # nan
+                    self.assertEqual(new, old)
+
+    def test_infer_and_convert_row(self):
+        self.assertEqual(infer_type(["1", "2"]), "int")
+        self.assertEqual(infer_type(["1", "2.5"]), "float")
+        self.assertEqual(infer_type(["2020-01-05"]), "date")
+        self.assertEqual(infer_type(["1", "HR"]), "str")
+
+        rows = [{"age": "30", "score": "1.5", "joined": "2021-03-04", "role": "HR"}]
+        converters = ColumnConverters.infer(rows)
+        self.assertEqual(converters.types, {"age": "int", "score": "float", "joined": "date", "role": "str"})
+        row = {"age": " 41 ", "score": "7", "joined": "", "role": "42", "id": "n1"}
+        self.assertEqual(converters.convert_row(row, skip=("id",)), {"age": 41, "score": 7, "role": 42})
+        self.assertEqual(converters.convert_row({"joined": "2021-03-04"}), {"joined": datetime(2021, 3, 4)})
+
+        # vec tipizirane vrednosti se u Node ne parsiraju ponovo
+        data = {"code": "007"}
+        self.assertIs(Node(id="n", data=data, parsed=True).data, data)
+        self.assertEqual(Node(id="n", data=data).data, {"code": parse_value("007")})
+
+    def test_declared_schema(self):
+        self.assertIsNone(load_schema(None))
+        self.assertEqual(load_schema(' {"zip": "STR"} '), {"zip": "str"})
+        self.assertEqual(load_schema("zip: str, age:int"), {"zip": "str", "age": "int"})
+        for bad in ["zip", "zip:decimal", "[1]"]:
+            with self.subTest(schema=bad):
+                self.assertRaises(ValueError, load_schema, bad)
+
+        converters = ColumnConverters({"zip": "str", "age": "int", "joined": "date"}, declared=True)
+        self.assertEqual(converters.convert_row({"zip": "007", "age": "5", "joined": "2021-03-04", "x": "7"}),
+                         {"zip": "007", "age": 5, "joined": datetime(2021, 3, 4), "x": 7})
+        self.assertRaises(ValueError, converters.convert_row, {"age": "5.0"})
+        self.assertRaises(ValueError, converters.convert_row, {"joined": "20210304"})
+
+        self.assertEqual(coerce_value(7, "str"), "7")
+        self.assertEqual(coerce_value(7, "float"), 7.0)
+        self.assertEqual(coerce_value("2021-03-04", "date"), datetime(2021, 3, 4))
+        self.assertRaises(ValueError, coerce_value, 7.5, "int")
+
+
+if __name__ == '__main__':
+    unittest.main()
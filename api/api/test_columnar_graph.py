@@ -0,0 +1,69 @@
+import unittest
+from datetime import datetime
+from .graph import Graph, Node, Edge
+from .columnar_graph import ColumnarGraph
+
+
+class TestColumnarGraph(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = Graph(name="G", directed=True)
+        self.graph.add_node(Node(id="A", label="Alice", data={"age": 30, "role": "HR", "joined": "2021-03-04"}))
+        self.graph.add_node(Node(id="B", label="Bob", data={"age": 41.5, "score": 7.5}))
+        self.graph.add_node(Node(id="C", label="Cecil", data={"role": "Dev", "active": True}))
+        self.graph.add_edge(Edge(source="A", target="B", weight=2.0, data={"relation": "knows"}))
+        self.graph.add_edge(Edge(source="C", target="A"))
+        self.columnar = ColumnarGraph.from_graph(self.graph)
+
+    def test_same_surface_as_object_graph(self):
+        self.assertEqual(self.columnar.to_dict(), self.graph.to_dict())
+        self.assertEqual(len(self.columnar.nodes), 3)
+        self.assertEqual([e.source for e in self.columnar.edges], ["A", "C"])
+
+    def test_typed_columns(self):
+        kinds = self.columnar.node_columns.kinds()
+        self.assertEqual(kinds["role"], "str")
+        self.assertEqual(kinds["joined"], "datetime64")
+        self.assertEqual(kinds["score"], "float64")
+        # int i float u istoj koloni -> object, tip vrednosti ostaje isti
+        self.assertEqual(kinds["age"], "object")
+        self.assertIs(type(self.columnar.get_node("A").data["age"]), int)
+        self.assertEqual(self.columnar.get_node("A").data["joined"], datetime(2021, 3, 4))
+
+    def test_lookups_and_dedup(self):
+        self.assertTrue(self.columnar.has_edge("A", "B"))
+        self.assertFalse(self.columnar.add_edge(Edge(source="A", target="B")))
+        self.assertFalse(self.columnar.add_node(Node(id="A")))
+        self.assertEqual(self.columnar.successors("C"), {"A"})
+        self.assertEqual(self.columnar.get_edge("A", "B").data, {"relation": "knows"})
+
+        dangling = self.columnar.add_edges([Edge(source="B", target="C"), Edge(source="B", target="X"),
+                                            Edge(source="A", target="B")])
+        self.assertEqual([(e.source, e.target) for e in dangling], [("B", "X")])
+        self.assertEqual([(e.source, e.target) for e in self.columnar.edges], [("A", "B"), ("C", "A"), ("B", "C")])
+
+    def test_update_node_data_stays_columnar(self):
+        self.assertTrue(self.columnar.update_node_data("B", {"role": "QA", "age": "n/a", "level": 3}))
+        self.assertFalse(self.columnar.update_node_data("X", {"role": "QA"}))
+        self.assertEqual(self.columnar.get_node("B").data, {"age": "n/a", "score": 7.5, "role": "QA", "level": 3})
+        self.assertEqual(self.columnar.get_node("A").data["role"], "HR")
+        self.assertNotIn("level", self.columnar.get_node("C").data)
+        self.assertNotIsInstance(self.columnar.nodes, list)
+
+    def test_mutation_materializes(self):
+        self.columnar.edit_node("A", role="QA")
+        self.assertEqual(self.columnar.get_node("A").data["role"], "QA")
+        self.assertIsInstance(self.columnar.nodes, list)
+        self.assertEqual(len(self.columnar.edges), 2)
+
+    def test_copy_is_independent(self):
+        copy = self.columnar.copy()
+        self.assertIsInstance(copy, ColumnarGraph)
+        self.assertEqual(copy.to_dict(), self.graph.to_dict())
+        copy.edit_node("A", role="QA")
+        self.assertEqual(self.columnar.get_node("A").data["role"], "HR")
+        self.assertEqual(self.columnar.copy().to_dict(), self.graph.to_dict())
+
+
+if __name__ == '__main__':
+    unittest.main()
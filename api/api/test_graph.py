@@ -31,7 +31,83 @@ def test_graph_models():
     assert "edges" in g_dict
 
     print("✅ Svi osnovni testovi prošli!")
+
+
+def test_graph_indexes():
+    g = Graph(nodes=[Node(id="A"), Node(id="B")])
+    g.add_node(Node(id="C"))
+    assert not g.add_node(Node(id="A")), "❌ Duplirani cvor je dodat"
+
+    assert g.add_edge(Edge(source="A", target="B"))
+    assert g.add_edge(Edge(source="C", target="B"))
+    assert not g.add_edge(Edge(source="A", target="B")), "❌ Duplirana ivica je dodata"
+    assert not g.add_edge(Edge(source="A", target="X")), "❌ Ivica ka nepostojecem cvoru"
+
+    assert g.get_node("C").id == "C"
+    assert g.has_edge("A", "B") and not g.has_edge("B", "A")
+    assert g.successors("A") == {"B"}
+    assert g.predecessors("B") == {"A", "C"}
+
+    assert not g.delete_node("B"), "❌ Obrisan cvor koji ima ivice"
+    assert g.delete_edge(("A", "B"))
+    assert g.predecessors("B") == {"C"}
+    assert [e.source for e in g.edges] == ["C"]
+
+    g.edges = []
+    assert g.delete_node("B")
+    assert [n.id for n in g.nodes] == ["A", "C"]
+    assert not g.has_node("B")
     
 
+def test_graph_csr():
+    g = Graph(nodes=[Node(id=x) for x in "ABCD"])
+    for s, t in [("A", "B"), ("C", "A"), ("A", "C"), ("B", "C"), ("D", "A")]:
+        g.add_edge(Edge(source=s, target=t))
+
+    assert g.index_of("C") == 2
+    assert g.neighbors("A") == ["B", "C"]
+    assert sorted(g.neighbors("A", "in")) == ["C", "D"]
+
+    offsets, neighbors, edge_ids = g.csr("out")
+    assert list(offsets) == [0, 2, 3, 4, 5]
+    assert len(neighbors) == len(edge_ids) == 5
+
+    sub = g.induced_subgraph([g.index_of("A"), g.index_of("C")], name="sub")
+    assert [n.id for n in sub.nodes] == ["A", "C"]
+    assert [(e.source, e.target) for e in sub.edges] == [("C", "A"), ("A", "C")]
+
+    # izmena ponistava CSR
+    version = g.version
+    g.add_edge(Edge(source="B", target="D"))
+    assert g.version > version
+    assert g.neighbors("B") == ["C", "D"]
+
+
+def test_graph_add_edges():
+    g = Graph(nodes=[Node(id=x) for x in "ABC"])
+    g.add_edge(Edge(source="A", target="B"))
+    version = g.version
+    dangling = g.add_edges(Edge(source=s, target=t) for s, t in
+                           [("B", "C"), ("A", "B"), ("A", "X"), ("C", "A"), ("Y", "Z"), ("B", "C")])
+
+    assert [(e.source, e.target) for e in dangling] == [("A", "X"), ("Y", "Z")]
+    assert [(e.source, e.target) for e in g.edges] == [("A", "B"), ("B", "C"), ("C", "A")]
+    assert g.version == version + 1, "❌ CSR treba ponistiti jednom"
+    assert g.neighbors("C") == ["A"]
+    assert g.add_edges([]) == [] and g.version == version + 1
+
+
+def test_graph_dangling_edges():
+    g = Graph(nodes=[Node(id=x) for x in "ABC"],
+              edges=[Edge(source="A", target="B"), Edge(source="A", target="ghost"), Edge(source="B", target="C")])
+    assert [(e.source, e.target) for e in g.edges] == [("A", "B"), ("B", "C")]
+
+    # ivica ciji je cvor uklonjen dodelom `nodes` ostaje u listi, ali nije u CSR-u
+    g.nodes = [Node(id=x) for x in "AB"]
+    assert g.neighbors("B") == []
+    assert list(g.csr("in")[0]) == [0, 0, 1]
+    assert [(e.source, e.target) for e in g.induced_subgraph([0, 1]).edges] == [("A", "B")]
+
+
 if __name__ == "__main__":
     test_graph_models()
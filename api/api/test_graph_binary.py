@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from datetime import date, datetime
+from api.api.graph import Edge, Graph, Node
+from api.api.graph_binary import read_graph, write_graph
+
+
+class TestGraphBinary(unittest.TestCase):
+
+    def path(self) -> str:
+        with tempfile.NamedTemporaryFile(suffix=".graph", delete=False) as f:
+            pass
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_round_trip_keeps_values_types_and_order(self):
+        values = [1, 2.5, "čvor", None, True, datetime(2020, 1, 2, 3, 4), date(2021, 5, 6),
+                  [1, {"a": 2}], 10 ** 30, "\ud800"]
+        graph = Graph(name="G", directed=False)
+        graph.schema = {"v": "int"}
+        for i, value in enumerate(values):
+            data = {"v": value, "i": i} if i % 2 else {"i": i, "v": value, "w": "x"}
+            graph.add_node(Node(id=i if i % 3 == 0 else f"N{i}", label=f"L{i}", data=data, parsed=True))
+        graph.add_node(Node(id="prazan", label=None, parsed=True))
+        for i in range(len(values)):
+            edge = Edge(source=graph.nodes[i].id, target=graph.nodes[i + 1].id, weight=2 if i % 2 else 1.0,
+                        data={"relation": "r"} if i % 2 else {}, parsed=True)
+            graph.add_edge(edge)
+
+        path = self.path()
+        write_graph(graph, path)
+        loaded = read_graph(path)
+        self.assertEqual(loaded.to_dict(), graph.to_dict())
+        self.assertEqual(loaded.schema, {"v": "int"})
+        self.assertEqual([list(n.data) for n in loaded.nodes[:2]], [["i", "v", "w"], ["v", "i"]])
+        self.assertEqual([type(n.data["v"]) for n in loaded.nodes[:len(values)]], list(map(type, values)))
+        self.assertEqual(loaded.predecessors("N1"), {0})
+
+        empty = self.path()
+        write_graph(Graph(), empty)
+        self.assertEqual(read_graph(empty).to_dict(), Graph().to_dict())
+
+        with open(path, "r+b") as f:
+            f.write(b"NOTGRAPH")
+        self.assertRaises(ValueError, read_graph, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
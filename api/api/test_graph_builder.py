@@ -0,0 +1,59 @@
+import unittest
+from api.api.data_source import GraphBatch
+from api.api.graph import Edge, Graph, Node
+from api.api.graph_builder import GraphBuilder
+from api.api.test_data_source import ConcreteDataSource
+
+
+def edges(*pairs):
+    return [Edge(source=s, target=t) for s, t in pairs]
+
+
+class TestGraphBuilder(unittest.TestCase):
+
+    def test_batches_are_merged_in_order(self):
+        builder = GraphBuilder()
+        builder.add(GraphBatch(name="G", schema={"age": "int"},
+                               nodes=[Node("A", "Alpha", {"age": 1}), Node("B", "Beta")],
+                               edges=edges(("A", "B"), ("A", "X"))))
+        builder.add(GraphBatch(nodes=[Node("A", "Other", {"age": 2}), Node("X", "X")],
+                               updates=[("A", {"role": "HR"})],
+                               edges=edges(("A", "B"), ("B", "X"))))
+        graph = builder.finish()
+
+        self.assertEqual((graph.name, graph.schema), ("G", {"age": "int"}))
+        self.assertEqual([(n.id, n.label, n.data) for n in graph.nodes],
+                         [("A", "Alpha", {"age": 1, "role": "HR"}), ("B", "Beta", {}), ("X", "X", {})])
+        self.assertEqual([(e.source, e.target) for e in graph.edges], [("A", "B"), ("B", "X")])
+        # ivica ciji kraj jos nije postojao se ne dodaje ni kad se cvor kasnije pojavi
+        self.assertEqual([(e.source, e.target) for e in builder.dangling], [("A", "X")])
+        self.assertTrue(graph.directed)
+
+    def test_reciprocal_edges(self):
+        pairs = [("A", "B"), ("B", "C"), ("B", "A"), ("C", "C"), ("C", "B")]
+        nodes = [Node(i, i) for i in "ABC"]
+
+        graph = GraphBuilder().build([GraphBatch(nodes=nodes, edges=edges(*pairs[:2])),
+                                      GraphBatch(edges=edges(*pairs[2:]))])
+        self.assertFalse(graph.directed)
+        self.assertEqual([(e.source, e.target) for e in graph.edges], [("A", "B"), ("B", "C"), ("C", "C")])
+
+        graph = GraphBuilder().build([GraphBatch(nodes=nodes, edges=edges(*pairs), keep_reverse_edges=True)])
+        self.assertFalse(graph.directed)
+        self.assertEqual(len(graph.edges), 5)
+
+        graph = GraphBuilder().build([GraphBatch(nodes=nodes, edges=edges(*pairs), directed=True)])
+        self.assertTrue(graph.directed)
+        self.assertEqual(len(graph.edges), 5)
+
+    def test_default_parse_iter_wraps_parse(self):
+        plugin = ConcreteDataSource()
+        batches = list(plugin.parse_iter({}))
+        self.assertEqual(len(batches), 1)
+        self.assertIsInstance(batches[0].graph, Graph)
+        # ceo graf iz parse se preuzima bez kopiranja
+        self.assertIs(GraphBuilder().build(batches), batches[0].graph)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import bz2
+import gzip
+import os
+import tempfile
+import threading
+import unittest
+from api.api.input_file import InputFile
+
+
+class TestInputFile(unittest.TestCase):
+
+    DATA = "".join(f"red {i},čvor\n" for i in range(200)).encode("utf-8")
+
+    def write(self, data: bytes, suffix: str = ".csv") -> str:
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+            f.write(data)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_mapped_blocks_and_ranges(self):
+        with InputFile(self.write(self.DATA)) as source:
+            self.assertTrue(source.mapped)
+            self.assertEqual(source.size, len(self.DATA))
+            self.assertEqual(bytes(source.view[:5]), b"red 0")
+
+            blocks = list(source.blocks(block_size=100))
+            self.assertGreater(len(blocks), 1)
+            self.assertTrue(all(block.endswith("\n") for block in blocks))
+            self.assertEqual("".join(blocks), self.DATA.decode("utf-8"))
+            # bez poravnanja na redove blok ne sme da preseca visebajtni znak (č)
+            for size in [5, 6, 7]:
+                self.assertEqual("".join(source.blocks(block_size=size, whole_lines=False)), self.DATA.decode("utf-8"))
+
+            start = source.line_end(0)
+            ranges = source.line_ranges(7, start)
+            self.assertEqual(ranges[0][0], start)
+            self.assertEqual(b"".join(self.DATA[s:e] for s, e in ranges), self.DATA[start:])
+            self.assertTrue(all(self.DATA[s - 1:s] == b"\n" for s, _ in ranges))
+
+    def test_compressed_pipe_and_empty_inputs_are_read(self):
+        for name, data in [("gzip", gzip.compress(self.DATA)), ("bz2", bz2.compress(self.DATA))]:
+            with self.subTest(format=name), InputFile(self.write(data)) as source:
+                self.assertFalse(source.mapped)
+                self.assertEqual(source.text(), self.DATA.decode("utf-8"))
+
+        read_fd, write_fd = os.pipe()
+        writer = threading.Thread(target=lambda: (os.write(write_fd, self.DATA), os.close(write_fd)))
+        writer.start()
+        with InputFile(f"/dev/fd/{read_fd}") as source:
+            self.assertFalse(source.mapped)
+            self.assertEqual(source.find(b"red 199"), self.DATA.find(b"red 199"))
+        writer.join()
+        os.close(read_fd)
+
+        with InputFile(self.write(b"")) as source:
+            self.assertEqual((source.size, list(source.blocks())), (0, []))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Benchmark binarnog formata grafa: ucitavanje istog grafa sa 1 M ivica iz
+CSV-a (CSVDataSource) i iz binarnog fajla (BinaryDataSource), bez i sa
+upisanim CSR-om. Meri se i prvi poziv csr() u oba smera (susedstvo za obilaske),
+koji se za CSV i fajl bez CSR-a racuna, a za fajl sa CSR-om samo cita.
+
+Svako merenje radi u posebnom procesu (GC i kes stranica ne mesaju se medju nacinima).
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_binary_format            # 1 M ivica
+    python -m benchmarks.bench_binary_format 3000000
+"""
+import csv
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+from api.api.graph_binary import write_graph
+from data_source_binary.data_source_binary.export import export
+from data_source_binary.data_source_binary.plugin import BinaryDataSource
+from data_source_csv.data_source_csv.plugin import CSVDataSource
+
+ROLES = ["HR", "Dev", "QA", "Ops", "Sales"]
+
+
+def generate(path: str, edges: int, seed: int = 3):
+    """Kolone kao u bench_csv_ingest: red je ivica, ~5 ivica po cvoru."""
+    rnd = random.Random(seed)
+    nodes = max(1000, edges // 5)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "label", "target", "weight", "age", "role", "score"])
+        for i in range(edges):
+            source = i % nodes
+            writer.writerow([f"n{source}", f"Node {source}", f"n{rnd.randrange(nodes)}",
+                             rnd.randrange(1, 10), rnd.randrange(18, 70), rnd.choice(ROLES),
+                             round(rnd.random() * 100, 2)])
+
+
+def measure(mode: str, path: str):
+    """Pokrece se u posebnom procesu; ispisuje vreme ucitavanja, vreme CSR-a i velicinu grafa."""
+    plugin = CSVDataSource() if mode == "csv" else BinaryDataSource()
+    start = time.perf_counter()
+    graph = plugin.parse({"path": path})
+    loaded = time.perf_counter()
+    graph.csr("out")
+    graph.csr("in")
+    print(f"{loaded - start:.2f} {time.perf_counter() - loaded:.2f} {len(graph.nodes)} {len(graph.edges)}")
+
+
+def main(edges: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "graph.csv")
+        generate(source, edges)
+        start = time.perf_counter()
+        graph = export(source, os.path.join(tmp, "csr.graph"))
+        exported = time.perf_counter() - start
+        write_graph(graph, os.path.join(tmp, "plain.graph"))
+        del graph
+        print(f"izvoz CSV -> binarni (sa CSR-om): {exported:.1f} s\n")
+
+        print(f"{'izvor':>22} {'MB':>6} {'ucitavanje':>11} {'csr()':>7} {'ukupno':>8} {'cvorova':>9} {'ivica':>9}")
+        for name, mode, path in [("CSV", "csv", source),
+                                 ("binarni", "binary", os.path.join(tmp, "plain.graph")),
+                                 ("binarni sa CSR-om", "binary", os.path.join(tmp, "csr.graph"))]:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_binary_format", "--measure", mode, path],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+            load, adjacency, nodes, edge_count = out
+            total = float(load) + float(adjacency)
+            print(f"{name:>22} {os.path.getsize(path) / 1024 / 1024:>6.0f} {load:>10}s {adjacency:>6}s "
+                  f"{total:>7.2f}s {nodes:>9} {edge_count:>9}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
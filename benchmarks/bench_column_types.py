@@ -0,0 +1,61 @@
+"""
+Benchmark tipiziranja CSV celija (celija/s): stari nacin (parse_value CSV
+plugin-a po celiji pa ponovo parse_value u Node) naspram konvertora po
+koloni (api.api.column_types) i Node(parsed=True).
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_column_types
+    python -m benchmarks.bench_column_types 500000
+"""
+import random
+import sys
+import time
+
+from api.api.column_types import ColumnConverters
+from api.api.graph import Node
+from data_source_csv.data_source_csv.plugin import SPECIAL_COLUMNS, parse_value as csv_parse_value
+
+ROLES = ["HR", "Dev", "QA", "Ops", "Sales"]
+
+
+def make_rows(count: int, seed: int = 9):
+    rnd = random.Random(seed)
+    return [{
+        "id": f"n{i}",
+        "age": str(rnd.randrange(18, 70)),
+        "score": f"{rnd.random() * 100:.2f}",
+        "role": rnd.choice(ROLES),
+        "city": rnd.choice(["Novi Sad", "Beograd", "Nis"]),
+        "joined": f"20{rnd.randrange(10, 24)}-0{rnd.randrange(1, 10)}-1{rnd.randrange(10)}",
+    } for i in range(count)]
+
+
+def old_way(rows):
+    for row in rows:
+        data = {k: csv_parse_value(v) for k, v in row.items() if k not in SPECIAL_COLUMNS and v.strip() != ""}
+        Node(id=row["id"], data=data)
+
+
+def new_way(rows):
+    converters = ColumnConverters.infer(rows)
+    for row in rows:
+        Node(id=row["id"], data=converters.convert_row(row, SPECIAL_COLUMNS), parsed=True)
+
+
+def main(count: int):
+    rows = make_rows(count)
+    cells = count * (len(rows[0]) - 1)
+    print(f"{count} redova, {cells} celija (int, float, 2x str, datum)\n")
+    results = {}
+    for name, fn in [("po celiji (staro)", old_way), ("po koloni (novo)", new_way)]:
+        start = time.perf_counter()
+        fn(rows)
+        elapsed = time.perf_counter() - start
+        results[name] = elapsed
+        print(f"{name:>18}: {elapsed:6.2f} s  {cells / elapsed / 1e6:5.2f} M celija/s")
+    old, new = results.values()
+    print(f"\nubrzanje: {old / new:.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
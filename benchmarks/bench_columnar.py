@@ -0,0 +1,64 @@
+"""
+Poredjenje memorije: objektni Graph naspram ColumnarGraph.
+
+Svaki cvor ima atribute age (int), score (float), role (str iz malog skupa)
+i joined (datetime), a graf ima isto toliko ivica koliko i cvorova.
+Meri se memorija koju graf zadrzi posle ucitavanja (tracemalloc).
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_columnar
+    python -m benchmarks.bench_columnar 100000 1000000
+"""
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+from api.api.graph import Graph, Node, Edge
+from api.api.columnar_graph import ColumnarGraph
+
+ROLES = ["HR", "Dev", "QA", "Ops", "Sales"]
+
+
+def _nodes(count: int, seed: int = 1):
+    rnd = random.Random(seed)
+    start = datetime(2020, 1, 1)
+    for i in range(count):
+        yield Node(id=str(i), label=f"Node {i}", data={
+            "age": rnd.randrange(18, 70),
+            "score": rnd.random() * 100,
+            "role": rnd.choice(ROLES),
+            "joined": start + timedelta(days=rnd.randrange(1000)),
+        })
+
+
+def _edges(count: int, seed: int = 2):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield Edge(source=str(rnd.randrange(count)), target=str(rnd.randrange(count)))
+
+
+def measure(graph_cls, count: int) -> int:
+    tracemalloc.start()
+    graph = graph_cls(name="bench")
+    for node in _nodes(count):
+        graph.add_node(node)
+    for edge in _edges(count):
+        graph.add_edge(edge)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del graph
+    return used
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or [100_000, 1_000_000]
+    print(f"{'nodes':>10} {'Graph MB':>10} {'Columnar MB':>12} {'ratio':>7}")
+    for size in sizes:
+        objects = measure(Graph, size)
+        columnar = measure(ColumnarGraph, size)
+        print(f"{size:>10} {objects / 2**20:>10.1f} {columnar / 2**20:>12.1f} {objects / columnar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
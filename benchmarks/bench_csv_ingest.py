@@ -0,0 +1,120 @@
+"""
+Benchmark ucitavanja CSV-a: vrsni RSS procesa (ru_maxrss) pri citanju velikog
+fajla preko CSVDataSource (citanje deo po deo) naspram starog nacina koji
+prvo zadrzi sve redove i celu listu ivica.
+
+Fajl se generise u privremenom direktorijumu do zadate velicine (MB), a svako
+merenje radi u posebnom procesu da se vrsni RSS ne bi mesao.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_csv_ingest            # 100 MB
+    python -m benchmarks.bench_csv_ingest 2048       # 2 GB
+"""
+import csv
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from api.api.graph import Graph, Node, Edge
+from data_source_csv.data_source_csv.plugin import CSVDataSource, parse_value
+
+ROLES = ["HR", "Dev", "QA", "Ops", "Sales"]
+
+
+def generate(path: str, megabytes: int, seed: int = 3):
+    """Usmeren graf: ~5 ivica po cvoru, cvorovi imaju age/role/score."""
+    rnd = random.Random(seed)
+    limit = megabytes * 1024 * 1024
+    nodes = max(1000, limit // 200)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "label", "target", "weight", "age", "role", "score"])
+        i = 0
+        while f.tell() < limit:
+            source = i % nodes
+            writer.writerow([f"n{source}", f"Node {source}", f"n{rnd.randrange(nodes)}",
+                             rnd.randrange(1, 10), rnd.randrange(18, 70), rnd.choice(ROLES),
+                             round(rnd.random() * 100, 2)])
+            i += 1
+
+
+def parse_materialized(path: str) -> Graph:
+    """Stari CSVDataSource.parse: svi cvorovi i sve ivice u memoriji pre pravljenja grafa."""
+    nodes, edges_raw = {}, []
+    with open(path, encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            node_id = row["id"]
+            label = row.get("label", node_id)
+            node_data = {k: parse_value(v) for k, v in row.items()
+                         if k not in ["id", "label", "target", "weight"] and v.strip() != ""}
+            if node_id not in nodes:
+                nodes[node_id] = Node(id=node_id, label=label, data={"id": node_id, "label": label, **node_data})
+            else:
+                nodes[node_id].data.update(node_data)
+            target = row.get("target")
+            if target and target.strip():
+                if target not in nodes:
+                    nodes[target] = Node(id=target, label=target, data={"id": target, "label": target})
+                edges_raw.append((node_id, target, float(row.get("weight", 1) or 1)))
+
+    edge_pairs = {(s, t) for (s, t, w) in edges_raw}
+    is_undirected = all((v, u) in edge_pairs for (u, v) in edge_pairs)
+    edges = []
+    if is_undirected:
+        unique_pairs = set()
+        for (s, t, w) in edges_raw:
+            key = tuple(sorted([s, t]))
+            if key not in unique_pairs:
+                unique_pairs.add(key)
+                edges.append(Edge(source=s, target=t, weight=w))
+    else:
+        edges = [Edge(source=s, target=t, weight=w) for (s, t, w) in edges_raw]
+
+    g = Graph(name="CSV Graph", directed=not is_undirected)
+    for node in nodes.values():
+        g.add_node(node)
+    for edge in edges:
+        g.add_edge(edge)
+    return g
+
+
+def measure(mode: str, path: str):
+    """Pokrece se u posebnom procesu; ispisuje vreme, vrsni RSS i velicinu grafa."""
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "streaming":
+        graph = CSVDataSource().parse({"path": path})
+    else:
+        graph = parse_materialized(path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed:.1f} {before} {peak} {len(graph.nodes)} {len(graph.edges)}")
+
+
+def main(megabytes: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.csv")
+        generate(path, megabytes)
+        size = os.path.getsize(path) / 1024 / 1024
+        print(f"CSV: {size:.0f} MB\n")
+        print(f"{'nacin':>12} {'sekundi':>8} {'vrsni RSS':>10} {'prirast RSS':>12} {'cvorova':>9} {'ivica':>10}")
+        for mode in ["streaming", "materialized"]:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_csv_ingest", "--measure", mode, path],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+            elapsed, before, peak, nodes, edges = out
+            # ru_maxrss je u KB na Linuxu
+            print(f"{mode:>12} {elapsed:>8} {int(peak) / 1024:>8.0f}MB "
+                  f"{(int(peak) - int(before)) / 1024:>10.0f}MB {nodes:>9} {edges:>10}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 100)
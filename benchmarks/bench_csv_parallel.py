@@ -0,0 +1,48 @@
+"""
+Benchmark paralelnog parsiranja CSV-a (`workers` parametar CSVDataSource-a):
+vreme ucitavanja za 1/2/4/8 procesa nad istim fajlom.
+
+Spajanje delimicnih rezultata u graf radi glavni proces, pa je ono gornja
+granica ubrzanja; radnici paralelizuju citanje redova i konverziju vrednosti.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_csv_parallel          # 50 MB
+    python -m benchmarks.bench_csv_parallel 500
+"""
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_csv_ingest import generate
+from data_source_csv.data_source_csv.plugin import CSVDataSource, split_byte_ranges, _parse_byte_range
+
+WORKERS = [1, 2, 4, 8]
+
+
+def main(megabytes: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.csv")
+        generate(path, megabytes)
+        print(f"CSV: {os.path.getsize(path) / 1024 / 1024:.0f} MB, {os.cpu_count()} jezgara\n")
+
+        # koliko od ukupnog vremena je parsiranje redova (paralelizuje se), a koliko spajanje
+        fieldnames, ranges = split_byte_ranges(path, 1)
+        start = time.perf_counter()
+        _parse_byte_range(path, ranges[0][0], ranges[0][1], fieldnames)
+        parse_only = time.perf_counter() - start
+
+        print(f"{'radnika':>8} {'sekundi':>8} {'ubrzanje':>9}")
+        baseline = None
+        for workers in WORKERS:
+            start = time.perf_counter()
+            graph = CSVDataSource().parse({"path": path, "workers": workers})
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>8.1f} {baseline / elapsed:>8.2f}x")
+            del graph
+        print(f"\nparsiranje redova u jednom procesu (bez spajanja): {parse_only:.1f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,55 @@
+"""
+Benchmark za osnovne operacije nad Graph modelom.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_graph
+    python -m benchmarks.bench_graph 10000 100000 1000000
+"""
+import gc
+import random
+import sys
+import time
+
+from api.api.graph import Graph, Node, Edge
+
+
+def _random_edges(num_nodes: int, num_edges: int, seed: int = 42):
+    rnd = random.Random(seed)
+    return [(str(rnd.randrange(num_nodes)), str(rnd.randrange(num_nodes))) for _ in range(num_edges)]
+
+
+def bench_ingestion(num_edges: int, collect: bool = True) -> float:
+    """
+    Vreme (s) za dodavanje num_edges ivica nad num_edges / 5 cvorova.
+    collect=False meri bez ciklicnog GC-a, koji pregleda sve zive objekte grafa.
+    """
+    num_nodes = max(num_edges // 5, 1)
+    pairs = _random_edges(num_nodes, num_edges)
+
+    if not collect:
+        gc.disable()
+    try:
+        start = time.perf_counter()
+        graph = Graph(name="bench")
+        for i in range(num_nodes):
+            graph.add_node(Node(id=str(i), label=str(i)))
+        for source, target in pairs:
+            graph.add_edge(Edge(source=source, target=target))
+        return time.perf_counter() - start
+    finally:
+        gc.enable()
+
+
+def main(argv):
+    sizes = [int(a) for a in argv] or [10_000, 100_000, 1_000_000]
+    print(f"{'edges':>10} {'seconds':>10} {'us/edge':>10} {'no gc':>10}")
+    for size in sizes:
+        elapsed = bench_ingestion(size)
+        gc.collect()
+        without_gc = bench_ingestion(size, collect=False)
+        gc.collect()
+        print(f"{size:>10} {elapsed:>10.3f} {elapsed / size * 1e6:>10.2f} {without_gc / size * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,63 @@
+"""
+Benchmark indukcije ivica (graph_platform.platform.induction) za selektivnosti
+od 0.001% do 100% cvorova.
+
+Za svaku selektivnost meri oba nacina ("adjacency" preko CSR-a, "scan" kroz
+sve ivice) i nacin koji bira `choose_strategy` kada CSR vec postoji. Kolona
+"bez CSR" je izbor za prvi upit nad grafom bez CSR-a (pravljenje se racuna
+u cenu obilaska susedstva). CSR se pravi jednom pre merenja.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_induction
+    python -m benchmarks.bench_induction 1000000
+"""
+import random
+import sys
+import time
+
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform.induction import choose_strategy, estimate_costs, induce_edges
+
+SELECTIVITIES = [0.00001, 0.0001, 0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0]
+
+
+def build_graph(count: int, edges_per_node: int = 2, seed: int = 11) -> Graph:
+    rnd = random.Random(seed)
+    graph = Graph(name="bench")
+    for i in range(count):
+        graph.add_node(Node(id=str(i)))
+    for _ in range(count * edges_per_node):
+        graph.add_edge(Edge(source=str(rnd.randrange(count)), target=str(rnd.randrange(count))))
+    return graph
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main(count: int):
+    rnd = random.Random(5)
+    graph = build_graph(count)
+    print(f"{count} cvorova, {len(graph.edges)} ivica")
+    samples = [sorted(rnd.sample(range(count), max(1, int(count * s)))) for s in SELECTIVITIES]
+    cold = []
+    for selected in samples:
+        costs = estimate_costs(graph, selected)
+        cold.append("adjacency" if costs["adjacency"] + costs["csr_build"] < costs["scan"] else "scan")
+    build, _ = timed(lambda: graph.csr("out"))
+    print(f"CSR build: {build:.3f} s\n")
+
+    print(f"{'selektivnost':>12} {'cvorova':>9} {'ivica':>9} {'adjacency':>10} {'scan':>10} {'izbor':>10} {'bez CSR':>10}")
+    for selectivity, selected, cold_strategy in zip(SELECTIVITIES, samples, cold):
+        adjacency, expected = timed(lambda: induce_edges(graph, selected, "adjacency"))
+        scan, result = timed(lambda: induce_edges(graph, selected, "scan"))
+        assert result == expected
+        strategy = choose_strategy(graph, selected)
+        print(f"{selectivity * 100:>11.3f}% {len(selected):>9} {len(expected):>9} "
+              f"{adjacency * 1000:>8.2f}ms {scan * 1000:>8.2f}ms {strategy:>10} {cold_strategy:>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
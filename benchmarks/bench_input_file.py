@@ -0,0 +1,86 @@
+"""
+Benchmark citanja velikog CSV-a: tekstualni I/O (`open` + csv.DictReader, kao
+ranije u CSVDataSource) naspram `InputFile` (mmap, dekodiranje po blokovima
+direktno iz mapiranog fajla, str.split za fajlove bez navodnika).
+
+Meri se samo citanje redova (bez pravljenja grafa, koji za fajl od vise GB
+ne staje u memoriju), i citanje opsega bajtova kakve dobijaju radnici.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_input_file            # 2 GB
+    python -m benchmarks.bench_input_file 4096
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from api.api.input_file import InputFile
+from benchmarks.bench_csv_ingest import generate
+from data_source_csv.data_source_csv.plugin import read_rows
+
+RANGES = 8
+
+
+def rows_text_io(path: str) -> int:
+    count = 0
+    with open(path, encoding="utf-8") as f:
+        for _ in csv.DictReader(f):
+            count += 1
+    return count
+
+
+def rows_input_file(path: str) -> int:
+    count = 0
+    with InputFile(path) as source:
+        for _ in read_rows(source):
+            count += 1
+    return count
+
+
+def ranges_text_io(path: str, ranges) -> int:
+    chars = 0
+    with open(path, "rb") as f:
+        for start, end in ranges:
+            f.seek(start)
+            chars += len(f.read(end - start).decode("utf-8"))
+    return chars
+
+
+def ranges_input_file(path: str, ranges) -> int:
+    chars = 0
+    with InputFile(path) as source:
+        for start, end in ranges:
+            chars += len(source.text(start, end))
+    return chars
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main(megabytes: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.csv")
+        generate(path, megabytes)
+        size = os.path.getsize(path)
+        print(f"CSV: {size / 1024 / 1024:.0f} MB\n")
+        with InputFile(path) as source:
+            ranges = source.line_ranges(RANGES, source.line_end(0))
+
+        print(f"{'merenje':>28} {'sekundi':>8} {'MB/s':>7}")
+        for name, function, args in [
+            ("redovi: open + DictReader", rows_text_io, (path,)),
+            ("redovi: InputFile", rows_input_file, (path,)),
+            (f"{RANGES} opsega: read + decode", ranges_text_io, (path, ranges)),
+            (f"{RANGES} opsega: InputFile.text", ranges_input_file, (path, ranges)),
+        ]:
+            elapsed, _ = timed(function, *args)
+            print(f"{name:>28} {elapsed:>8.1f} {size / 1024 / 1024 / elapsed:>7.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2048)
@@ -0,0 +1,87 @@
+"""
+Benchmark ucitavanja veza flat JSON formata: JSONDataSource (krajevi veze
+preko indeksa id -> cvor, Graph.add_edges) naspram starog ucitavanja koje je
+za svaku vezu prolazilo kroz sve cvorove (`any(n.id == ...)`).
+
+Graf ima 5 puta manje cvorova nego veza (prosecan stepen 10), a 1% veza
+upucuje na nepostojeci cvor. Stari nacin je kvadratan, pa se meri samo do
+OLD_MAX veza.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_json_links
+    python -m benchmarks.bench_json_links 10000 100000
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+from api.api.graph import Edge, Graph, Node
+from data_source_json.data_source_json.plugin import JSONDataSource
+
+SIZES = [10_000, 100_000, 1_000_000]
+OLD_MAX = 10_000
+
+
+def generate(path: str, links: int, seed: int = 7):
+    rnd = random.Random(seed)
+    nodes = max(1, links // 5)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"nodes": [')
+        f.write(",".join(json.dumps({"id": f"N{i}", "label": f"L{i}", "age": rnd.randrange(18, 70)})
+                         for i in range(nodes)))
+        f.write('], "links": [')
+        f.write(",".join(
+            json.dumps({"source": f"N{rnd.randrange(nodes)}",
+                        "target": f"N{rnd.randrange(nodes)}" if rnd.random() > 0.01 else "missing"})
+            for _ in range(links)
+        ))
+        f.write("]}")
+
+
+def parse_linear(path: str) -> Graph:
+    """Stari _parse_flat_format: linearna provera krajeva za svaku vezu."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    graph = Graph()
+    for node_data in data["nodes"]:
+        node_id = str(node_data.get("id"))
+        node = Node(id=node_id, label=node_data.get("label", node_id))
+        node.data.update({k: v for k, v in node_data.items() if k not in ["id", "label"]})
+        graph.add_node(node)
+    for link_data in data["links"]:
+        source_id, target_id = str(link_data.get("source")), str(link_data.get("target"))
+        if any(n.id == source_id for n in graph.nodes) and any(n.id == target_id for n in graph.nodes):
+            edge_data = {k: v for k, v in link_data.items() if k not in ["source", "target"]}
+            graph.add_edge(Edge(source=source_id, target=target_id, data=edge_data))
+    return graph
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main(sizes):
+    print(f"{'veza':>9} {'cvorova':>8} {'ucitano':>9} {'visecih':>8} {'sekundi':>8} {'stari nacin':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for links in sizes:
+            path = os.path.join(tmp, f"links_{links}.json")
+            generate(path, links)
+            plugin = JSONDataSource()
+            elapsed, graph = timed(plugin.parse, {"path": path})
+            old = "-"
+            if links <= OLD_MAX:
+                old_elapsed, old_graph = timed(parse_linear, path)
+                assert len(old_graph.edges) == len(graph.edges)
+                old = f"{old_elapsed:.2f}"
+            print(f"{links:>9} {len(graph.nodes):>8} {len(graph.edges):>9} "
+                  f"{plugin.dangling_links['count']:>8} {elapsed:>8.2f} {old:>12}")
+            del graph
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or SIZES)
@@ -0,0 +1,96 @@
+"""
+Benchmark ucitavanja velikog JSON-a u flat formatu: vrsni RSS procesa pri
+inkrementalnom citanju (JSONDataSource) naspram json.load celog fajla pa
+pravljenja istog grafa.
+
+Veze povezuju samo prvih 1000 cvorova, pa je graf skoro sav od cvorova
+(ucitavanje veza meri bench_json_links). Svako merenje radi u posebnom
+procesu da se vrsni RSS ne bi mesao.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_json_stream           # 200 MB
+    python -m benchmarks.bench_json_stream 500
+"""
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from api.api.data_source import GraphBatch
+from api.api.graph import Graph
+from api.api.graph_builder import GraphBuilder
+from data_source_json.data_source_json.plugin import JSONDataSource
+
+ROLES = ["HR", "Dev", "QA", "Ops", "Sales"]
+
+
+def generate(path: str, megabytes: int, seed: int = 5):
+    """{"directed": true, "nodes": [...], "links": [...]}, cvor po redu; jedna veza na 100 cvorova."""
+    rnd = random.Random(seed)
+    limit = megabytes * 1024 * 1024
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{\n  "directed": true,\n  "nodes": [\n')
+        count = 0
+        while f.tell() < limit:
+            node = {"id": f"N{count}", "label": f"Node {count}", "age": rnd.randrange(18, 70),
+                    "role": rnd.choice(ROLES), "score": round(rnd.random() * 100, 2)}
+            f.write(("    " if count == 0 else ",\n    ") + json.dumps(node))
+            count += 1
+        f.write('\n  ],\n  "links": [\n')
+        f.write(",\n".join(
+            "    " + json.dumps({"source": f"N{rnd.randrange(1000)}", "target": f"N{rnd.randrange(1000)}"})
+            for _ in range(count // 100)
+        ))
+        f.write("\n  ]\n}\n")
+
+
+def parse_loaded(path: str) -> Graph:
+    """Stari nacin: ceo dokument kroz json.load, pa isti cvorovi i veze."""
+    plugin = JSONDataSource()
+    plugin.schema = {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    batch = GraphBatch(nodes=plugin._flat_nodes(data["nodes"]), edges=plugin._flat_links(data["links"]),
+                       keep_reverse_edges=True)
+    return GraphBuilder().build([batch])
+
+
+def measure(mode: str, path: str):
+    """Pokrece se u posebnom procesu; ispisuje vreme, vrsni RSS i velicinu grafa."""
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == "streaming":
+        graph = JSONDataSource().parse({"path": path})
+    else:
+        graph = parse_loaded(path)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{elapsed:.1f} {before} {peak} {len(graph.nodes)} {len(graph.edges)}")
+
+
+def main(megabytes: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.json")
+        generate(path, megabytes)
+        print(f"JSON: {os.path.getsize(path) / 1024 / 1024:.0f} MB\n")
+        print(f"{'nacin':>12} {'sekundi':>8} {'vrsni RSS':>10} {'prirast RSS':>12} {'cvorova':>9} {'ivica':>7}")
+        for mode in ["streaming", "json.load"]:
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_json_stream", "--measure", mode, path],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+            elapsed, before, peak, nodes, edges = out
+            # ru_maxrss je u KB na Linuxu
+            print(f"{mode:>12} {elapsed:>8} {int(peak) / 1024:>8.0f}MB "
+                  f"{(int(peak) - int(before)) / 1024:>10.0f}MB {nodes:>9} {edges:>7}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], sys.argv[3])
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
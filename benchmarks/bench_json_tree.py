@@ -0,0 +1,129 @@
+"""
+Benchmark rekurzivnog JSON formata (dokument bez nizova "nodes"/"links"):
+JSONDataSource.parse_recursive (eksplicitan stek, kratki generisani id-jevi)
+naspram starog rekurzivnog obilaska (id deteta = ceo id roditelja + kljuc).
+
+Dokumenti:
+  - siroki: lista zapisa, svaki zapis ima ugnjezden objekat i listu (4 cvora po zapisu),
+  - duboki: lanac objekata zadate dubine.
+Stari nacin ne moze dublje od ~450 nivoa (granica rekurzije: dva okvira po
+nivou, a i json.loads je rekurzivan). Svako merenje radi u posebnom procesu.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_json_tree
+    python -m benchmarks.bench_json_tree wide:2500000 deep:100000
+"""
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from api.api.graph import Edge, Graph, Node
+from data_source_json.data_source_json.plugin import JSONDataSource
+
+DOCUMENTS = ["wide:250000", "deep:400", "deep:100000"]
+
+
+def generate(path: str, kind: str, size: int):
+    with open(path, "w", encoding="utf-8") as f:
+        if kind == "wide":
+            f.write('{"name": "Arhiva", "items": [')
+            f.write(",".join(
+                json.dumps({"name": f"Zapis {i}", "value": i, "tags": ["a", "b"], "meta": {"rank": i % 7}})
+                for i in range(size)
+            ))
+            f.write("]}")
+        else:
+            # json.dump je rekurzivan, pa se tekst slaze direktno
+            f.write('{"level": 0, "child": ' * size + '{"level": 0}' + "}" * size)
+
+
+class RecursiveJSONDataSource(JSONDataSource):
+    """Stari obilazak: rekurzija po nivou i id deteta izveden iz celog id-ja roditelja."""
+
+    def parse(self, parameters):
+        self.schema = {}
+        with open(parameters["path"], encoding="utf-8") as f:
+            data = json.load(f)
+        graph = Graph()
+        self.parse_recursive(graph, data, "root")
+        return graph
+
+    def parse_recursive(self, graph, data, current_id):
+        self.parsed_nodes = getattr(self, "parsed_nodes", {})
+        if isinstance(data, dict) and "@id" in data:
+            current_id = data["@id"]
+        if current_id in self.parsed_nodes:
+            return self.parsed_nodes[current_id]
+        node = Node(id=current_id)
+        if isinstance(data, dict):
+            node.label = data.get("name", data.get("label", current_id))
+        else:
+            node.label = current_id
+        graph.add_node(node)
+        self.parsed_nodes[current_id] = node
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key == "@id":
+                    continue
+                if isinstance(value, (dict, list)):
+                    self.handle_complex_value(graph, node, key, value)
+                else:
+                    node.data[key] = self._typed(key, value)
+        elif isinstance(data, list):
+            for i, item in enumerate(data):
+                self.handle_complex_value(graph, node, f"item_{i}", item)
+        return node
+
+    def handle_complex_value(self, graph, source_node, relation_name, value):
+        items = enumerate(value) if isinstance(value, list) else [(None, value)]
+        for i, item in items:
+            child_id = item.get("@id") if isinstance(item, dict) else None
+            if not child_id:
+                suffix = "" if i is None else f"_{i}"
+                child_id = f"{source_node.id}_{relation_name}{suffix}"
+            target = self.parse_recursive(graph, item, child_id)
+            graph.add_edge(Edge(source=str(source_node.id), target=str(target.id),
+                                data={"relation": relation_name}))
+
+
+def measure(mode: str, path: str):
+    """Pokrece se u posebnom procesu; ispisuje vreme, vrsni RSS, broj cvorova i prosecnu duzinu id-ja."""
+    plugin = JSONDataSource() if mode == "stek" else RecursiveJSONDataSource()
+    start = time.perf_counter()
+    try:
+        graph = plugin.parse({"path": path})
+    except RecursionError:
+        print("- - - -")
+        return
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    id_length = sum(len(str(n.id)) for n in graph.nodes) / len(graph.nodes)
+    print(f"{elapsed:.2f} {peak / 1024:.0f} {len(graph.nodes)} {id_length:.1f}")
+
+
+def main(documents):
+    print(f"{'dokument':>14} {'nacin':>9} {'sekundi':>8} {'vrsni RSS':>10} {'cvorova':>9} {'duzina id':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for document in documents:
+            kind, size = document.split(":")
+            path = os.path.join(tmp, f"{kind}.json")
+            generate(path, kind, int(size))
+            for mode in ["stek", "rekurzija"]:
+                out = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_json_tree", "--measure", mode, path],
+                    check=True, capture_output=True, text=True,
+                ).stdout.split()
+                elapsed, peak, nodes, id_length = out
+                peak = "-" if peak == "-" else f"{peak}MB"
+                print(f"{document:>14} {mode:>9} {elapsed:>8} {peak:>10} {nodes:>9} {id_length:>10}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--measure":
+        measure(sys.argv[2], sys.argv[3])
+    else:
+        main(sys.argv[1:] or DOCUMENTS)
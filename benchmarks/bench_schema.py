@@ -0,0 +1,74 @@
+"""
+Benchmark ucitavanja CSV-a sa deklarisanom semom (`schema` parametar
+CSVDataSource-a) naspram odredjivanja tipova iz podataka.
+
+Ulaz su CSV fajlovi sa 200 cvorova iz data_source_csv/data umnozeni do zadatog
+broja redova: svaka kopija dobija svoje id-jeve (N1 -> N1_k), pa graf raste
+zajedno sa brojem redova.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_schema              # 1M redova
+    python -m benchmarks.bench_schema 200000
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from data_source_csv.data_source_csv.plugin import CSVDataSource
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "..", "data_source_csv", "data_source_csv", "data")
+FIXTURES = ["graph_200_nodes_directed.csv", "graph_200_nodes_undirected.csv"]
+SCHEMA = {"id": "str", "label": "str", "age": "int", "score": "float", "role": "str"}
+REPEATS = 3
+
+
+def scale(fixture: str, path: str, rows: int):
+    with open(fixture, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        body = list(reader)
+    id_columns = [header.index("id"), header.index("target")]
+    with open(path, "w", encoding="utf-8", newline="") as out:
+        writer = csv.writer(out)
+        writer.writerow(header)
+        written, copy = 0, 0
+        while written < rows:
+            for row in body[:rows - written]:
+                row = list(row)
+                for c in id_columns:
+                    if row[c]:
+                        row[c] = f"{row[c]}_{copy}"
+                writer.writerow(row)
+            written += min(len(body), rows - written)
+            copy += 1
+
+
+def best_time(parameters: dict):
+    """Najbolje od REPEATS merenja; u memoriji je uvek samo jedan graf (GC inace obilazi i stare)."""
+    best, size = None, None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        graph = CSVDataSource().parse(parameters)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        size = (len(graph.nodes), len(graph.edges))
+        del graph
+    return best, size
+
+
+def main(rows: int):
+    print(f"{'fajl':>32} {'redova':>8} {'bez seme':>9} {'sa semom':>9} {'ubrzanje':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in FIXTURES:
+            path = os.path.join(tmp, name)
+            scale(os.path.join(DATA_DIR, name), path, rows)
+            inferred, size = best_time({"path": path})
+            declared, declared_size = best_time({"path": path, "schema": SCHEMA})
+            assert size == declared_size
+            print(f"{name:>32} {rows:>8} {inferred:>8.2f}s {declared:>8.2f}s {inferred / declared:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
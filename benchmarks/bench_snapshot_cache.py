@@ -0,0 +1,66 @@
+"""
+Benchmark snapshot kesa: ucitavanje istog izvora prvi put (parsiranje teksta
+i upis snapshot-a) naspram ponovnog ucitavanja iz snapshot-a (binarni format,
+bez parsiranja teksta).
+
+Izvori se generisu kao u bench_csv_ingest (CSV zadate velicine u MB) i
+bench_json_links (flat JSON sa zadatim brojem veza).
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_snapshot_cache            # CSV 50 MB, JSON 1 M veza
+    python -m benchmarks.bench_snapshot_cache 200 2000000
+"""
+import gc
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks import bench_csv_ingest, bench_json_links
+from data_source_csv.data_source_csv.plugin import CSVDataSource
+from data_source_json.data_source_json.plugin import JSONDataSource
+from graph_platform.platform.snapshot_cache import SnapshotCache
+
+
+def timed(function, *args):
+    gc.collect()
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def measure(cache: SnapshotCache, plugin, params: dict):
+    key = cache.key(plugin.name(), params)
+    parse_time, graph = timed(plugin.parse, params)
+    size = (len(graph.nodes), len(graph.edges))
+    put_time, _ = timed(cache.put, key, graph)
+    del graph
+    get_time, graph = timed(cache.get, key)
+    assert (len(graph.nodes), len(graph.edges)) == size
+    return parse_time, put_time, get_time, os.path.getsize(cache._path(key)), size
+
+
+def main(megabytes: int, links: int):
+    print(f"{'izvor':>22} {'cvorova':>9} {'ivica':>9} {'parsiranje':>11} {'upis':>6} "
+          f"{'iz kesa':>8} {'ubrzanje':>9} {'snapshot':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SnapshotCache(os.path.join(tmp, "cache"))
+        sources = [
+            (f"CSV {megabytes} MB", CSVDataSource(), os.path.join(tmp, "graph.csv"),
+             lambda path: bench_csv_ingest.generate(path, megabytes)),
+            (f"JSON {links} veza", JSONDataSource(), os.path.join(tmp, "graph.json"),
+             lambda path: bench_json_links.generate(path, links)),
+        ]
+        for name, plugin, path, generate in sources:
+            generate(path)
+            parse_time, put_time, get_time, snapshot, (nodes, edges) = measure(cache, plugin, {"path": path})
+            print(f"{name:>22} {nodes:>9} {edges:>9} {parse_time:>10.2f}s {put_time:>5.2f}s "
+                  f"{get_time:>7.2f}s {parse_time / get_time:>8.1f}x "
+                  f"{snapshot / os.path.getsize(path):>8.0%}")
+            os.remove(path)
+            cache.clear()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000)
@@ -0,0 +1,107 @@
+"""
+Benchmark tag pipeline-a: 10 tagova (filteri + pretrage) nad velikim grafom.
+
+Poredi uklanjanje taga preko bitset maski (GraphManager.remove_*) sa starim
+pristupom "reset + ponovo primeni sve preostale tagove".
+
+Pokretanje (iz korena repozitorijuma):
+    python -m benchmarks.bench_tags
+    python -m benchmarks.bench_tags 500000
+"""
+import random
+import sys
+import time
+
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform.graph_manager import GraphManager
+from graph_platform.platform.workspace import Workspace
+
+ROLES = ["HR", "Dev", "QA", "Ops", "Sales"]
+TAGS = [
+    ("filter", ("age", ">", "20")),
+    ("filter", ("age", "<", "65")),
+    ("filter", ("score", ">=", "5.5")),
+    ("search", "e"),
+    ("filter", ("score", "<", "99.5")),
+    ("filter", ("role", "!=", "Ops")),
+    ("search", "node"),
+    ("filter", ("age", "!=", "40")),
+    ("filter", ("level", "<=", "9")),
+    ("search", "l"),
+]
+
+
+def build_graph(count: int, seed: int = 7) -> Graph:
+    rnd = random.Random(seed)
+    graph = Graph(name="bench")
+    for i in range(count):
+        graph.add_node(Node(id=str(i), label=f"Node {i}", data={
+            "age": rnd.randrange(18, 70),
+            "score": round(rnd.random() * 100, 2),
+            "role": rnd.choice(ROLES),
+            "level": rnd.randrange(10),
+        }))
+    for _ in range(count):
+        graph.add_edge(Edge(source=str(rnd.randrange(count)), target=str(rnd.randrange(count))))
+    return graph
+
+
+def apply(manager, tag):
+    kind, value = tag
+    if kind == "search":
+        manager.apply_search(value)
+    else:
+        manager.apply_filter(*value)
+
+
+def replay(manager, tags):
+    """Stari put: reset pa ponovo primeni svaki preostali tag nad trenutnim grafom."""
+    graph = manager.workspace_manager.get_active_workspace().initial_graph
+    for kind, value in tags:
+        if kind == "search":
+            graph = manager.search_service.search(graph, value)
+        else:
+            graph = manager.filter_service.apply_filter(graph, *value)
+    return graph
+
+
+def main(argv):
+    count = int(argv[0]) if argv else 500_000
+    graph = build_graph(count)
+
+    GraphManager._instance = None
+    manager = GraphManager()
+    workspace = Workspace(name="bench", original_graph=graph, source_plugin="bench", source_params={})
+    manager.workspace_manager.create_workspace(workspace)
+    manager.switch_workspace(workspace.id)
+
+    print(f"graph: {count} nodes, {len(graph.edges)} edges, {len(TAGS)} tags")
+    start = time.perf_counter()
+    for tag in TAGS:
+        apply(manager, tag)
+    len(workspace.current_graph.edges)
+    print(f"apply 10 tags:            {time.perf_counter() - start:8.3f} s")
+
+    remaining = list(TAGS)
+    mask_total = replay_total = 0.0
+    while remaining:
+        tag = remaining.pop(0)
+        start = time.perf_counter()
+        if tag[0] == "search":
+            manager.remove_search(tag[1])
+        else:
+            attribute, operator, value = tag[1]
+            manager.remove_filter({'attribute': attribute, 'operator': operator, 'value': value})
+        len(workspace.current_graph.edges)
+        mask_total += time.perf_counter() - start
+
+        start = time.perf_counter()
+        len(replay(manager, remaining).edges)
+        replay_total += time.perf_counter() - start
+
+    print(f"remove 10 tags (masks):   {mask_total:8.3f} s")
+    print(f"remove 10 tags (replay):  {replay_total:8.3f} s")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,76 @@
+"""
+Pretvaranje postojecih CSV/JSON izvora u binarni graf (`api.api.graph_binary`).
+
+Izvor se ucitava odgovarajucim data source plugin-om (po ekstenziji, i za
+.gz/.bz2/.xz), pa se graf upisuje sa CSR-om u oba smera.
+
+Pokretanje (iz korena repozitorijuma):
+    python -m data_source_binary.data_source_binary.export graph.csv
+    python -m data_source_binary.data_source_binary.export data.json data.graph --schema "age:int"
+"""
+import argparse
+import importlib
+import os
+from typing import Any, Dict, List, Optional
+from api.api.data_source import DataSourcePlugin
+from api.api.graph import Graph
+from api.api.graph_binary import write_graph
+
+# ekstenzija izvora -> (modul, klasa) plugin-a koji ga ucitava
+SOURCE_PLUGINS = {
+    ".csv": ("data_source_csv.data_source_csv.plugin", "CSVDataSource"),
+    ".json": ("data_source_json.data_source_json.plugin", "JSONDataSource"),
+}
+COMPRESSED_SUFFIXES = (".gz", ".bz2", ".xz")
+SUFFIX = ".graph"
+
+
+def _extension(path: str) -> str:
+    root, extension = os.path.splitext(path)
+    if extension.lower() in COMPRESSED_SUFFIXES:
+        extension = os.path.splitext(root)[1]
+    return extension.lower()
+
+
+def source_plugin(path: str) -> DataSourcePlugin:
+    """Plugin za izvor na osnovu ekstenzije; ValueError za nepoznatu."""
+    extension = _extension(path)
+    if extension not in SOURCE_PLUGINS:
+        raise ValueError(f"Nepoznata vrsta izvora '{path}' (podrzano: {', '.join(SOURCE_PLUGINS)})")
+    module, name = SOURCE_PLUGINS[extension]
+    return getattr(importlib.import_module(module), name)()
+
+
+def target_path(source: str) -> str:
+    """graph.csv -> graph.graph (i graph.csv.gz -> graph.graph)."""
+    root, extension = os.path.splitext(source)
+    if extension.lower() in COMPRESSED_SUFFIXES:
+        root = os.path.splitext(root)[0]
+    return root + SUFFIX
+
+
+def export(source: str, target: Optional[str] = None, params: Optional[Dict[str, Any]] = None,
+           adjacency: bool = True) -> Graph:
+    """Ucitava `source` i upisuje ga kao binarni graf u `target`; vraca ucitan graf."""
+    graph = source_plugin(source).parse({**(params or {}), "path": source})
+    write_graph(graph, target or target_path(source), adjacency=adjacency)
+    return graph
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="CSV/JSON izvor -> binarni graf")
+    parser.add_argument("source", help="putanja do CSV ili JSON fajla")
+    parser.add_argument("target", nargs="?", help=f"izlazni fajl (podrazumevano izvor sa {SUFFIX})")
+    parser.add_argument("--schema", help="tipovi atributa, kao parametar 'schema' plugin-a")
+    parser.add_argument("--no-adjacency", action="store_true", help="bez CSR-a (manji fajl)")
+    args = parser.parse_args(argv)
+
+    params = {"schema": args.schema} if args.schema else {}
+    target = args.target or target_path(args.source)
+    graph = export(args.source, target, params, adjacency=not args.no_adjacency)
+    print(f"{target}: {len(graph.nodes)} cvorova, {len(graph.edges)} ivica, "
+          f"{os.path.getsize(target) / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+#binary plugin
+import os
+from typing import Any, Dict, List
+from api.api.data_source import DataSourcePlugin, PluginParameter, PluginParameterType
+from api.api.graph import Graph
+from api.api.graph_binary import read_graph
+
+
+class BinaryDataSource(DataSourcePlugin):
+    """
+    Ucitava graf iz binarnog formata (`api.api.graph_binary`, opis formata je tamo).
+    Fajl se mapira u memoriju, a kolone i krajevi ivica se citaju kao nizovi;
+    ako fajl sadrzi CSR, graf ga ne racuna ponovo. Fajl se pravi iz CSV/JSON
+    izvora modulom `export`.
+    """
+
+    # fajl je vec snapshot; kes bi ga samo kopirao
+    cacheable = False
+
+    def name(self) -> str:
+        return "Binary Graph Data Source"
+
+    def get_parameters(self) -> List[PluginParameter]:
+        return [
+            PluginParameter(
+                name="path",
+                description="Putanja do binarnog grafa (.graph)",
+                type=PluginParameterType.FILE
+            )
+        ]
+
+    def parse(self, parameters: Dict[str, Any]) -> Graph:
+        path = parameters.get("path")
+        if not path or not os.path.exists(path):
+            raise FileNotFoundError(f"Fajl nije pronadjen na putanji: {path}")
+        return read_graph(path)
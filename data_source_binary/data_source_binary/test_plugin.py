@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+from data_source_binary.data_source_binary.export import export, main, source_plugin, target_path
+from data_source_binary.data_source_binary.plugin import BinaryDataSource
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+SOURCES = [
+    os.path.join(ROOT, "data_source_csv", "data_source_csv", "data", "graph_200_nodes_undirected.csv"),
+    os.path.join(ROOT, "data_source_json", "data_source_json", "data", "200_nodes_directed.json"),
+    os.path.join(ROOT, "data_source_json", "data_source_json", "data", "sample_graph.json"),
+]
+
+
+class TestBinaryDataSource(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.plugin = BinaryDataSource()
+
+    def test_exported_sources_load_unchanged(self):
+        for source in SOURCES:
+            with self.subTest(source=os.path.basename(source)):
+                target = os.path.join(self.directory, "graph.graph")
+                original = export(source, target)
+                graph = self.plugin.parse({"path": target})
+                self.assertEqual(graph.to_dict(), original.to_dict())
+                self.assertEqual(graph.schema, original.schema)
+                # CSR je procitan iz fajla, isti kao izracunat
+                for direction in ("out", "in"):
+                    self.assertTrue(graph.csr_ready(direction))
+                    self.assertEqual(graph.csr(direction), original.csr(direction))
+
+        graph.add_node(type(graph.nodes[0])(id="novi"))
+        self.assertFalse(graph.csr_ready("out"))
+        self.assertEqual(len(graph.csr("out")[0]), len(graph.nodes) + 1)
+
+    def test_command_line_export(self):
+        source = os.path.join(self.directory, "graph.csv")
+        shutil.copy(SOURCES[0], source)
+        main([source, "--schema", "age:str", "--no-adjacency"])
+        graph = self.plugin.parse({"path": target_path(source)})
+        self.assertFalse(graph.csr_ready("out"))
+        self.assertEqual(graph.schema, {"age": "str"})
+        self.assertEqual(target_path("a/b.json.gz"), os.path.join("a", "b.graph"))
+
+        self.assertRaises(ValueError, source_plugin, "graph.txt")
+        self.assertRaises(FileNotFoundError, self.plugin.parse, {"path": "nepostojeci.graph"})
+        self.assertFalse(self.plugin.cacheable)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,13 @@
+from setuptools import setup, find_packages
+
+setup(
+    name="data_source_binary",
+    version="0.1.0",
+    author="KVT",
+    description="Data source plugin koji ucitava graf iz kompaktnog binarnog formata",
+    packages=find_packages(),
+    install_requires=[
+        "api>=0.1.0",
+    ],
+    python_requires=">=3.8",
+)
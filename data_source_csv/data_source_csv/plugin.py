@@ -1,9 +1,15 @@
 import csv
+import io
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain, count, islice, repeat
 import os
-from typing import Dict, Any, List
-from api.api.data_source import DataSourcePlugin, PluginParameter, PluginParameterType
-from api.api.graph import Node, Edge, Graph
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from api.api.data_source import DataSourcePlugin, GraphBatch, LoadCancelled, PluginParameter, PluginParameterType
+from api.api.column_types import DECLARED_CONVERTERS, SAMPLE_SIZE, ColumnConverters, load_schema
+from api.api.graph import Node, Edge, Graph, parse_value as graph_parse_value
+from api.api.graph_builder import GraphBuilder
+from api.api.input_file import InputFile
 
 def parse_value(v: str):
         """Pokuša da konvertuje vrednost u int, float, date ili ostavi kao string."""
@@ -29,11 +35,180 @@ def parse_value(v: str):
         # 4. Ako ništa, ostavi kao string
         return v
 
+# kolone koje nisu atributi cvora
+SPECIAL_COLUMNS = ("id", "label", "target", "weight")
+
+
+def parse_rows(rows: Iterable[Dict[str, str]], converters: Optional[ColumnConverters] = None
+               ) -> Tuple[Dict[str, list], List[Tuple[str, str, float]]]:
+    """
+    Parsira niz redova u kompaktan delimican rezultat:
+      - nodes: id -> [label, data prvog pojavljivanja, spojene kasnije izmene ili None],
+        redom prvog pojavljivanja (cvor koji se prvo javi kao target ima label = id i prazan data),
+      - edges: (source, target, weight) redom iz fajla.
+    Isti rezultat daje i jedan proces i radnik nad delom fajla; u graf ga slaze `GraphBuilder`.
+
+    Vrednosti se tipiziraju konvertorom kolone (`column_types`); bez `converters`
+    tipovi se odredjuju iz prvih redova. Tip kolone ne menja vrednosti, samo brzinu.
+    """
+    nodes: Dict[str, list] = {}
+    edges = []
+
+    rows = iter(rows)
+    if converters is None:
+        sample = list(islice(rows, SAMPLE_SIZE))
+        converters = ColumnConverters.infer(sample)
+        rows = chain(sample, rows)
+    convert_row = converters.convert_row
+
+    for row in rows:
+        node_id = row["id"]
+        label = row.get("label", node_id)
+
+        # Ekstraktujemo atribute osim specijalnih kolona
+        node_data = convert_row(row, SPECIAL_COLUMNS)
+
+        entry = nodes.get(node_id)
+        if entry is None:
+            nodes[node_id] = [label, node_data, None]
+        elif node_data:
+            if entry[2] is None:
+                entry[2] = {}
+            entry[2].update(node_data)
+
+        # Obrada ivica
+        target = row.get("target")
+        if target and target.strip():
+            if target not in nodes:
+                nodes[target] = [target, {}, None]
+            edges.append((node_id, target, float(row.get("weight", 1) or 1)))
+
+    return nodes, edges
+
+
+def _split_rows(blocks: Iterable[str], fieldnames: List[str]) -> Iterator[Dict[str, str]]:
+    """
+    Redovi CSV-a bez navodnika kao recnici, isto sto i csv.DictReader, ali
+    linija se deli sa str.split (visestruko brze od csv modula). Blok u kome
+    neki red nema tacno len(fieldnames) polja ide kroz csv.DictReader.
+    """
+    width = len(fieldnames)
+    for block in blocks:
+        if "\r" in block:
+            # isto kao univerzalni novi red pri citanju u tekstualnom modu
+            block = block.replace("\r\n", "\n").replace("\r", "\n")
+        lines = block.split("\n")
+        rows = [line.split(",") for line in lines if line]
+        if set(map(len, rows)) <= {width}:
+            yield from [dict(zip(fieldnames, values)) for values in rows]
+        else:
+            yield from csv.DictReader(lines, fieldnames=fieldnames)
+
+
+def read_rows(source: InputFile) -> Iterator[Dict[str, str]]:
+    """
+    Redovi celog fajla (posle zaglavlja) kao recnici kolona -> tekst.
+    Tekst se dekodira po blokovima direktno iz mapiranog fajla; fajl sa
+    navodnicima (polje moze da sadrzi zarez ili novi red) cita csv modul.
+    """
+    header_end = source.line_end(0)
+    fieldnames = next(csv.reader([source.text(0, header_end)]), [])
+    blocks = source.blocks(header_end)
+    if source.find(b'"') != -1:
+        return csv.DictReader(chain.from_iterable(map(io.StringIO, blocks)), fieldnames=fieldnames)
+    return _split_rows(blocks, fieldnames)
+
+
+def _parse_byte_range(path: str, start: int, end: int, fieldnames: List[str],
+                      schema: Optional[Dict[str, str]] = None):
+    """
+    Radnik: parsira redove izmedju bajtova [start, end) (granice su na pocetku reda).
+    Uz rezultat `parse_rows` vraca i broj procitanih redova.
+    """
+    converters = ColumnConverters(schema, declared=True) if schema else None
+    counter = count()
+    with InputFile(path) as source:
+        rows = (row for row, _ in zip(_split_rows(source.blocks(start, end), fieldnames), counter))
+        nodes, edges = parse_rows(rows, converters)
+    return nodes, edges, next(counter)
+
+
+def split_byte_ranges(path: str, parts: int) -> Optional[Tuple[List[str], List[Tuple[int, int]]]]:
+    """
+    Deli fajl (bez zaglavlja) na `parts` opsega bajtova poravnatih na pocetak reda.
+    Vraca None ako fajl ima navodnike: polje pod navodnicima moze da sadrzi novi red,
+    pa deljenje po bajtovima nije bezbedno i fajl se cita u jednom procesu. Isto
+    vazi i za fajl koji ne moze da se mapira (cev, kompresovan fajl).
+    """
+    with InputFile(path) as source:
+        if not source.mapped or source.find(b'"') != -1:
+            return None
+        header_end = source.find(b"\n")
+        if header_end == -1:
+            return None
+        fieldnames = next(csv.reader([source.text(0, header_end)]))
+        return fieldnames, source.line_ranges(parts, header_end + 1)
+
+
+def _column_value(schema: Dict[str, str], column: str):
+    """Vrednost kolone "id"/"label" u data cvora: tip iz seme ili parse_value kao i ranije."""
+    kind = schema.get(column)
+    if kind is None:
+        return graph_parse_value
+    convert = DECLARED_CONVERTERS[kind]
+
+    def typed(value: str):
+        try:
+            return convert(value)
+        except ValueError:
+            raise ValueError(f"Vrednost {value!r} u koloni '{column}' nije tipa '{kind}'") from None
+    return typed
+
+
+class _BatchMaker:
+    """
+    Delimican rezultat `parse_rows` kao GraphBatch. Cvor se pravi samo pri prvom
+    pojavljivanju id-ja (ono odredjuje label), a kasniji redovi samo dopunjuju
+    njegov data (`updates`), pa se za ponovljen id ne pravi Node koji bi
+    GraphBuilder odbacio.
+
+    Sema (ako je zadata) odredjuje i tip vrednosti "id" i "label" u data cvora.
+    """
+
+    def __init__(self, schema: Dict[str, str]):
+        self.id_value = _column_value(schema, "id")
+        self.label_value = _column_value(schema, "label")
+        self.seen = set()  # id-jevi cvorova iz prethodnih delova
+
+    def batch(self, nodes: Dict[str, list], edges: List[Tuple[str, str, float]]) -> GraphBatch:
+        seen = self.seen
+        new_nodes, updates = [], []
+        for node_id, (label, data, later) in nodes.items():
+            if node_id not in seen:
+                seen.add(node_id)
+                # vrednosti su vec tipizirane; id i label u data prolaze kroz parse_value (ili tip iz seme)
+                base = {"id": self.id_value(node_id), "label": self.label_value(label)}
+                new_nodes.append(Node(id=node_id, label=label, data={**base, **data}, parsed=True))
+            elif data:
+                updates.append((node_id, data))
+            if later:
+                updates.append((node_id, later))
+        return GraphBatch(
+            nodes=new_nodes, updates=updates,
+            edges=[Edge(source=source, target=target, weight=weight) for source, target, weight in edges],
+        )
+
+
 class CSVDataSource(DataSourcePlugin):
     """
     CSV format (jedan fajl) sa automatskom detekcijom usmerenog / neusmerenog grafa.
     """
 
+    # broj redova koji se citaju odjednom
+    CHUNK_SIZE = 10000
+    # broj opsega bajtova po radniku (manji opsezi ravnomernije rasporedjuju posao)
+    RANGES_PER_WORKER = 4
+
     def name(self) -> str:
         return "CSV Data Source"
 
@@ -50,85 +225,97 @@ class CSVDataSource(DataSourcePlugin):
                 type=PluginParameterType.TEXT,
                 is_required=False,
                 default_value="CSV Graph"
+            ),
+            PluginParameter(
+                name="chunk_size",
+                description="Broj redova koji se citaju odjednom",
+                type=PluginParameterType.INTEGER,
+                is_required=False,
+                default_value=self.CHUNK_SIZE
+            ),
+            PluginParameter(
+                name="workers",
+                description="Broj procesa za paralelno parsiranje (1 = bez paralelizma)",
+                type=PluginParameterType.INTEGER,
+                is_required=False,
+                default_value=1
+            ),
+            PluginParameter(
+                name="schema",
+                description="Tipovi kolona (int, float, date, str) kao JSON, 'kolona:tip,...' "
+                            "ili putanja do JSON fajla; bez seme tipovi se odredjuju iz podataka",
+                type=PluginParameterType.TEXT,
+                is_required=False,
+                default_value=None
             )
         ]
 
     def parse(self, parameters: Dict[str, Any]) -> Graph:
+        """
+        Graf slozen od delova iz `parse_iter` (GraphBuilder preskace ponovljene
+        cvorove i ivice i prati usmerenost: ako svaka ivica ima suprotnu, graf je
+        neusmeren i druga ivica svakog para se brise).
+        """
+        return GraphBuilder().build(self.parse_iter(parameters))
+
+    def parse_iter(self, parameters: Dict[str, Any]) -> Iterator[GraphBatch]:
+        """
+        Cita CSV u delovima od `chunk_size` redova; svaki deo je jedan GraphBatch,
+        bez privremenih lista svih redova i ivica.
+
+        Sa `workers` > 1 fajl se deli na opsege bajtova poravnate na redove,
+        koje parsira ProcessPoolExecutor; delovi stizu redom opsega, pa je graf
+        isti kao pri citanju u jednom procesu.
+
+        Sa `schema` se tipovi kolona ne odredjuju iz podataka: deklarisani tip
+        se primenjuje strogo i ostaje zapisan u `graph.schema`.
+
+        Napredak (redovi i bajtovi) se prijavljuje posle svakog dela, odnosno
+        opsega; prekid ucitavanja se vidi na istom mestu (LoadCancelled).
+        """
         csv_path = parameters.get("path", parameters.get("csv_path"))
         graph_name = parameters.get("graph_name", "CSV Graph")
+        chunk_size = int(parameters.get("chunk_size") or self.CHUNK_SIZE)
+        workers = int(parameters.get("workers") or 1)
+        schema = load_schema(parameters.get("schema"))
 
         if not os.path.exists(csv_path):
             raise FileNotFoundError(f"CSV fajl nije pronađen: {csv_path}")
 
-        nodes = {}
-        edges_raw = []   # privremeno sve ivice
-
-        # --- 1. ČITANJE CSV FAJLA ---
-        with open(csv_path, encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-
-            for row in reader:
-                node_id = row["id"]
-                label = row.get("label", node_id)
-
-                # Ekstraktujemo atribute osim specijalnih kolona
-                node_data = {k: parse_value(v) for k, v in row.items() if k not in ["id", "label", "target", "weight"] and v.strip() != ""}
-
-                # Kreiranje čvora ako ne postoji
-                if node_id not in nodes:
-                    nodes[node_id] = Node(
-                        id=node_id,
-                        label=label,
-                        data={"id": node_id, "label": label, **node_data}
-                    )
-                else:
-                    nodes[node_id].data.update(node_data)
-
-                # Obrada ivica
-                target = row.get("target")
-                if target and target.strip():
-                    if target not in nodes:
-                        nodes[target] = Node(
-                            id=target,
-                            label=target,
-                            data={"id": target, "label": target}
-                        )
-
-                    weight = float(row.get("weight", 1) or 1)
-                    edges_raw.append((node_id, target, weight))
-
-        # --- 2. AUTOMATSKA DETEKCIJA USMEREN / NEUSMEREN ---
-        edge_pairs = {(s, t) for (s, t, w) in edges_raw}
-
-        is_undirected = True
-        for (u, v) in edge_pairs:
-            if (v, u) not in edge_pairs:
-                is_undirected = False
-                break
-
-        # --- 3. KREIRANJE LISTE IVICA ---
-        edges = []
-
-        if is_undirected:
-            # ukloni duplikate: A-B i B-A
-            unique_pairs = set()
-            for (s, t, w) in edges_raw:
-                key = tuple(sorted([s, t]))
-                if key not in unique_pairs:
-                    unique_pairs.add(key)
-                    edges.append(Edge(source=s, target=t, weight=w))
-        else:
-            # usmeren graf → uzmi sve ivice
-            for (s, t, w) in edges_raw:
-                edges.append(Edge(source=s, target=t, weight=w))
-
-        # --- 4. KREIRANJE Grafa ---
-        g = Graph(name=graph_name, directed=not is_undirected)
-
-        for node in nodes.values():
-            g.add_node(node)
+        yield GraphBatch(name=graph_name, schema=dict(schema or {}))
+        maker = _BatchMaker(schema or {})
 
-        for edge in edges:
-            g.add_edge(edge)
+        split = split_byte_ranges(csv_path, workers * self.RANGES_PER_WORKER) if workers > 1 else None
+        if split is not None:
+            fieldnames, ranges = split
+            self.report_progress(total=os.path.getsize(csv_path))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # map vraca rezultate redom opsega, pa je spajanje deterministicko
+                results = executor.map(
+                    _parse_byte_range,
+                    repeat(csv_path), [s for s, _ in ranges], [e for _, e in ranges], repeat(fieldnames),
+                    repeat(schema),
+                )
+                try:
+                    for (nodes, edges, rows), (_, end) in zip(results, ranges):
+                        yield maker.batch(nodes, edges)
+                        self.report_progress(rows=rows, position=end)
+                except (LoadCancelled, GeneratorExit):
+                    # opsezi koje radnici jos nisu poceli se ne parsiraju
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+            return
 
-        return g
+        with InputFile(csv_path) as source:
+            self.report_progress(total=source.size)
+            reader = read_rows(source)
+            converters = ColumnConverters(schema, declared=True) if schema else None
+            while True:
+                chunk = list(islice(reader, chunk_size))
+                if not chunk:
+                    break
+                if converters is None:
+                    # tipovi kolona se odredjuju jednom, iz pocetka fajla
+                    converters = ColumnConverters.infer(chunk)
+                yield maker.batch(*parse_rows(chunk, converters))
+                self.report_progress(rows=len(chunk), position=source.position)
@@ -0,0 +1,143 @@
+import csv
+import json
+import os
+import tempfile
+from datetime import datetime
+import unittest
+from api.api.data_source import LoadCancelled, LoadProgress
+from api.api.input_file import InputFile
+from data_source_csv.data_source_csv.plugin import CSVDataSource, read_rows, split_byte_ranges
+
+
+class TestCSVStreaming(unittest.TestCase):
+
+    def parse(self, text, **params):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8") as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return CSVDataSource().parse({"path": f.name, **params})
+
+    def test_undirected_keeps_first_edge_of_each_pair(self):
+        text = "id,label,target,weight,age\nA,Alpha,B,5,30\nB,Beta,C,1,\nB,Beta,A,7,\nC,Gamma,B,2,40\nC,Gamma,C,1,\n"
+        for chunk_size in [1, 2, 100]:
+            with self.subTest(chunk_size=chunk_size):
+                graph = self.parse(text, chunk_size=chunk_size)
+                self.assertFalse(graph.directed)
+                self.assertEqual([(e.source, e.target, e.weight) for e in graph.edges],
+                                 [("A", "B", 5.0), ("B", "C", 1.0), ("C", "C", 1.0)])
+                self.assertFalse(graph.has_edge("B", "A"))
+                self.assertEqual(graph.get_node("C").data, {"id": "C", "label": "C", "age": 40})
+
+    def test_one_unmatched_edge_makes_graph_directed(self):
+        graph = self.parse("id,target\nA,B\nB,A\nB,C\nA,B\n", chunk_size=2)
+        self.assertTrue(graph.directed)
+        self.assertEqual([(e.source, e.target) for e in graph.edges], [("A", "B"), ("B", "A"), ("B", "C")])
+        self.assertEqual([n.id for n in graph.nodes], ["A", "B", "C"])
+
+    def test_parallel_parse_matches_single_process(self):
+        rows = ["id,label,target,weight,age"]
+        for i in range(300):
+            rows.append(f"n{i % 40},L{i},n{(i * 7) % 50},{i % 5},{i}")
+            if i % 3 == 0:
+                rows.append(f"n{(i * 7) % 50},X{i},n{i % 40},1,")
+        text = "\n".join(rows) + "\n"
+        expected = self.parse(text).to_dict()
+        for workers in [2, 3]:
+            with self.subTest(workers=workers):
+                self.assertEqual(self.parse(text, workers=workers).to_dict(), expected)
+
+        data_dir = os.path.join(os.path.dirname(__file__), "data")
+        for name in ["graph_200_nodes_directed.csv", "graph_200_nodes_undirected.csv"]:
+            with self.subTest(name=name):
+                path = os.path.join(data_dir, name)
+                single = CSVDataSource().parse({"path": path})
+                parallel = CSVDataSource().parse({"path": path, "workers": 2})
+                self.assertEqual(parallel.to_dict(), single.to_dict())
+
+    def test_progress_and_cancel(self):
+        text = "id,target\n" + "".join(f"n{i},n{i + 1}\n" for i in range(300))
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8") as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                plugin = CSVDataSource()
+                reports = []
+                plugin.progress = LoadProgress(lambda p: reports.append((p.rows, p.bytes)))
+                plugin.parse({"path": f.name, "chunk_size": 100, "workers": workers})
+                self.assertEqual(plugin.progress.to_dict()["rows"], 300)
+                self.assertEqual(plugin.progress.total_bytes, len(text))
+                self.assertEqual(reports[-1], (300, len(text)))
+
+                # prekid posle prvog dela
+                plugin.progress = LoadProgress(lambda p: p.rows and p.cancel())
+                with self.assertRaises(LoadCancelled):
+                    plugin.parse({"path": f.name, "chunk_size": 100, "workers": workers})
+
+    def test_schema_replaces_inference(self):
+        text = "id,label,target,weight,zip,age,joined\n007,L1,008,2,01000,30,2021-03-04\n008,L2,007,1,21000,,\n"
+        inferred = self.parse(text)
+        self.assertEqual(inferred.get_node("007").data["zip"], 1000)
+        self.assertEqual(inferred.get_node("007").data["id"], 7)
+
+        schema = {"id": "str", "label": "str", "zip": "str", "age": "float", "joined": "date"}
+        for params in [{"schema": schema}, {"schema": "id:str, label:str, zip:str, age:float, joined:date"},
+                       {"schema": schema, "workers": 2}]:
+            with self.subTest(params=params):
+                graph = self.parse(text, **params)
+                self.assertEqual(graph.schema, schema)
+                self.assertEqual(graph.get_node("007").data,
+                                 {"id": "007", "label": "L1", "zip": "01000", "age": 30.0,
+                                  "joined": datetime(2021, 3, 4)})
+                # 008 se prvo javlja kao target, pa mu je label = id
+                self.assertEqual(graph.get_node("008").data, {"id": "008", "label": "008", "zip": "21000"})
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+            json.dump(schema, f)
+        self.addCleanup(os.remove, f.name)
+        self.assertEqual(self.parse(text, schema=f.name).to_dict(), self.parse(text, schema=schema).to_dict())
+
+        with self.assertRaisesRegex(ValueError, "koloni 'joined'"):
+            self.parse(text, schema={"joined": "int"})
+        with self.assertRaisesRegex(ValueError, "koloni 'label'"):
+            self.parse(text, schema={"label": "int"})
+        self.assertRaises(ValueError, self.parse, text, schema={"zip": "decimal"})
+
+    def test_rows_match_csv_dict_reader(self):
+        texts = [
+            "id,label,target\nA,x,B\n\nB,y\nC,z,A,extra\n",
+            "id,label\r\nA,x\r\nB, y \r\n",
+            'id,label\nA,"x, y"\nB,"multi\nline"\n',
+            "id,label\nA,x",
+            "",
+        ]
+        for text in texts:
+            with self.subTest(text=text):
+                with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8", newline="") as f:
+                    f.write(text)
+                self.addCleanup(os.remove, f.name)
+                with open(f.name, encoding="utf-8") as plain:
+                    expected = list(csv.DictReader(plain))
+                with InputFile(f.name) as source:
+                    self.assertEqual(list(read_rows(source)), expected)
+
+    def test_byte_ranges_are_line_aligned(self):
+        text = "id,target\n" + "".join(f"n{i},n{i + 1}\n" for i in range(50))
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8") as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        fieldnames, ranges = split_byte_ranges(f.name, 7)
+        self.assertEqual(fieldnames, ["id", "target"])
+        data = text.encode()
+        self.assertEqual(b"".join(data[s:e] for s, e in ranges), data[len("id,target\n"):])
+        self.assertTrue(all(data[s - 1:s] == b"\n" for s, _ in ranges))
+
+        # polja pod navodnicima mogu da sadrze novi red - tada nema deljenja
+        with open(f.name, "a", encoding="utf-8") as out:
+            out.write('"n9\nx",n1\n')
+        self.assertIsNone(split_byte_ranges(f.name, 7))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,24 @@
 #json plugin
 import os
-import json
-from typing import Dict, Any, List
-from api.api.data_source import DataSourcePlugin, PluginParameter, PluginParameterType
-from api.api.graph import Graph, Node, Edge
+from itertools import islice
+from typing import Callable, Dict, Any, Generator, Iterable, Iterator, List, Tuple
+from api.api.column_types import coerce_value, load_schema
+from api.api.data_source import DataSourcePlugin, GraphBatch, PluginParameter, PluginParameterType
+from api.api.graph import Graph, Node, Edge, parse_value
+from api.api.graph_builder import GraphBuilder
+from api.api.input_file import InputFile
+from data_source_json.data_source_json.stream import ArrayStream, first_char, iter_object, loads
+
+# _flat_batches je ucitao flat format (dokument moze biti i `null`, pa None ne moze da oznaci to)
+_FLAT = object()
 
 class JSONDataSource(DataSourcePlugin):
 
+    # koliko primera veza sa nepostojecim cvorom ide u izvestaj
+    DANGLING_EXAMPLES = 5
+    # broj elemenata (cvorova, veza) u jednom delu parse_iter; napredak se prijavljuje posle svakog dela
+    BATCH_SIZE = 10000
+
     def name(self) -> str:
         return "JSON Data Source"
 
@@ -16,37 +28,112 @@ class JSONDataSource(DataSourcePlugin):
                 name="path", 
                 description="Putanja do JSON fajla", 
                 type=PluginParameterType.FILE
+            ),
+            PluginParameter(
+                name="schema",
+                description="Tipovi atributa (int, float, date, str) kao JSON, 'atribut:tip,...' "
+                            "ili putanja do JSON fajla",
+                type=PluginParameterType.TEXT,
+                is_required=False,
+                default_value=None
             )
         ]
 
     def parse(self, parameters: Dict[str, Any]) -> Graph:
+        builder = GraphBuilder()
+        graph = builder.build(self.parse_iter(parameters))
+        # veze flat formata koje nisu ucitane (kraj ne postoji medju cvorovima)
+        self.dangling_links = self._dangling_summary(graph, builder.dangling)
+        return graph
+
+    def parse_iter(self, parameters: Dict[str, Any]) -> Iterator[GraphBatch]:
+        """
+        Delovi grafa od po BATCH_SIZE cvorova ili veza, redom iz dokumenta;
+        posle svakog dela se prijavljuje napredak.
+        """
         path = parameters.get("path")
         if not path or not os.path.exists(path):
             raise FileNotFoundError(f"Fajl nije pronadjen na putanji: {path}")
 
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # deklarisani tipovi atributa; vrednosti se svode na njih pri ucitavanju
+        self.schema = load_schema(parameters.get("schema")) or {}
+        yield GraphBatch(schema=self.schema)
 
-        graph = Graph()
-        graph.directed = True # Bitno za usmerene cikluse
+        # tekst se dekodira direktno iz mapiranog fajla (ili raspakovanog .gz/.bz2/.xz)
+        with InputFile(path) as source:
+            self.report_progress(total=source.size)
+            if first_char(source.blocks(whole_lines=False)) == "{":
+                # Da li je ovo format koji podrzava cikluse (cita se element po element)
+                data = yield from self._flat_batches(source)
+            else:
+                data = loads(source.text())
+                self.report_progress(position=source.size)
 
-        # Da li je ovo format koji podrzava cikluse
-        if isinstance(data, dict) and "nodes" in data and "links" in data:
-            self._parse_flat_format(graph, data)
-        else:
-            self.parsed_nodes = {} 
-            self.parse_recursive(graph, data, "root")
-        
-        return graph
+        if data is not _FLAT:
+            yield GraphBatch(directed=True) # Bitno za usmerene cikluse
+            yield from self._tree_batches(data, "root", {})
 
-    def _parse_flat_format(self, graph: Graph, data: Dict[str, Any]):
+    def _flat_batches(self, source: InputFile) -> Generator[GraphBatch, None, Any]:
         """
         Parser za format koji eksplicitno definise cvorove i veze.
         Ovaj format omogucava cikluse (npr. A->B->A).
-        Takođe prepoznaje neusmeren graf.
+        Takođe prepoznaje neusmeren graf (obe veze para ostaju u grafu).
+
+        Nizovi "nodes" i "links" se citaju inkrementalno (`stream.iter_object`),
+        pa u memoriji nikada nije ceo dokument. Dok se ne vidi niz "links",
+        ne zna se da li je dokument u ovom formatu, pa delovi sa cvorovima
+        cekaju. Ako fajl nije u ovom formatu, vraca dokument za rekurzivni
+        parser; inace _FLAT.
         """
+        document, arrays = {}, set()
+        held: List[GraphBatch] = []
+        pending_links = []
+        for key, value in iter_object(source.blocks(whole_lines=False), ("nodes", "links"), source.text):
+            if not isinstance(value, ArrayStream):
+                document[key] = value
+                continue
+            arrays.add(key)
+            if key == "nodes":
+                batches = self._batches(self._flat_nodes(value), lambda nodes: GraphBatch(nodes=nodes), source)
+                if "links" not in arrays:
+                    held.extend(batches)
+                    continue
+                yield from batches
+                yield from self._batches(self._flat_links(pending_links), lambda edges: GraphBatch(edges=edges), source)
+                pending_links = []
+            elif "nodes" in arrays:
+                yield from held
+                held = []
+                yield from self._batches(self._flat_links(value), lambda edges: GraphBatch(edges=edges), source)
+            else:
+                # veze pre cvorova cekaju da cvorovi budu ucitani
+                pending_links = list(value)
+                self.report_progress(position=source.position)
+
+        if not arrays:
+            return document
+        if arrays != {"nodes", "links"}:
+            # samo jedan od nizova: nije flat format, rekurzivni parser dobija ceo dokument
+            return loads(source.text())
+        yield GraphBatch(keep_reverse_edges=True)
+        return _FLAT
+
+    def _batches(self, items: Iterable[Any], make: Callable[[list], GraphBatch],
+                 source: InputFile) -> Iterator[GraphBatch]:
+        """Elementi po BATCH_SIZE u jednom delu, uz prijavu napretka posle svakog dela."""
+        items = iter(items)
+        while True:
+            part = list(islice(items, self.BATCH_SIZE))
+            if not part:
+                return
+            yield make(part)
+            self.report_progress(rows=len(part), position=source.position)
+
+    def _flat_nodes(self, nodes: Iterable[Dict[str, Any]]) -> Iterator[Node]:
         # Ucitavanje cvorova
-        for node_data in data.get("nodes", []):
+        keys = {}  # isti kljuc u svim cvorovima je jedan string (kao posle json.load)
+        typed = self._typed if self.schema else None
+        for node_data in nodes:
             node_id = str(node_data.get("id"))
             node_label = node_data.get("label", node_id)
             
@@ -56,99 +143,143 @@ class JSONDataSource(DataSourcePlugin):
             # Sve ostalo ide u data atribute
             for k, v in node_data.items():
                 if k not in ["id", "label"]:
-                    node.data[k] = v
+                    k = keys.setdefault(k, k)
+                    node.data[k] = typed(k, v) if typed else v
             
-            graph.add_node(node)
+            yield node
 
-        # --- Ucitavanje veza i skladištenje parova za proveru ---
-        edge_pairs = set()  # set svih (source, target) za proveru neusmerenosti
-        for link_data in data.get("links", []):
-            source_id = str(link_data.get("source"))
-            target_id = str(link_data.get("target"))
+    @staticmethod
+    def _flat_links(links: Iterable[Dict[str, Any]]) -> Iterator[Edge]:
+        """Veze se proveravaju u GraphBuilder-u: krajevi preko indeksa id -> cvor u O(1)."""
+        for link_data in links:
+            yield Edge(source=str(link_data.get("source")), target=str(link_data.get("target")),
+                       data={k: v for k, v in link_data.items() if k not in ["source", "target"]})
 
-            # Provera da li cvorovi postoje
-            source_exists = any(n.id == source_id for n in graph.nodes)
-            target_exists = any(n.id == target_id for n in graph.nodes)
+    def _dangling_summary(self, graph: Graph, dangling: List[Edge]) -> Dict[str, Any]:
+        """Izvestaj o vezama koje nisu ucitane jer im kraj ne postoji medju cvorovima."""
+        missing = {}
+        for edge in dangling:
+            for node_id in (edge.source, edge.target):
+                if not graph.has_node(node_id):
+                    missing[node_id] = missing.get(node_id, 0) + 1
+        return {
+            "count": len(dangling),
+            "missing_nodes": sorted(missing, key=missing.get, reverse=True)[:self.DANGLING_EXAMPLES],
+            "examples": [(e.source, e.target) for e in dangling[:self.DANGLING_EXAMPLES]],
+        }
 
-            if source_exists and target_exists:
-                edge_data = {k: v for k, v in link_data.items() if k not in ["source", "target"]}
-                edge = Edge(source=source_id, target=target_id, data=edge_data)
-                graph.add_edge(edge)
+    def _typed(self, key: str, value: Any) -> Any:
+        kind = self.schema.get(key)
+        if kind is None:
+            return value
+        try:
+            return coerce_value(value, kind)
+        except ValueError:
+            raise ValueError(f"Vrednost {value!r} atributa '{key}' nije tipa '{kind}'") from None
 
-                # Dodaj u set za proveru neusmerenosti
-                edge_pairs.add((source_id, target_id))
+    def parse_recursive(self, graph: Graph, data: Any, current_id: str) -> Node:
+        """Dodaje u `graph` cvorove i grane dokumenta `data` (vidi `_tree_batches`) i vraca koren."""
+        positions = {node.id: i for i, node in enumerate(graph.nodes)}
+        builder = GraphBuilder(graph)
+        for batch in self._tree_batches(data, current_id, positions):
+            builder.add(batch)
+        return graph.get_node(self._node_id(data, current_id))
 
-        # --- Prepoznavanje neusmerenog grafa ---
-        undirected = True
-        for s, t in edge_pairs:
-            if (t, s) not in edge_pairs:
-                undirected = False
-                break
+    def _tree_batches(self, data: Any, current_id: str, positions: Dict[Any, int]) -> Iterator[GraphBatch]:
+        """
+        Pravi cvor za `data` i za sve vrednosti ispod njega: svaki dict/list
+        (i element liste) postaje cvor, a grana od roditelja nosi ime kljuca.
+        Ako postoji @id polje, ono ima prednost, a cvor sa istim id-jem se
+        pravi samo jednom (sledece pojave dobijaju samo granu).
+
+        Stablo se obilazi eksplicitnim stekom, pa dubina dokumenta nije
+        ogranicena rekurzijom. Generisani id deteta je "n<indeks roditelja>_<kljuc>"
+        (uz "_<i>" za element liste), pa duzina id-a ne raste sa dubinom.
+        `positions` (id -> pozicija u grafu) sadrzi vec napravljene cvorove.
+        """
+        # ime veze -> vrednost u data grane (isti string za sve grane sa tim imenom)
+        relations: Dict[str, Any] = {}
+        nodes: List[Node] = []
+        edges: List[Edge] = []
+        current_id = self._node_id(data, current_id)
+        # ako je vec kreiran cvor sa ovim ID-jem, nema sta da se doda
+        if current_id in positions:
+            return
+        root = self._new_tree_node(data, current_id, positions, nodes)
+        # okvir: (cvor, ime veze od roditelja, iterator dece)
+        stack = [(root, None, self._children(positions[current_id], data))]
+        while stack:
+            parent, _, children = stack[-1]
+            for relation, value, child_id in children:
+                child_id = self._node_id(value, child_id)
+                if child_id not in positions:
+                    child = self._new_tree_node(value, child_id, positions, nodes)
+                    if isinstance(value, (dict, list)):
+                        # grana do deteta se dodaje tek kad je njegovo podstablo gotovo
+                        stack.append((child, relation, self._children(positions[child_id], value)))
+                        break
+                edges.append(self._tree_edge(parent.id, child_id, relation, relations))
+            else:
+                node, relation, _ = stack.pop()
+                if stack:
+                    edges.append(self._tree_edge(stack[-1][0].id, node.id, relation, relations))
+            if len(nodes) >= self.BATCH_SIZE:
+                # grane u delu vode samo do vec napravljenih cvorova
+                yield GraphBatch(nodes=nodes, edges=edges)
+                self.report_progress(rows=len(nodes))
+                nodes, edges = [], []
 
-        graph.directed = not undirected
+        yield GraphBatch(nodes=nodes, edges=edges)
+        self.report_progress(rows=len(nodes))
 
-    def parse_recursive(self, graph: Graph, data: Any, current_id: str) -> Node:
-        # Provera ID-a unutar podataka (ako postoji @id polje, ono ima prednost)
+    @staticmethod
+    def _node_id(data: Any, generated_id: str) -> Any:
         if isinstance(data, dict) and "@id" in data:
-            current_id = data["@id"]
-        
-        #ako je vec kreiran cvor sa ovim ID-jem, vracamo ga
-        if current_id in self.parsed_nodes:
-            return self.parsed_nodes[current_id]
+            return data["@id"]
+        return generated_id
 
-        node = Node(id=current_id)
+    def _new_tree_node(self, data: Any, node_id: Any, positions: Dict[Any, int], nodes: List[Node]) -> Node:
+        node = Node(id=node_id)
         # Pokusaj da nadjes labelu ili name u podacima
         if isinstance(data, dict):
             if "name" in data: node.label = data["name"]
             elif "label" in data: node.label = data["label"]
-            else: node.label = current_id
+            else: node.label = node_id
+
+            typed = self._typed if self.schema else None
+            for key, value in data.items():
+                if key != "@id" and not isinstance(value, (dict, list)):
+                    node.data[key] = typed(key, value) if typed else value
         else:
-            node.label = current_id
+            node.label = node_id
 
-        graph.add_node(node)
-        self.parsed_nodes[current_id] = node
+        positions[node_id] = len(positions)
+        nodes.append(node)
+        return node
 
+    def _children(self, position: int, data: Any) -> Iterator[Tuple[str, Any, str]]:
+        """(ime veze, vrednost, generisani id) za svako dete cvora na poziciji `position`, redom iz dokumenta."""
+        prefix = f"n{position}_"
         if isinstance(data, dict):
             for key, value in data.items():
-                if key == "@id": continue
-
-                if isinstance(value, (dict, list)):
-                    self.handle_complex_value(graph, node, key, value)
-                else:
-                    node.data[key] = value
-
+                if key != "@id" and isinstance(value, (dict, list)):
+                    yield from self._complex_value(prefix, key, value)
         elif isinstance(data, list):
             for i, item in enumerate(data):
-                self.handle_complex_value(graph, node, f"item_{i}", item)
-
-        return node
-
-    def handle_complex_value(self, graph: Graph, source_node: Node, relation_name: str, value: Any):
-        # pomocna fja za kreiranje grane
-        def create_edge(target):
-            s_id = str(source_node.id)
-            t_id = str(target.id)
-            edge = Edge(source=s_id, target=t_id, data={"relation": relation_name})
-            graph.add_edge(edge)
+                yield from self._complex_value(prefix, f"item_{i}", item)
 
+    @staticmethod
+    def _complex_value(prefix: str, relation_name: str, value: Any) -> Iterator[Tuple[str, Any, str]]:
+        # elementi liste su zasebna deca sa istim imenom veze
         if isinstance(value, list):
             for i, item in enumerate(value):
-                child_id = None
-                if isinstance(item, dict):
-                    child_id = item.get("@id")
-                
-                # ako nema @id, generišemo ga na osnovu roditelja
-                if not child_id:
-                    child_id = f"{source_node.id}_{relation_name}_{i}"
-
-                target_node = self.parse_recursive(graph, item, child_id)
-                create_edge(target_node)
+                yield relation_name, item, f"{prefix}{relation_name}_{i}"
         else:
-            child_id = None
-            if isinstance(value, dict):
-                child_id = value.get("@id")            
-            if not child_id:
-                child_id = f"{source_node.id}_{relation_name}"
-
-            target_node = self.parse_recursive(graph, value, child_id)
-            create_edge(target_node)
\ No newline at end of file
+            yield relation_name, value, f"{prefix}{relation_name}"
+
+    @staticmethod
+    def _tree_edge(source_id: Any, target_id: Any, relation_name: str, relations: Dict[str, Any]) -> Edge:
+        relation = relations.get(relation_name)
+        if relation is None:
+            relation = relations[relation_name] = parse_value(relation_name)
+        return Edge(source=str(source_id), target=str(target_id), data={"relation": relation}, parsed=True)
@@ -0,0 +1,260 @@
+"""
+Inkrementalno citanje JSON objekta na vrhu dokumenta, npr. flat formata
+{"nodes": [...], "links": [...]}.
+
+Umesto json.load celog fajla tekst stize po blokovima, a elementi nizova
+pod zadatim kljucevima se dekodiraju jedan po jedan (json raw_decode, u C-u).
+U memoriji su tako samo tekuci blok i tekuci element; ostale vrednosti na
+vrhu dokumenta se dekodiraju cele.
+
+Vrednost koja nije cela u baferu se dekodira ponovo tek posle dopune bar
+iste kolicine teksta, pa je velika vrednost ukupno linearna. Vrednost na
+vrhu koja ni sa _WHOLE_TEXT_FROM znakova nije cela dekodira se jednom iz
+celog teksta (`text`), i citanje se dalje nastavlja iz njega.
+
+C dekoder je rekurzivan i odustaje (RecursionError) vec na ~1000 nivoa
+ugnjezdavanja; dublje vrednosti se dekodiraju eksplicitnim stekom (`loads`).
+"""
+import json
+import re
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# separator izmedju elemenata niza (ili kraj niza) sa razmacima oko njega
+_SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+# znak koji moze da sledi iza cele vrednosti; bez njega broj mozda nije ceo ("12." pa "5")
+_DELIMITER = re.compile(r"[ \t\n\r]*[,:\]}]")
+# od ove velicine nedovrsene vrednosti na vrhu dokumenta dekodira se ceo tekst
+_WHOLE_TEXT_FROM = 1 << 23
+# posle RecursionError-a toliko nivoa se otvara rucno pre novog pokusaja u C-u
+_MANUAL_DEPTH = 512
+
+
+class _Reader:
+    """Bafer nad blokovima teksta; dopunjava se kad vrednost nije cela."""
+
+    def __init__(self, blocks: Iterable[str], text: Optional[Callable[[], str]] = None):
+        self._blocks = iter(blocks)
+        # ceo tekst (spojeni blokovi), za velike vrednosti koje se ne citaju inkrementalno
+        self._text = text
+        decoder = json.JSONDecoder()
+        self._decode = decoder.raw_decode
+        # scan_once je C skener bez omotaca raw_decode (greska je StopIteration)
+        self._scan = decoder.scan_once
+        self.buffer = ""
+        self.pos = 0
+        self.offset = 0  # polozaj buffer[0] u celom tekstu
+
+    def _more(self, at_least: int = 1) -> bool:
+        """Dopunjava bafer blokovima dok ne doda bar `at_least` znakova (False na kraju teksta)."""
+        parts = [self.buffer[self.pos:]]
+        added = 0
+        for block in self._blocks:
+            parts.append(block)
+            added += len(block)
+            if added >= at_least:
+                break
+        if not added:
+            return False
+        self.offset += self.pos
+        self.buffer = "".join(parts)
+        self.pos = 0
+        return True
+
+    def _switch_to_text(self):
+        """Ostatak dokumenta se cita iz celog teksta umesto iz blokova."""
+        self.pos += self.offset
+        self.buffer = self._text()
+        self.offset = 0
+        self._blocks = iter(())
+        self._text = None
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """Sledeci znak koji nije razmak ('' na kraju teksta)."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._more():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            raise self.error(f"Ocekivano jedno od {chars!r}")
+        self.pos += 1
+        return char
+
+    def value(self, whole_text: bool = False) -> Any:
+        """
+        Sledeca JSON vrednost; bafer se dopunjava dok vrednost nije cela.
+        whole_text=True: velika vrednost se dekodira iz celog teksta (ako je zadat).
+        """
+        try:
+            return self._whole_value(whole_text)
+        except RecursionError:
+            return self._nested_value()
+
+    def key(self, keys: Dict[str, str]) -> str:
+        """Kljuc objekta i ':' iza njega; isti kljuc je uvek isti string (kao u json.loads)."""
+        key = self._whole_value()
+        if not isinstance(key, str):
+            raise self.error("Kljuc objekta mora biti string")
+        self.expect(":")
+        return keys.setdefault(key, key)
+
+    def _whole_value(self, whole_text: bool = False) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                pending = len(self.buffer) - self.pos
+                if whole_text and self._text is not None and pending >= _WHOLE_TEXT_FROM:
+                    self._switch_to_text()
+                    continue
+                # sledeci pokusaj tek sa bar duplo vise teksta
+                if self._more(pending):
+                    continue
+                raise
+            # broj mozda nije ceo ("12" ili "12." pa "5" u sledecem bloku) dok iza njega nema separatora
+            if _DELIMITER.match(self.buffer, end) is None and self._more():
+                continue
+            self.pos = end
+            return value
+
+    def _nested_value(self) -> Any:
+        """
+        Vrednost preduboka za C dekoder: objekti i nizovi se otvaraju na
+        eksplicitnom steku, a plitka podstabla i skalari i dalje idu kroz
+        raw_decode. Posle neuspeha C dekodera sledecih _MANUAL_DEPTH nivoa
+        se otvara rucno, pa se dubok lanac ne dekodira iznova na svakom nivou.
+        """
+        stack = []  # [kontejner, kljuc] otvorenih objekata i nizova
+        keys = {}
+        manual_from = 0
+        while True:
+            char = self.peek()
+            if char not in ("{", "["):
+                value = self._whole_value()
+            else:
+                value = stack
+                if not manual_from <= len(stack) < manual_from + _MANUAL_DEPTH:
+                    try:
+                        value = self._whole_value()
+                    except RecursionError:
+                        manual_from = len(stack)
+                if value is stack:
+                    # kontejner se otvara rucno
+                    self.pos += 1
+                    container = {} if char == "{" else []
+                    if self.peek() == "}]"[char == "["]:
+                        self.pos += 1
+                        value = container
+                    else:
+                        stack.append([container, self.key(keys) if char == "{" else None])
+                        continue
+            # vrednost je cela: upisuje se u roditelja, zatvoreni roditelji idu nagore
+            while stack:
+                container, key = frame = stack[-1]
+                if key is None:
+                    container.append(value)
+                    closing = self.expect(",]") == "]"
+                else:
+                    container[key] = value
+                    closing = self.expect(",}") == "}"
+                if not closing:
+                    if key is not None:
+                        frame[1] = self.key(keys)
+                    break
+                value = container
+                stack.pop()
+            else:
+                return value
+
+
+class ArrayStream:
+    """
+    Elementi jednog niza, redom iz teksta. Mora se procitati pre sledeceg
+    kljuca; neprocitani elementi se preskacu (dekodiraju i odbacuju).
+    """
+
+    def __init__(self, reader: _Reader):
+        self._reader = reader
+        self._done = reader.peek() == "]"
+        if self._done:
+            reader.pos += 1
+
+    def __iter__(self) -> Iterator[Any]:
+        reader = self._reader
+        scan, separator = reader._scan, _SEPARATOR.match
+        while not self._done:
+            buffer = reader.buffer
+            try:
+                item, end = scan(buffer, reader.pos)
+                match = separator(buffer, end)
+            except (StopIteration, json.JSONDecodeError, RecursionError):
+                match = None
+            if match is None or match.end() == len(buffer):
+                # element ili separator posle njega nije ceo u baferu
+                item = reader.value()
+                self._done = reader.expect(",]") == "]"
+                if not self._done:
+                    reader.peek()
+            else:
+                reader.pos = match.end()
+                self._done = match.group(1) == "]"
+            yield item
+
+    def drain(self):
+        for _ in self:
+            pass
+
+
+def iter_object(blocks: Iterable[str], streamed: Tuple[str, ...],
+                text: Optional[Callable[[], str]] = None) -> Iterator[Tuple[str, Any]]:
+    """
+    Parovi (kljuc, vrednost) objekta na vrhu dokumenta. Za kljuc iz `streamed`
+    ciji je vrednost niz, vrednost je ArrayStream; sve ostalo je dekodirana vrednost.
+    `text` vraca ceo tekst (spojene blokove), za velike vrednosti van `streamed`.
+    """
+    reader = _Reader(blocks, text)
+    keys = {}
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.key(keys)
+            if key in streamed and reader.peek() == "[":
+                reader.pos += 1
+                stream = ArrayStream(reader)
+                yield key, stream
+                stream.drain()
+            else:
+                yield key, reader.value(whole_text=True)
+            if reader.expect(",}") == "}":
+                break
+    if reader.peek():
+        raise reader.error("Visak podataka posle JSON objekta")
+
+
+def first_char(blocks: Iterable[str]) -> str:
+    """Prvi znak dokumenta koji nije razmak ('' ako je dokument prazan)."""
+    return _Reader(blocks).peek()
+
+
+def loads(text: str) -> Any:
+    """json.loads koji prihvata i dokumente dublje od granice rekurzije."""
+    try:
+        return json.loads(text)
+    except RecursionError:
+        pass
+    reader = _Reader([text])
+    value = reader.value()
+    if reader.peek():
+        raise reader.error("Visak podataka posle JSON vrednosti")
+    return value
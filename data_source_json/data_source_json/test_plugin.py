@@ -1,6 +1,7 @@
 import unittest
 import json
 import os
+from api.api.data_source import LoadCancelled, LoadProgress
 from api.api.graph import Graph
 from data_source_json.data_source_json.plugin import JSONDataSource
 
@@ -33,6 +34,59 @@ class TestJSONDataSource(unittest.TestCase):
         graph = self.plugin.parse(params)
         self.assertIsInstance(graph, Graph)
 
+    def test_schema_types_attributes(self):
+        graph = self.plugin.parse({"path": self.test_file, "schema": {"age": "str"}})
+        self.assertEqual(graph.schema, {"age": "str"})
+        self.assertEqual(sorted(n.data["age"] for n in graph.nodes), ["30", "5", "8"])
+        with self.assertRaises(ValueError):
+            self.plugin.parse({"path": self.test_file, "schema": {"name": "int"}})
+
+    def test_format_detection(self):
+        # flat format posle dugackog razmaka na pocetku fajla
+        with open(self.test_file, 'w') as f:
+            f.write(" " * 100 + "\n" + json.dumps({"nodes": [{"id": "a"}, {"id": "b"}],
+                                                    "links": [{"source": "a", "target": "b"}]}))
+        graph = self.plugin.parse({"path": self.test_file})
+        self.assertEqual([n.id for n in graph.nodes], ["a", "b"])
+        self.assertEqual(len(graph.edges), 1)
+
+        # dokument `null` je jedan cvor, kao i svaka druga skalarna vrednost
+        with open(self.test_file, 'w') as f:
+            f.write("null")
+        graph = self.plugin.parse({"path": self.test_file})
+        self.assertEqual([n.id for n in graph.nodes], ["root"])
+        self.assertTrue(graph.directed)
+
+    def test_deeply_nested_document(self):
+        depth = 5000
+        # json.dump je rekurzivan, pa se tekst slaze direktno
+        level = '{"level": 1, "refs": [{"@id": "top"}, 7], "child": '
+        with open(self.test_file, 'w') as f:
+            f.write('{"@id": "top", "name": "Vrh", "child": ' + level * depth + '{}' + '}' * (depth + 1))
+
+        graph = self.plugin.parse({"path": self.test_file})
+        # vrh, lanac dece (sa praznim na kraju) i cvor za 7 na svakom nivou; {"@id": "top"} je uvek vrh
+        self.assertEqual(len(graph.nodes), 2 + 2 * depth)
+        self.assertEqual(len(graph.edges), 3 * depth + 1)
+        self.assertEqual(graph.nodes[0].id, "top")
+        self.assertEqual(graph.nodes[1].id, "n0_child")
+        self.assertEqual(sum(1 for e in graph.edges if e.target == "top"), depth)
+        self.assertLess(max(len(n.id) for n in graph.nodes), 20)
+
+    def test_progress_and_cancel(self):
+        flat = {"nodes": [{"id": i} for i in range(5)], "links": [{"source": 0, "target": i} for i in range(5)]}
+        with open(self.test_file, 'w') as f:
+            json.dump(flat, f)
+        self.plugin.BATCH_SIZE = 2
+        self.plugin.progress = LoadProgress()
+        self.plugin.parse({"path": self.test_file})
+        self.assertEqual(self.plugin.progress.rows, 10)
+        self.assertEqual(self.plugin.progress.bytes, os.path.getsize(self.test_file))
+
+        self.plugin.progress = LoadProgress(lambda p: p.rows and p.cancel())
+        with self.assertRaises(LoadCancelled):
+            self.plugin.parse({"path": self.test_file})
+
     def test_missing_file(self):
         with self.assertRaises(FileNotFoundError):
             self.plugin.parse({"path": "nepostojeci_fajl.json"})
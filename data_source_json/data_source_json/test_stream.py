@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from data_source_json.data_source_json import stream
+from data_source_json.data_source_json.plugin import JSONDataSource
+from data_source_json.data_source_json.stream import ArrayStream, iter_object, loads
+
+
+def chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+class TestJSONStream(unittest.TestCase):
+
+    DOCUMENT = {
+        "directed": True,
+        "count": 12345,
+        "nodes": [{"id": f"N{i}", "label": "čvor \"x\"", "age": i * 1.5} for i in range(20)],
+        "meta": {"tags": ["a", [], {}], "none": None},
+        "links": [{"source": f"N{i}", "target": f"N{i + 1}", "w": 10 ** i} for i in range(19)],
+        "empty": [],
+    }
+
+    def decode(self, text, size):
+        result = {}
+        for key, value in iter_object(chunks(text, size), ("nodes", "links", "empty")):
+            result[key] = list(value) if isinstance(value, ArrayStream) else value
+        return result
+
+    def test_matches_json_loads_for_any_block_size(self):
+        for indent in [None, 2]:
+            text = json.dumps(self.DOCUMENT, indent=indent, ensure_ascii=False)
+            for size in [1, 2, 7, 64, len(text)]:
+                with self.subTest(indent=indent, size=size):
+                    self.assertEqual(self.decode(text, size), self.DOCUMENT)
+
+        # neprocitan niz se preskace
+        keys = [key for key, _ in iter_object(chunks(json.dumps(self.DOCUMENT), 5), ("nodes",))]
+        self.assertEqual(keys, list(self.DOCUMENT))
+
+        for bad in ['{"nodes": [1, 2', '{"a": 1} x', '{"a" 1}', '[1]', '{"nodes": [1 2]}']:
+            with self.subTest(bad=bad):
+                self.assertRaises(json.JSONDecodeError, self.decode, bad, 3)
+
+    def test_numbers_split_at_every_offset(self):
+        document = {"nodes": [-0.0, 12.5, 1e-7, -3E+2, 7], "version": 12.5, "e": -1.25e10,
+                    "links": [{"w": 0.5}], "n": 120}
+        text = json.dumps(document).replace("1.25e+10", "1.25E10")
+        for offset in range(1, len(text)):
+            with self.subTest(offset=offset):
+                result = {}
+                for key, value in iter_object([text[:offset], text[offset:]], ("nodes", "links")):
+                    result[key] = list(value) if isinstance(value, ArrayStream) else value
+                self.assertEqual(result, document)
+
+    def test_large_value_is_decoded_from_whole_text(self):
+        text = json.dumps({"tree": {"children": [{"id": i} for i in range(200)]}, "nodes": [1, 2]})
+        blocks = chunks(text, 16)
+        with mock.patch.object(stream, "_WHOLE_TEXT_FROM", 64):
+            result = [(key, list(value) if isinstance(value, ArrayStream) else value)
+                      for key, value in iter_object(blocks, ("nodes",), lambda: "".join(blocks))]
+        self.assertEqual(dict(result), json.loads(text))
+
+    def test_values_deeper_than_recursion_limit(self):
+        depth = 20000
+        deep = '{"a": ' * depth + '[1, {"b": []}]' + '}' * depth
+        value = loads(deep)
+        for _ in range(depth):
+            value = value["a"]
+        self.assertEqual(value, [1, {"b": []}])
+
+        text = '{"x": ' + deep + ', "nodes": [' + '[' * depth + ']' * depth + ', 2]}'
+        result = self.decode(text, 4096)
+        self.assertEqual(list(result), ["x", "nodes"])
+        self.assertEqual(result["nodes"][1], 2)
+
+        for bad in ['[' * depth + ']' * (depth - 1), '[' * depth + ']' * (depth + 1)]:
+            self.assertRaises(json.JSONDecodeError, loads, bad)
+
+    def test_plugin_streams_flat_format_in_any_key_order(self):
+        nodes = self.DOCUMENT["nodes"]
+        links = self.DOCUMENT["links"] + [{"source": "N1", "target": "missing"}]
+        results = []
+        for document in [{"nodes": nodes, "links": links}, {"links": links, "x": 1, "nodes": nodes}]:
+            with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+                json.dump(document, f)
+            self.addCleanup(os.remove, f.name)
+            plugin = JSONDataSource()
+            with self.assertLogs("api.api.graph_builder", "WARNING") as logs:
+                results.append(plugin.parse({"path": f.name}).to_dict())
+            self.assertIn("Nije ucitano 1 ivica", logs.output[0])
+            self.assertEqual(plugin.dangling_links,
+                             {"count": 1, "missing_nodes": ["missing"], "examples": [("N1", "missing")]})
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(len(results[0]["nodes"]), 20)
+        self.assertEqual(len(results[0]["edges"]), 19)
+        self.assertTrue(results[0]["directed"])
+
+        # bez niza "links" dokument nije flat format
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as f:
+            json.dump({"nodes": nodes[:2]}, f)
+        self.addCleanup(os.remove, f.name)
+        graph = JSONDataSource().parse({"path": f.name})
+        self.assertEqual([n.id for n in graph.nodes], ["root", "n0_nodes_0", "n0_nodes_1"])
+
+
+if __name__ == '__main__':
+    unittest.main()
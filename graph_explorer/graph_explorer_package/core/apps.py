@@ -8,4 +8,5 @@ class CoreConfig(AppConfig):
     def ready(self):
         # importujemo i inicijalizujemo platformu kad se Django digne
         from graph_platform.platform.graph_manager import GraphManager
-        GraphManager() # inicijalizacija managera
+        # inicijalizacija managera; workspace-ovi sacuvani pre restarta se vracaju
+        GraphManager().enable_persistence()
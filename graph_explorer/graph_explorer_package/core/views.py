@@ -8,6 +8,7 @@ from django.http import JsonResponse, HttpResponse, HttpResponseNotFound
 
 # Importi iz tvoje platforme
 from graph_platform.platform.graph_manager import GraphManager
+from graph_platform.platform.filter_query import QuerySyntaxError
 from graph_platform.platform.visualizer_loader import VisualizerLoader
 
 class IndexView(View):
@@ -34,7 +35,8 @@ class IndexView(View):
         visualizers = vis_loader.list_visualizers()
         
         # Ucitavanje pluginova
-        known_plugins = ["data_source_json.data_source_json", "data_source_csv.data_source_csv"]
+        known_plugins = ["data_source_json.data_source_json", "data_source_csv.data_source_csv",
+                         "data_source_binary.data_source_binary"]
         loader.load_plugins(known_plugins)
         
         plugins = loader.get_available_plugins()
@@ -47,6 +49,8 @@ class IndexView(View):
         plugin_paths = {
             "JSON Data Source": os.path.join(base_dir, "data_source_json", "data_source_json", "data"),
             "CSV Data Source":  os.path.join(base_dir, "data_source_csv", "data_source_csv", "data"),
+            # .graph fajlovi napravljeni sa data_source_binary.data_source_binary.export
+            "Binary Graph Data Source": os.path.join(base_dir, "data_source_binary", "data_source_binary", "data"),
         }
 
         for plugin_name in plugins:
@@ -84,13 +88,13 @@ class IndexView(View):
 
         manager = GraphManager()
         try:
-            # KREIRANJE WORKSPACE-A
-            workspace = manager.create_workspace(plugin_name, {"path": file_path})
+            # KREIRANJE WORKSPACE-A: graf se ucitava u pozadini, stranica prati napredak
+            workspace = manager.create_workspace_async(plugin_name, {"path": file_path})
 
             if visualizer:
                 workspace.selected_visualizer = visualizer
             
-            messages.success(request, f"Workspace '{workspace.name}' kreiran!")
+            messages.success(request, f"Workspace '{workspace.name}' se ucitava...")
             
             context = self._get_context_data(selected_visualizer=visualizer)
             # KLJUČNO: Šaljemo ID workspace-a, a ne path
@@ -120,7 +124,7 @@ def api_graphs(request):
 def api_workspaces(request):
     """Vraca detaljnu listu svih workspace-ova za tabove."""
     manager = GraphManager()
-    return JsonResponse({"workspaces": manager.get_workspaces_info()})
+    return JsonResponse({"workspaces": manager.get_workspaces_info(), "memory": manager.get_memory_stats()})
 
 def api_switch_workspace(request, workspace_id):
     """Menja aktivni workspace."""
@@ -137,6 +141,23 @@ def api_delete_workspace(request, workspace_id):
     manager.delete_workspace(workspace_id)
     return JsonResponse({"status": "ok"})
 
+def api_workspace_progress(request, workspace_id):
+    """Stanje pozadinskog ucitavanja workspace-a: status, procitani redovi i bajtovi."""
+    manager = GraphManager()
+    progress = manager.get_load_progress(workspace_id)
+    if progress is None:
+        return JsonResponse({"error": f"Workspace {workspace_id} ne postoji."}, status=404)
+    return JsonResponse(progress)
+
+def api_workspace_cancel(request, workspace_id):
+    """Prekida ucitavanje workspace-a."""
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+    manager = GraphManager()
+    if not manager.cancel_workspace_load(workspace_id):
+        return JsonResponse({"error": "Workspace se ne ucitava."}, status=409)
+    return JsonResponse({"status": "ok"})
+
 def api_visualize(request, graph_id):
     """
     Vraća HTML vizualizaciju. graph_id je UUID workspace-a.
@@ -148,7 +169,9 @@ def api_visualize(request, graph_id):
     workspace = manager.workspace_manager.get_workspace(graph_id)
     
     if not workspace:
-         return HttpResponseNotFound(f"Workspace {graph_id} nije pronađen (Možda je server restartovan?).")
+         return HttpResponseNotFound(f"Workspace {graph_id} nije pronađen.")
+    if not workspace.ready:
+        return HttpResponse(f"Workspace {graph_id} nije ucitan (stanje: {workspace.status}).", status=409)
     
     # 2. Postavi ga kao aktivnog da bi render metoda znala šta da crta
     manager.switch_workspace(graph_id)
@@ -158,7 +181,9 @@ def api_visualize(request, graph_id):
     if not visualizer_name:
         return HttpResponse("Please select a visualizer", status=400)
     
-    workspace.selected_visualizer = visualizer_name
+    if workspace.selected_visualizer != visualizer_name:
+        workspace.selected_visualizer = visualizer_name
+        manager.save_workspace(workspace)
     
     try:
         vis_loader = VisualizerLoader()
@@ -195,6 +220,8 @@ def api_graph_json(request, graph_id):
 
     if not workspace:
         return HttpResponseNotFound(f"Workspace sa ID {graph_id} nije pronađen.")
+    if not workspace.ready:
+        return JsonResponse({"error": f"Workspace nije ucitan (stanje: {workspace.status})."}, status=409)
     
     graph = workspace.current_graph
     
@@ -269,8 +296,13 @@ def api_cli(request):
         if not manager.workspace_manager.get_active_workspace():
              return JsonResponse({"error": "No active workspace"}, status=400)
         
-        result_graph = manager.apply_cli_command(query)
-        return JsonResponse(result_graph.to_dict(), safe=False)
+        result = manager.apply_cli_command(query)
+        if isinstance(result, dict):
+            # npr. {"explain": plan} ili {"Error": poruka}, uz trenutni graf
+            response = {key: value for key, value in result.items() if key != "graph"}
+            response["graph"] = manager.workspace_manager.get_active_workspace().current_graph.to_dict()
+            return JsonResponse(response, safe=False)
+        return JsonResponse(result.to_dict(), safe=False)
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
 
@@ -281,18 +313,27 @@ def api_filter(request):
     manager = GraphManager()
     try:
         data = json.loads(request.body)
+        query = data.get("query")
         attribute = data.get("attribute")
         operator = data.get("operator")
         value = data.get("value")
 
-        if not attribute or not operator or not value:
-            return JsonResponse({"error": "Attribute, operator, and value must be provided"}, status=400)
+        if not query and (not attribute or not operator or not value):
+            return JsonResponse({"error": "Query or attribute, operator, and value must be provided"}, status=400)
 
         if not manager.workspace_manager.get_active_workspace():
              return JsonResponse({"error": "No active workspace"}, status=400)
 
-        result_graph = manager.apply_filter(attribute, operator, value)
+        if query:
+            # {"query": "...", "explain": true} vraca samo plan, bez primene filtera
+            if data.get("explain"):
+                return JsonResponse({"explain": manager.explain_query(query)})
+            result_graph = manager.apply_query(query)
+        else:
+            result_graph = manager.apply_filter(attribute, operator, value)
         return JsonResponse(manager.get_applied_tags(), safe=False)
+    except QuerySyntaxError as e:
+        return JsonResponse({"error": str(e)}, status=400)
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)
 
@@ -321,7 +362,7 @@ def api_remove_tag(request):
         tag_type = data.get("type")  
         tag_value = data.get("value") 
 
-        if tag_type not in ["search", "filter"]:
+        if tag_type not in ["search", "filter", "query"]:
             return JsonResponse({"error": "Invalid type"}, status=400)
 
         if tag_type == "search":
@@ -335,21 +376,11 @@ def api_remove_tag(request):
             if triple in manager.get_applied_filters():
                 manager.remove_filter(triple)
 
-        searches = manager.get_applied_searches()
-        filters = manager.get_applied_filters()
-        result_graph = manager.reset_graph()
-
-        for s in searches:
-            manager.apply_search(s)
-
-        for f in filters:
-            a = f["attribute"]
-            o = f["operator"]
-            v = f["value"]
-
-            triple = {'attribute': a, 'operator': o, 'value': v}
-            manager.apply_filter(a, o, v)
+        elif tag_type == "query":
+            if {'query': tag_value} in manager.get_applied_filters():
+                manager.remove_filter({'query': tag_value})
 
+        # Trenutni graf je vec azuriran (AND preostalih maski), bez ponovne primene tagova
         return JsonResponse(manager.get_applied_tags(), safe=False)
 
     except Exception as e:
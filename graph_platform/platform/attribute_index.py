@@ -0,0 +1,145 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional
+from api.api.column_types import PYTHON_TYPES
+from api.api.graph import Graph
+
+
+FILTER_RANGE = {
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+}
+
+
+class _Bucket:
+    """Vrednosti jednog tipa za jedan atribut, sortirane zajedno sa indeksima cvorova."""
+
+    def __init__(self, values: List[Any], indices: List[int]):
+        try:
+            order = sorted(range(len(values)), key=values.__getitem__)
+        except TypeError:
+            # tip bez poretka (npr. dict) - za opsege se vrednosti proveravaju jedna po jedna
+            self.values, self.indices, self.sorted = values, array("i", indices), False
+            return
+        self.values = [values[i] for i in order]
+        self.indices = array("i", [indices[i] for i in order])
+        self.sorted = True
+
+    def range(self, operator: str, value) -> List[int]:
+        values, indices = self.values, self.indices
+        if not self.sorted:
+            compare = FILTER_RANGE[operator]
+            result = []
+            for v, i in zip(values, indices):
+                try:
+                    if compare(v, value):
+                        result.append(i)
+                except Exception:
+                    continue
+            return result
+        if operator == ">":
+            return indices[bisect_right(values, value):]
+        if operator == ">=":
+            return indices[bisect_left(values, value):]
+        if operator == "<":
+            return indices[:bisect_left(values, value)]
+        return indices[:bisect_right(values, value)]
+
+
+class _AttributeEntry:
+    """
+    Indeks jednog atributa:
+      - buckets: tip vrednosti -> sortirane (vrednost, indeks cvora) za opsege,
+      - equal: hes indeks vrednost -> indeksi cvorova za == i !=,
+      - present: svi cvorovi koji imaju ne-None vrednost.
+
+    Za atribut sa deklarisanim tipom (`graph.schema`) vrednosti tog tipa idu
+    pravo u njegov bucket, bez provere hesiranja i grupisanja po tipu.
+    """
+
+    def __init__(self, graph: Graph, attribute: str, declared: Optional[type] = None):
+        by_type: Dict[type, tuple] = {}
+        self.equal: Dict[Any, List[int]] = {}
+        self.unhashable: List[tuple] = []
+        self.present = array("i")
+        typed_values, typed_indices = by_type.setdefault(declared, ([], [])) if declared else ((), ())
+        equal = self.equal
+
+        for i, node in enumerate(graph.nodes):
+            value = node.data.get(attribute)
+            if value is None:
+                continue
+            self.present.append(i)
+            if type(value) is declared and value == value:
+                typed_values.append(value)
+                typed_indices.append(i)
+                if value in equal:
+                    equal[value].append(i)
+                else:
+                    equal[value] = [i]
+                continue
+            if value != value:
+                # NaN nije jednak ni sebi i ne moze da se sortira
+                continue
+            values, indices = by_type.setdefault(type(value), ([], []))
+            values.append(value)
+            indices.append(i)
+            try:
+                self.equal.setdefault(value, []).append(i)
+            except TypeError:
+                self.unhashable.append((value, i))
+
+        self.buckets = {t: _Bucket(values, indices) for t, (values, indices) in by_type.items() if values}
+
+    def lookup(self, operator: str, value) -> List[int]:
+        if operator in FILTER_RANGE:
+            bucket = self.buckets.get(type(value))
+            if bucket is None or value != value:
+                return []
+            return bucket.range(operator, value)
+
+        try:
+            matched = list(self.equal.get(value, ()))
+        except TypeError:
+            matched = []
+        matched.extend(i for v, i in self.unhashable if v == value)
+        if operator == "==":
+            return matched
+        excluded = set(matched)
+        return [i for i in self.present if i not in excluded]
+
+
+class AttributeIndex:
+    """
+    Lenji indeks nad atributima cvorova jednog grafa (po workspace-u).
+
+    Svaki atribut se indeksira tek pri prvom filteru nad njim. Opsezi
+    (>, >=, <, <=) se odgovaraju preko bisect-a u O(log n + k), a == i !=
+    preko hes indeksa. Indeks vazi dok se verzija grafa ne promeni (npr.
+    CLI izmena atributa); posle toga ga treba napraviti ponovo.
+    Tipovi iz seme grafa (ako ih je izvor deklarisao) se koriste direktno.
+    """
+
+    SUPPORTED_OPERATORS = {"==", "!=", ">", ">=", "<", "<="}
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self.version = graph.version
+        self._entries: Dict[str, _AttributeEntry] = {}
+        self.declared: Dict[str, type] = {
+            attribute: PYTHON_TYPES[kind] for attribute, kind in getattr(graph, "schema", {}).items()
+        }
+
+    def is_current(self) -> bool:
+        return self.graph.version == self.version
+
+    def lookup(self, attribute: str, operator: str, value) -> Optional[List[int]]:
+        """Indeksi cvorova koji zadovoljavaju filter, ili None ako indeks ne moze da odgovori."""
+        if operator not in self.SUPPORTED_OPERATORS or not self.is_current():
+            return None
+        entry = self._entries.get(attribute)
+        if entry is None:
+            entry = self._entries[attribute] = _AttributeEntry(self.graph, attribute, self.declared.get(attribute))
+        return entry.lookup(operator, value)
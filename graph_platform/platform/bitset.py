@@ -0,0 +1,40 @@
+"""
+Pomocne funkcije za bitset maske cvorova.
+
+Maska je obican Python int: bit i je postavljen ako je cvor sa indeksom i
+(pozicija u `graph.nodes` osnovnog grafa) izabran. Presek i unija su `&` i `|`,
+sto Python radi nad celim recima odjednom.
+"""
+import re
+from typing import Iterable, List
+
+_NONZERO_BYTE = re.compile(b"[^\x00]")
+_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def full(size: int) -> int:
+    """Maska sa svih `size` cvorova."""
+    return (1 << size) - 1
+
+
+def from_indices(indices: Iterable[int], size: int) -> int:
+    buffer = bytearray((size + 7) // 8)
+    for i in indices:
+        buffer[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def indices(mask: int) -> List[int]:
+    """Indeksi postavljenih bitova, u rastucem redosledu."""
+    data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+    result = []
+    # regex preskace nulte bajtove u C-u, pa su retke maske jeftine
+    for match in _NONZERO_BYTE.finditer(data):
+        position = match.start()
+        base = position << 3
+        result.extend(base + bit for bit in _BITS[data[position]])
+    return result
+
+
+def count(mask: int) -> int:
+    return bin(mask).count("1")
@@ -1,10 +1,16 @@
 from api.api.graph import Graph, Node, Edge
+from graph_platform.platform.filter_query import QuerySyntaxError
+from graph_platform.platform.filter_service import FilterService
 
 class CLIService:
-    def execute_command(self, graph: Graph, command_str: str):
+    def __init__(self, filter_service: FilterService = None):
+        self.filter_service = filter_service or FilterService()
+
+    def execute_command(self, graph: Graph, command_str: str, index=None):
         """
         Parsira komandu i izvsava je nad grafom.
         graph nam treba da bismo pozvali filter/search servise ako je potrebno.
+        index je (opcioni) AttributeIndex koji filter koristi kada moze.
         """
         # print(command_str)
         parts = command_str.strip().split()
@@ -22,16 +28,15 @@ class CLIService:
             elif action == "delete":
                 return self._handle_delete(graph, parts[1:])
             elif action == "filter":
-                # Ocekujemo format: filter 'Age>30'
-                # Spajamo sve posle 'filter' u jedan string i sklanjamo navodnike
-                query = " ".join(parts[1:]).strip("'\"")
-                return self._handle_filter(graph, query)
+                # Ocekujemo format: filter age > 30 AND (role == 'HR' OR score >= 50.5)
+                # ili filter --explain <upit> za plan izvrsavanja
+                query = command_str.strip()[len(parts[0]):].strip()
+                return self._handle_filter(graph, query, index)
             elif action == "search":
                 query = " ".join(parts[1:]).strip("'\"")
                 return self._handle_search(graph, query)
             elif action == "clear":
-                graph.nodes = []
-                graph.edges = []
+                graph.clear_graph()
                 return graph
             else:
                 return graph
@@ -47,7 +52,7 @@ class CLIService:
             if not node_id: raise ValueError("Missing --id")
             
             # Provera da li postoji
-            if any(n.id == node_id for n in graph.nodes):
+            if graph.has_node(node_id):
                 raise ValueError(f"Node {node_id} already exists.")
 
             new_node = Node(id=node_id, data=params.get("properties", {}))
@@ -68,7 +73,7 @@ class CLIService:
             source_id, target_id = plain_args[-2], plain_args[-1]
             
             # Provera da li cvorovi postoje
-            if not any(n.id == source_id for n in graph.nodes) or not any(n.id == target_id for n in graph.nodes):
+            if not graph.has_node(source_id) or not graph.has_node(target_id):
                 raise ValueError("Source or Target node does not exist.")
 
             new_edge = Edge(source=source_id, target=target_id, data=params.get("properties", {}))
@@ -81,12 +86,12 @@ class CLIService:
         target_id = params.get("id")
 
         if entity_type == "node":
-            node = next((n for n in graph.nodes if str(n.id) == target_id), None)
-            if not node: raise ValueError("Node not found.")
+            target_id = self._node_id(graph, target_id)
+            if target_id is None: raise ValueError("Node not found.")
             
             # Azuriranje propertija
             new_props = params.get("properties", {})
-            node.data.update(new_props)
+            graph.edit_node(target_id, **new_props)
             return graph
             
         elif entity_type == "edge":
@@ -101,48 +106,45 @@ class CLIService:
         
         if entity_type == "node":
             params = self._parse_args(args[1:])
-            node_id = params.get("id")
-            
+            node_id = self._node_id(graph, params.get("id"))
+            if node_id is None:
+                return graph
+
             # 1. Provera da li je povezan (Constraint iz zadatka)
-            is_connected = any(str(e.source) == node_id or str(e.target) == node_id for e in graph.edges)
+            is_connected = bool(graph.successors(node_id) or graph.predecessors(node_id))
             if is_connected:
                 raise ValueError(f"Cannot delete node {node_id}: It has connected edges. Delete edges first.")
 
             # 2. Brisanje
-            initial_len = len(graph.nodes)
-            graph.nodes = [n for n in graph.nodes if str(n.id) != node_id]
-            
-            if len(graph.nodes) == initial_len:
-                return graph
+            graph.delete_node(node_id)
             return graph
 
         elif entity_type == "edge":
             # Trazimo source i target u argumentima
             plain_args = [a for a in args[1:] if not a.startswith("--")]
             if len(plain_args) < 2: return graph
-            s, t = plain_args[0], plain_args[1]
+            s, t = self._node_id(graph, plain_args[0]), self._node_id(graph, plain_args[1])
             
-            graph.edges = [e for e in graph.edges if not (str(e.source) == s and str(e.target) == t)]
+            if s is not None and t is not None and graph.has_edge(s, t):
+                graph.delete_edge((s, t))
             return graph
 
-    def _handle_filter(self, graph, query):
-        # Parsiranje query stringa 'Age>30' u atribute, operator, value
-        # Ovo je jednostavan parser, moze se nadograditi regexom
-        operators = [">=", "<=", "!=", "=", ">", "<", "contains"]
-        attr, op, val = None, None, None
-        
-        for o in operators:
-            if o in query:
-                parts = query.split(o)
-                attr = parts[0].strip()
-                op = o
-                val = parts[1].strip()
-                break
-        
-        if attr and op and val:
-            graph.apply_filter(attr, op, val)
-            return graph
-        return graph
+    def _handle_filter(self, graph, query, index=None):
+        # Upit je izraz sa AND/OR/NOT (vidi filter_query), npr. age>30 AND role=='HR'
+        explain = query.startswith("--explain")
+        if explain:
+            query = query[len("--explain"):].strip()
+
+        # stari format: filter 'Age>30' (ceo upit pod navodnicima)
+        if len(query) >= 2 and query[0] == query[-1] and query[0] in "'\"" and query[0] not in query[1:-1]:
+            query = query[1:-1]
+
+        try:
+            if explain:
+                return {"explain": self.filter_service.explain(graph, query, index), "graph": graph}
+            return self.filter_service.apply_query(graph, query, index)
+        except QuerySyntaxError as e:
+            return {"Error": str(e), "graph": graph}
 
     def _handle_search(self, graph, query):
         # create node ... Name=Tom -> search 'Name=Tom' -> ili samo 'Tom'
@@ -150,6 +152,18 @@ class CLIService:
         graph.apply_search(query)
         return graph
 
+    @staticmethod
+    def _node_id(graph, raw_id):
+        """
+        Id cvora za id iz komande (uvek string): trazi se tacan kljuc, a zatim
+        cvor ciji je str(id) jednak, npr. int @id iz JSON-a.
+        """
+        if raw_id is None:
+            return None
+        if graph.has_node(raw_id):
+            return raw_id
+        return next((n.id for n in graph.nodes if str(n.id) == raw_id), None)
+
     def _parse_args(self, args_list):
         """Pomocna funkcija za --id=1 --property Name=Alice"""
         res = {"properties": {}}
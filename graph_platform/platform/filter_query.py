@@ -0,0 +1,186 @@
+"""
+Mali jezik za filtere, npr.
+
+    age > 30 AND (role == 'HR' OR score >= 50.5) AND NOT city == "Novi Sad"
+
+Upit se parsira jednom u stablo (Comparison / And / Or / Not); FilterService
+ga zatim izvrsava preko indeksa atributa ili jednim prolazom kroz cvorove.
+Vrednost pod navodnicima ostaje string, a ostale prolaze kroz `parse_value`
+(int, float, datum) kao i kod obicnog filtera. `=` je isto sto i `==`.
+"""
+import re
+from datetime import datetime
+from typing import Any, Iterator, List, Optional, Tuple
+from api.api.graph import parse_value
+
+
+class QuerySyntaxError(ValueError):
+    pass
+
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<paren>[()])
+      | (?P<op>==|!=|>=|<=|>|<|=)
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<word>[^\s()'"=!<>]+)
+    )""", re.VERBOSE)
+
+_KEYWORDS = {"AND", "OR", "NOT"}
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens = []
+    pos, end = 0, len(text.rstrip())
+    while pos < end:
+        match = _TOKEN.match(text, pos)
+        if match is None or match.end() == pos:
+            raise QuerySyntaxError(f"Neocekivan znak na poziciji {pos}: {text[pos:pos + 10]!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == "word" and value.upper() in _KEYWORDS:
+            kind, value = "keyword", value.upper()
+        elif kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "op" and value == "=":
+            value = "=="
+        tokens.append((kind, value))
+        pos = match.end()
+    return tokens
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, str):
+        return repr(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class Comparison:
+    def __init__(self, attribute: str, operator: str, value: Any):
+        self.attribute = attribute
+        self.operator = operator
+        self.value = value
+
+    def __str__(self):
+        return f"{self.attribute} {self.operator} {_format_value(self.value)}"
+
+
+class Not:
+    def __init__(self, operand):
+        self.operand = operand
+
+    def __str__(self):
+        return f"NOT {_wrap(self.operand)}"
+
+
+class And:
+    keyword = "AND"
+
+    def __init__(self, operands: list):
+        self.operands = operands
+
+    def __str__(self):
+        return f" {self.keyword} ".join(_wrap(operand) for operand in self.operands)
+
+
+class Or(And):
+    keyword = "OR"
+
+
+def _wrap(node) -> str:
+    return f"({node})" if isinstance(node, And) else str(node)
+
+
+class _Parser:
+    """Rekurzivni spust: OR < AND < NOT < (izraz) / poredjenje."""
+
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.pos = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, kind: str, value: str = None) -> str:
+        token = self.peek()
+        if token is None or token[0] != kind or (value is not None and token[1] != value):
+            expected = value or kind
+            found = token[1] if token else "kraj upita"
+            raise QuerySyntaxError(f"Ocekivano {expected}, pronadjeno {found}")
+        self.pos += 1
+        return token[1]
+
+    def parse(self):
+        if not self.tokens:
+            raise QuerySyntaxError("Prazan upit")
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"Visak na kraju upita: {self.peek()[1]}")
+        return node
+
+    def parse_or(self):
+        operands = [self.parse_and()]
+        while self.peek() == ("keyword", "OR"):
+            self.pos += 1
+            operands.append(self.parse_and())
+        return operands[0] if len(operands) == 1 else Or(operands)
+
+    def parse_and(self):
+        operands = [self.parse_not()]
+        while self.peek() == ("keyword", "AND"):
+            self.pos += 1
+            operands.append(self.parse_not())
+        return operands[0] if len(operands) == 1 else And(operands)
+
+    def parse_not(self):
+        if self.peek() == ("keyword", "NOT"):
+            self.pos += 1
+            return Not(self.parse_not())
+        if self.peek() == ("paren", "("):
+            self.pos += 1
+            node = self.parse_or()
+            self.take("paren", ")")
+            return node
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> Comparison:
+        token = self.peek()
+        if token is None or token[0] not in ("word", "string"):
+            raise QuerySyntaxError(f"Ocekivan naziv atributa, pronadjeno {token[1] if token else 'kraj upita'}")
+        attribute = token[1]
+        self.pos += 1
+        operator = self.take("op")
+        token = self.peek()
+        if token is None or token[0] not in ("word", "string"):
+            raise QuerySyntaxError(f"Ocekivana vrednost posle {attribute} {operator}")
+        self.pos += 1
+        value = token[1] if token[0] == "string" else parse_value(token[1])
+        return Comparison(attribute, operator, value)
+
+
+class FilterQuery:
+    """Parsiran upit; `str(query)` je kanonski oblik (isti za 'a>1' i 'a > 1')."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.root = _Parser(text).parse()
+
+    def __str__(self):
+        return str(self.root)
+
+    def comparisons(self) -> Iterator[Comparison]:
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Comparison):
+                yield node
+            elif isinstance(node, Not):
+                stack.append(node.operand)
+            else:
+                stack.extend(reversed(node.operands))
+
+
+def compile_query(query) -> FilterQuery:
+    return query if isinstance(query, FilterQuery) else FilterQuery(query)
@@ -1,5 +1,9 @@
-from typing import Any
+from typing import Any, Callable, Optional, Union
 from api.api.graph import Graph, Node, parse_value
+from graph_platform.platform import bitset
+from graph_platform.platform.attribute_index import AttributeIndex
+from graph_platform.platform.filter_query import And, Comparison, FilterQuery, Not, Or, compile_query
+from graph_platform.platform.graph_view import GraphView, view_source
 
 class FilterService:
     """
@@ -14,34 +18,154 @@ class FilterService:
         "<=": lambda a, b: a <= b,
     }
 
-    def apply_filter(self, graph: Graph, attribute: str, operator: str, value: Any) -> Graph:
+    def __init__(self):
+        # koliko filtera je odgovoreno iz indeksa, a koliko punim prolazom
+        self.stats = {"index_hits": 0, "full_scans": 0}
+
+    def apply_filter(self, graph: Graph, attribute: str, operator: str, value: Any,
+                     index: Optional[AttributeIndex] = None) -> Graph:
+        # Rezultat je pogled nad osnovnim grafom; ivice se indukuju tek na zahtev
+        mask = self.match_mask(graph, attribute, operator, value, index)
+        return GraphView(graph, mask, name=f"{graph.name} (filter)")
+
+    def match_mask(self, graph: Graph, attribute: str, operator: str, value: Any,
+                   index: Optional[AttributeIndex] = None) -> int:
+        """
+        Bitset cvorova (indeksi osnovnog grafa) koji zadovoljavaju filter.
+        Ako je prosledjen aktuelan AttributeIndex nad osnovnim grafom, odgovor
+        dolazi iz indeksa; inace se radi pun prolaz kroz cvorove.
+        """
         if operator not in self.OPERATORS:
             raise ValueError(f"Nepoznat operator: {operator}")
 
         op_func = self.OPERATORS[operator]
-        matched_nodes = []
+        matched = []
 
         cast_value = parse_value(value)
 
-        for node in graph.nodes:
-            attr_value = node.data.get(attribute)
-            if attr_value is None:
-                continue
+        base, candidates = view_source(graph)
+        base_nodes = base.nodes
+
+        if index is not None and index.graph is base:
+            found = index.lookup(attribute, operator, cast_value)
+            if found is not None:
+                self.stats["index_hits"] += 1
+                mask = bitset.from_indices(found, len(base_nodes))
+                if isinstance(graph, GraphView) and graph.base is base:
+                    mask &= graph.mask
+                return mask
+
+        self.stats["full_scans"] += 1
+        for i in candidates:
+            if self._compare(base_nodes[i].data.get(attribute), operator, op_func, cast_value):
+                matched.append(i)
+
+        return bitset.from_indices(matched, len(base_nodes))
+
+    @staticmethod
+    def _compare(attr_value, operator: str, op_func, cast_value) -> bool:
+        if attr_value is None:
+            return False
+
+        if type(attr_value) != type(cast_value) and operator not in ["==", "!="]:
+            return False
+
+        try:
+            return bool(op_func(attr_value, cast_value))
+        except Exception:
+            return False
+
+    # --- slozeni upiti (AND / OR / NOT) ---
+
+    def apply_query(self, graph: Graph, query: Union[str, FilterQuery],
+                    index: Optional[AttributeIndex] = None) -> Graph:
+        mask = self.query_mask(graph, query, index)
+        return GraphView(graph, mask, name=f"{graph.name} (filter)")
+
+    def query_mask(self, graph: Graph, query: Union[str, FilterQuery],
+                   index: Optional[AttributeIndex] = None) -> int:
+        """
+        Bitset cvorova koji zadovoljavaju upit. Sa aktuelnim indeksom svako
+        poredjenje je jedan lookup, a AND/OR/NOT su operacije nad maskama;
+        bez indeksa upit se prevodi u jedan predikat i radi se jedan prolaz.
+        """
+        query = compile_query(query)
+        base, candidates = view_source(graph)
+        base_nodes = base.nodes
+
+        if self._index_usable(base, index):
+            self.stats["index_hits"] += 1
+            mask = self._index_mask(query.root, index, len(base_nodes))
+            if isinstance(graph, GraphView) and graph.base is base:
+                mask &= graph.mask
+            return mask
+
+        self.stats["full_scans"] += 1
+        predicate = self._compile(query.root)
+        matched = [i for i in candidates if predicate(base_nodes[i].data)]
+        return bitset.from_indices(matched, len(base_nodes))
 
-            if type(attr_value) != type(cast_value) and operator not in ["==", "!="]:
-                continue
+    def explain(self, graph: Graph, query: Union[str, FilterQuery],
+                index: Optional[AttributeIndex] = None) -> str:
+        """Plan izvrsavanja upita (strategija i stablo, sa brojem pogodaka po indeksu)."""
+        query = compile_query(query)
+        base, candidates = view_source(graph)
+        if self._index_usable(base, index):
+            lines = ["strategy: attribute index (lookup per comparison, bitset AND/OR/NOT)"]
+            self._explain_node(query.root, 1, lines, index, len(base.nodes))
+        else:
+            lines = [f"strategy: single pass over {len(candidates)} nodes (compiled predicate)"]
+            self._explain_node(query.root, 1, lines, None, 0)
+        return "\n".join(lines)
 
-            try:
-                if op_func(attr_value, cast_value):
-                    matched_nodes.append(node)
-            except Exception:
-                continue
+    @staticmethod
+    def _index_usable(base: Graph, index: Optional[AttributeIndex]) -> bool:
+        return index is not None and index.graph is base and index.is_current()
 
-        # Kreiraj novi podgraf
-        new_graph = Graph(name=f"{graph.name} (filter)", directed=graph.directed)
-        new_graph.nodes = matched_nodes
+    def _compile(self, node) -> Callable[[dict], bool]:
+        """Stablo upita -> jedna funkcija nad `node.data`."""
+        if isinstance(node, Comparison):
+            attribute, operator, value = node.attribute, node.operator, node.value
+            op_func, compare = self.OPERATORS[operator], self._compare
+            return lambda data: compare(data.get(attribute), operator, op_func, value)
+        if isinstance(node, Not):
+            operand = self._compile(node.operand)
+            return lambda data: not operand(data)
+        operands = [self._compile(operand) for operand in node.operands]
+        if isinstance(node, Or):
+            return lambda data: any(operand(data) for operand in operands)
+        return lambda data: all(operand(data) for operand in operands)
 
-        node_ids = {n.id for n in matched_nodes}
-        new_graph.edges = [e for e in graph.edges if e.source in node_ids and e.target in node_ids]
+    def _index_mask(self, node, index: AttributeIndex, size: int) -> int:
+        if isinstance(node, Comparison):
+            return bitset.from_indices(index.lookup(node.attribute, node.operator, node.value), size)
+        if isinstance(node, Not):
+            return bitset.full(size) & ~self._index_mask(node.operand, index, size)
+        if isinstance(node, Or):
+            mask = 0
+            for operand in node.operands:
+                mask |= self._index_mask(operand, index, size)
+            return mask
+        mask = bitset.full(size)
+        for operand in node.operands:
+            mask &= self._index_mask(operand, index, size)
+            if not mask:
+                break
+        return mask
 
-        return new_graph
+    def _explain_node(self, node, depth: int, lines: list, index: Optional[AttributeIndex], size: int):
+        indent = "  " * depth
+        if isinstance(node, Comparison):
+            line = f"{indent}{node}"
+            if index is not None:
+                found = bitset.count(self._index_mask(node, index, size))
+                line += f"  [index lookup: {found} nodes]"
+            lines.append(line)
+            return
+        if isinstance(node, Not):
+            lines.append(f"{indent}NOT")
+            self._explain_node(node.operand, depth + 1, lines, index, size)
+            return
+        lines.append(f"{indent}{node.keyword}")
+        for operand in node.operands:
+            self._explain_node(operand, depth + 1, lines, index, size)
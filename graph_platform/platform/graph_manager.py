@@ -1,19 +1,51 @@
+import logging
+import os
+import threading
 import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
+from api.api.data_source import DataSourcePlugin, LoadCancelled, LoadProgress
 from api.api.graph import Graph
+from api.api.columnar_graph import ColumnarGraph
+from api.api.graph_builder import GraphBuilder
 from api.api.base_visualizer import BaseVisualizer
 from graph_platform.platform.data_source_loader import DataSourceLoader
 from graph_platform.platform.search_service import SearchService
 from graph_platform.platform.filter_service import FilterService
+from graph_platform.platform.filter_query import compile_query
 from graph_platform.platform.cli_service import CLIService
+from graph_platform.platform.snapshot_cache import SnapshotCache
 
 # IMPORTUJEMO NOVE KLASE
 # (Pazi da su fajlovi workspace.py i workspace_manager.py u istom folderu kao graph_manager.py)
 from graph_platform.platform.workspace import Workspace
 from graph_platform.platform.workspace_manager import WorkspaceManager
+from graph_platform.platform.workspace_store import WorkspaceStore
+
+logger = logging.getLogger(__name__)
+
+# broj grafova koji se ucitavaju istovremeno u pozadini
+LOAD_WORKERS = 2
+# najvise ucitavanja koja cekaju ili rade; preko toga se novo ucitavanje odbija
+MAX_PENDING_LOADS = 8
+# CLI komande koje menjaju graf (pre njih se zajednicki pocetni graf kopira)
+MUTATING_COMMANDS = ("create", "edit", "delete", "clear")
+# nacini cuvanja ucitanog grafa: objektni model (Graph) ili kolone (ColumnarGraph)
+GRAPH_STORAGES = ("object", "columnar")
+
+
+def default_graph_storage() -> str:
+    """GRAPH_STORAGE ("object" ili "columnar"), podrazumevano "object"."""
+    storage = os.environ.get("GRAPH_STORAGE") or "object"
+    if storage not in GRAPH_STORAGES:
+        raise ValueError(f"Nepoznat GRAPH_STORAGE '{storage}' (moguce: {', '.join(GRAPH_STORAGES)}).")
+    return storage
+
 
 class GraphManager:
     _instance = None 
+    _load_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -23,19 +55,34 @@ class GraphManager:
             cls._instance.data_source_loader = DataSourceLoader()
             cls._instance.data_source_loader.load_plugins([
                 "data_source_json.data_source_json", 
-                "data_source_csv.data_source_csv"
+                "data_source_csv.data_source_csv",
+                "data_source_binary.data_source_binary"
             ])
-            cls._instance._cache = {} 
+            # snapshot-i ucitanih grafova na disku (kljuc je otisak izvornog fajla)
+            cls._instance._cache = SnapshotCache()
+            # grafovi koje dele workspace-ovi otvoreni nad istim izvorom:
+            # otisak izvora -> (weakref grafa, version u trenutku ucitavanja)
+            cls._instance._shared_graphs = {}
+            cls._instance.sharing_stats = {"shared_loads": 0, "copies": 0}
+            # pozadinsko ucitavanje: id workspace-a -> (workspace, posao)
+            cls._instance._load_executor = None
+            cls._instance.loads = {}
+            # "columnar": grafovi se ucitavaju u ColumnarGraph (manje memorije za velike izvore)
+            cls._instance.graph_storage = default_graph_storage()
             cls._instance.visualizer = None
 
             # 2. Services
             cls._instance.search_service = SearchService()
             cls._instance.filter_service = FilterService()
 
-            cls._instance.cli_service = CLIService()
+            cls._instance.cli_service = CLIService(cls._instance.filter_service)
+            # trigram indeks za pretragu (pravi se u pozadini za svaki workspace)
+            cls._instance.search_index_enabled = True
 
             # 3. Workspace Manager
             cls._instance.workspace_manager = WorkspaceManager()
+            # cuvanje workspace-ova na disku (ukljucuje se sa enable_persistence)
+            cls._instance.workspace_store = None
             
             # Backward compatibility (da ne puca ako neko trazi stare atribute)
             cls._instance.initial_graph = None
@@ -52,6 +99,20 @@ class GraphManager:
             cls._instance.search_service = SearchService()
         if not hasattr(cls._instance, 'filter_service'):
             cls._instance.filter_service = FilterService()
+        if not hasattr(cls._instance, 'search_index_enabled'):
+            cls._instance.search_index_enabled = True
+        if not isinstance(getattr(cls._instance, '_cache', None), SnapshotCache):
+            cls._instance._cache = SnapshotCache()
+        if not hasattr(cls._instance, '_shared_graphs'):
+            cls._instance._shared_graphs = {}
+            cls._instance.sharing_stats = {"shared_loads": 0, "copies": 0}
+        if not hasattr(cls._instance, 'loads'):
+            cls._instance._load_executor = None
+            cls._instance.loads = {}
+        if not hasattr(cls._instance, 'workspace_store'):
+            cls._instance.workspace_store = None
+        if not hasattr(cls._instance, 'graph_storage'):
+            cls._instance.graph_storage = default_graph_storage()
             
         return cls._instance
 
@@ -59,44 +120,222 @@ class GraphManager:
         return self.data_source_loader
 
     # --- WORKSPACE METODE ---
+
+    def enable_persistence(self, directory: str = None):
+        """
+        Workspace-ovi se od sada cuvaju na disku (WorkspaceStore) i vracaju se
+        oni sacuvani ranije; njihovi grafovi se citaju tek pri prvom pristupu.
+        """
+        self.workspace_store = WorkspaceStore(directory)
+        # workspace-ovi otvoreni pre ukljucivanja se odmah upisuju
+        opened = list(self.workspace_manager.workspaces.values())
+        workspaces, active_id = self.workspace_store.load()
+        self.workspace_manager.restore_workspaces(workspaces, active_id)
+        for workspace in opened:
+            self.save_workspace(workspace)
+
+    def save_workspace(self, workspace: Optional[Workspace]):
+        """Upisuje workspace i aktivan workspace na disk, ako je cuvanje ukljuceno."""
+        if self.workspace_store is None or workspace is None:
+            return
+        try:
+            self.workspace_store.save(workspace)
+            self.workspace_store.save_active(self.workspace_manager.active_workspace_id)
+        except Exception as e:
+            logger.warning(f"Workspace '{workspace.name}' nije sacuvan na disku: {e}")
     
-    def create_workspace(self, plugin_name: str, params: Dict[str, Any]) -> Workspace:
+    def _get_plugin(self, plugin_name: str) -> DataSourcePlugin:
         try:
-            plugin_instance = self.data_source_loader.get_plugin(plugin_name)
+            return self.data_source_loader.get_plugin(plugin_name)
         except KeyError:
             raise ValueError(f"Plugin '{plugin_name}' nije pronađen.")
 
-        graph = plugin_instance.parse(params)
+    def _load_graph(self, plugin_name: str, plugin_instance: DataSourcePlugin, params: Dict[str, Any],
+                    use_cache: bool) -> Graph:
+        columnar = self.graph_storage == "columnar"
+
+        # graf se slaze od delova iz parse_iter dok plugin cita izvor
+        def parse() -> Graph:
+            return GraphBuilder(ColumnarGraph() if columnar else None).build(plugin_instance.parse_iter(params))
+
+        # use_cache=False: izvor se uvek parsira, a snapshot se ne cita niti upisuje
+        if use_cache and plugin_instance.cacheable:
+            # isti nepromenjen izvor vec otvoren u drugom workspace-u: graf se deli
+            key = self._cache.key(plugin_name, params)
+            if key is not None and columnar:
+                key += "/columnar"
+            graph = self._shared_graph(key)
+            if graph is not None:
+                return graph
+            graph = self._cache.load(plugin_name, params, parse)
+            if columnar and type(graph) is Graph:
+                # snapshot se uvek cita kao objektni graf
+                graph = ColumnarGraph.from_graph(graph)
+        else:
+            key = None
+            graph = parse()
         
         if not isinstance(graph, Graph):
             raise TypeError(f"Plugin '{plugin_name}' nije vratio validan Graph objekat.")
+        return self._share_graph(key, graph)
+
+    def _shared_graph(self, key: Optional[str]) -> Optional[Graph]:
+        """Graf ucitan iz istog izvora, ako ga jos drzi neki workspace i nije menjan."""
+        if key is None:
+            return None
+        with self._load_lock:
+            return self._find_shared(key)
+
+    def _share_graph(self, key: Optional[str], graph: Graph) -> Graph:
+        """Belezi ucitan graf za deljenje; ako je isti izvor u medjuvremenu ucitan, vraca taj graf."""
+        if key is None:
+            return graph
+        with self._load_lock:
+            existing = self._find_shared(key)
+            if existing is not None:
+                return existing
+            self._shared_graphs[key] = (weakref.ref(graph), graph.version)
+        return graph
+
+    def _find_shared(self, key: str) -> Optional[Graph]:
+        ref, version = self._shared_graphs.get(key, (None, None))
+        graph = ref() if ref is not None else None
+        if graph is None or graph.version != version:
+            # graf je obrisan ili izmenjen na mestu (imao je samo jedan workspace)
+            self._shared_graphs.pop(key, None)
+            return None
+        self.sharing_stats["shared_loads"] += 1
+        return graph
+
+    def _share_indexes(self, workspace: Workspace):
+        """Workspace sa zajednickim grafom preuzima indekse koje je drugi workspace vec napravio."""
+        for other in self.workspace_manager.sharing(workspace):
+            if workspace.search_index is None and other.search_index is not None \
+                    and other.search_index.graph is workspace.initial_graph:
+                workspace.search_index = other.search_index
+            if workspace._attribute_index is None and other._attribute_index is not None \
+                    and other._attribute_index.graph is workspace.initial_graph:
+                workspace._attribute_index = other._attribute_index
 
+    @staticmethod
+    def _workspace_name(params: Dict[str, Any]) -> str:
         # Ime workspace-a na osnovu fajla
         path_str = params.get('path', 'Unknown')
         # Pokusaj da izvuces samo ime fajla (radi i za Windows i za Linux putanje)
-        ws_name = path_str.replace('\\', '/').split('/')[-1]
-        
-        new_workspace = Workspace(name=ws_name, original_graph=graph, source_plugin=plugin_name, source_params=params)
+        return path_str.replace('\\', '/').split('/')[-1]
+
+    def create_workspace(self, plugin_name: str, params: Dict[str, Any], use_cache: bool = True) -> Workspace:
+        plugin_instance = self._get_plugin(plugin_name)
+        graph = self._load_graph(plugin_name, plugin_instance, params, use_cache)
+
+        new_workspace = Workspace(name=self._workspace_name(params), original_graph=graph,
+                                  source_plugin=plugin_name, source_params=params)
         
         self.workspace_manager.create_workspace(new_workspace)
         self.workspace_manager.set_active_workspace(new_workspace.id)
+        self.save_workspace(new_workspace)
+        self._share_indexes(new_workspace)
+        if self.search_index_enabled and new_workspace.search_index is None:
+            new_workspace.build_search_index_async()
         
         return new_workspace
 
+    # --- POZADINSKO UCITAVANJE ---
+
+    def create_workspace_async(self, plugin_name: str, params: Dict[str, Any], use_cache: bool = True) -> Workspace:
+        """
+        Vraca workspace odmah, u stanju "loading"; graf se ucitava u pozadini
+        (najvise LOAD_WORKERS istovremeno). Kad je ucitan, workspace postaje
+        aktivan. Napredak daje `get_load_progress`, a prekid `cancel_workspace_load`.
+        """
+        plugin_instance = self._get_plugin(plugin_name)
+        workspace = Workspace(name=self._workspace_name(params), original_graph=None,
+                              source_plugin=plugin_name, source_params=params)
+        workspace.progress = plugin_instance.progress = LoadProgress()
+
+        with self._load_lock:
+            pending = sum(not future.done() for _, future in self.loads.values())
+            if pending >= MAX_PENDING_LOADS:
+                raise RuntimeError(f"Previse ucitavanja je u toku ({pending}), pokusajte kasnije.")
+            if self._load_executor is None:
+                self._load_executor = ThreadPoolExecutor(max_workers=LOAD_WORKERS,
+                                                         thread_name_prefix="workspace-load")
+            self.workspace_manager.create_workspace(workspace)
+            future = self._load_executor.submit(self._load_workspace, workspace, plugin_instance, use_cache)
+            self.loads[workspace.id] = (workspace, future)
+        return workspace
+
+    def _load_workspace(self, workspace: Workspace, plugin_instance: DataSourcePlugin, use_cache: bool):
+        try:
+            # mozda je prekinuto dok je cekalo u redu
+            workspace.progress.check()
+            graph = self._load_graph(workspace.source_plugin, plugin_instance, workspace.source_params, use_cache)
+        except LoadCancelled:
+            workspace.status = Workspace.CANCELLED
+            self.workspace_manager.delete_workspace(workspace.id)
+            return
+        except Exception as e:
+            logger.exception(f"Ucitavanje workspace-a '{workspace.name}' nije uspelo")
+            workspace.status = Workspace.FAILED
+            workspace.error = str(e)
+            self.loads.pop(workspace.id, None)
+            return
+
+        workspace.set_loaded_graph(graph)
+        self.loads.pop(workspace.id, None)
+        # workspace je mozda obrisan dok se ucitavao
+        if self.workspace_manager.get_workspace(workspace.id) is workspace:
+            self.workspace_manager.set_active_workspace(workspace.id)
+            self.save_workspace(workspace)
+            self._share_indexes(workspace)
+            if self.search_index_enabled and workspace.search_index is None:
+                workspace.build_search_index_async()
+
+    def cancel_workspace_load(self, workspace_id: str) -> bool:
+        """Prekida ucitavanje; False ako se workspace ne ucitava (vec je ucitan ili ne postoji)."""
+        workspace, future = self.loads.get(workspace_id, (None, None))
+        if future is None or future.done():
+            return False
+        workspace.progress.cancel()
+        if future.cancel():
+            # nije ni pocelo: _load_workspace se nece pozvati
+            workspace.status = Workspace.CANCELLED
+            self.workspace_manager.delete_workspace(workspace_id)
+        return True
+
+    def get_load_progress(self, workspace_id: str) -> Optional[Dict[str, Any]]:
+        """Stanje ucitavanja workspace-a i procitani redovi/bajtovi; None ako workspace ne postoji."""
+        workspace = self.workspace_manager.get_workspace(workspace_id)
+        if workspace is None:
+            workspace = self.loads.get(workspace_id, (None, None))[0]
+        if workspace is None:
+            return None
+        info = {"id": workspace.id, "status": workspace.status, "error": workspace.error}
+        if workspace.progress is not None:
+            info.update(workspace.progress.to_dict())
+        return info
+
     def switch_workspace(self, workspace_id: str):
         self.workspace_manager.set_active_workspace(workspace_id)
+        if self.workspace_store is not None:
+            self.workspace_store.save_active(workspace_id)
 
     def delete_workspace(self, workspace_id: str):
+        self.cancel_workspace_load(workspace_id)
+        self.loads.pop(workspace_id, None)
         self.workspace_manager.delete_workspace(workspace_id)
+        if self.workspace_store is not None:
+            self.workspace_store.remove(workspace_id)
+            self.workspace_store.save_active(self.workspace_manager.active_workspace_id)
         
     def get_workspaces_info(self):
         return self.workspace_manager.get_all_workspaces()
 
     # --- GLAVNE OPERACIJE ---
 
-    def load_graph_from_source(self, plugin_name: str, params: Dict[str, Any]) -> Graph:
+    def load_graph_from_source(self, plugin_name: str, params: Dict[str, Any], use_cache: bool = True) -> Graph:
         # Wrapper zbog kompatibilnosti
-        ws = self.create_workspace(plugin_name, params)
+        ws = self.create_workspace(plugin_name, params, use_cache)
         return ws.current_graph
 
     def set_visualizer(self, visualizer: BaseVisualizer):
@@ -120,15 +359,63 @@ class GraphManager:
 
         return self.visualizer.render(graph_to_render)
     
+    # --- TAGOVI (search/filter) ---
+    # Svaki tag ima svoju bitset masku izracunatu nad initial_graph, a trenutni
+    # graf je pogled sa AND-om aktivnih maski. Dodavanje/uklanjanje taga je
+    # jedna bitset operacija + (lenja) indukcija ivica, bez ponovnog skeniranja.
+
+    def _compute_tag_mask(self, workspace: Workspace, key) -> int:
+        if key[0] == "search":
+            index = workspace.current_search_index() if self.search_index_enabled else None
+            return self.search_service.match_mask(workspace.initial_graph, key[1], index=index)
+        if key[0] == "query":
+            return self.filter_service.query_mask(workspace.initial_graph, key[1], index=workspace.attribute_index)
+        _, attribute, operator, value = key
+        return self.filter_service.match_mask(
+            workspace.initial_graph, attribute, operator, value, index=workspace.attribute_index
+        )
+
+    def _sync_tag_masks(self, workspace: Workspace):
+        """Ako je initial_graph izmenjen (CLI), maske aktivnih tagova se racunaju ponovo."""
+        version = workspace.initial_graph.version
+        if workspace.tag_masks_version == version:
+            return
+        following = workspace.follows_tags
+        workspace.tag_masks = {key: self._compute_tag_mask(workspace, key) for key in workspace.tag_masks}
+        workspace.tag_masks_version = version
+        if workspace.current_mask is not None and following:
+            workspace.apply_tag_masks()
+
+    def _add_tag(self, workspace: Workspace, key):
+        following = workspace.follows_tags
+        self._sync_tag_masks(workspace)
+        mask = workspace.tag_masks.get(key)
+        if mask is None:
+            mask = self._compute_tag_mask(workspace, key)
+        if following:
+            workspace.add_tag_mask(key, mask)
+            return
+        # trenutni graf nije samo rezultat tagova (CLI izmena ili CLI filter): tag se
+        # primenjuje na njega, a maska se cuva za uklanjanje taga (AND preostalih maski)
+        workspace.tag_masks[key] = mask
+        workspace.current_graph = self._apply_tag(workspace.current_graph, key)
+
+    def _apply_tag(self, graph: Graph, key) -> Graph:
+        if key[0] == "search":
+            return self.search_service.search(graph, key[1])
+        if key[0] == "query":
+            return self.filter_service.apply_query(graph, key[1])
+        _, attribute, operator, value = key
+        return self.filter_service.apply_filter(graph, attribute, operator, value)
+
     def apply_search(self, query: str) -> Graph:
         active_ws = self.workspace_manager.get_active_workspace()
         if not active_ws:
             raise RuntimeError("Nijedan workspace nije aktivan.")
 
-        result_graph = self.search_service.search(active_ws.current_graph, query)
-        
-        active_ws.current_graph = result_graph
+        self._add_tag(active_ws, Workspace.search_key(query))
         active_ws.active_searches.append(query)
+        self.save_workspace(active_ws)
         return active_ws.current_graph
     
     def apply_cli_command(self, query:str) -> Graph:
@@ -136,9 +423,22 @@ class GraphManager:
         if not active_ws:
             raise RuntimeError("Nijedan workspace nije aktivan.")
 
-        result_graph = self.cli_service.execute_command(active_ws.current_graph, query)
-        
-        active_ws.current_graph = result_graph
+        action = query.strip().split()[:1]
+        if action and action[0].lower() in MUTATING_COMMANDS and self.workspace_manager.sharing(active_ws):
+            # copy-on-write: ostali workspace-ovi zadrzavaju nepromenjen zajednicki graf
+            active_ws.detach_initial_graph()
+            self.sharing_stats["copies"] += 1
+
+        result = self.cli_service.execute_command(active_ws.current_graph, query, index=active_ws.attribute_index)
+
+        # komanda moze da vrati i recnik (greska, plan upita) sa grafom pod kljucem "graph"
+        if isinstance(result, dict):
+            active_ws.current_graph = result.get("graph", active_ws.current_graph)
+            self.save_workspace(active_ws)
+            return result
+
+        active_ws.current_graph = result
+        self.save_workspace(active_ws)
         return active_ws.current_graph
     
     def apply_filter(self, attribute: str, operator: str, value: Any) -> Graph:
@@ -146,20 +446,36 @@ class GraphManager:
         if not active_ws:
             raise RuntimeError("Nijedan workspace nije aktivan.")
 
-        result_graph = self.filter_service.apply_filter(
-            active_ws.current_graph, attribute, operator, value
-        )
-        
-        active_ws.current_graph = result_graph
+        self._add_tag(active_ws, Workspace.filter_key(attribute, operator, value))
         active_ws.active_filters.append({'attribute': attribute, 'operator': operator, 'value': value})
+        self.save_workspace(active_ws)
         return active_ws.current_graph
 
+    def apply_query(self, query: str) -> Graph:
+        """Filter zadat upitom (npr. "age > 30 AND (role == 'HR' OR score >= 50.5)") kao jedan tag."""
+        active_ws = self.workspace_manager.get_active_workspace()
+        if not active_ws:
+            raise RuntimeError("Nijedan workspace nije aktivan.")
+
+        self._add_tag(active_ws, Workspace.query_key(compile_query(query)))
+        active_ws.active_filters.append({'query': query})
+        self.save_workspace(active_ws)
+        return active_ws.current_graph
+
+    def explain_query(self, query: str) -> str:
+        active_ws = self.workspace_manager.get_active_workspace()
+        if not active_ws:
+            raise RuntimeError("Nijedan workspace nije aktivan.")
+
+        return self.filter_service.explain(active_ws.current_graph, query, index=active_ws.attribute_index)
+
     def reset_graph(self) -> Graph:
         active_ws = self.workspace_manager.get_active_workspace()
         if not active_ws:
             raise RuntimeError("Nijedan workspace nije aktivan.")
 
         active_ws.reset()
+        self.save_workspace(active_ws)
         return active_ws.current_graph
     
     def reset(self) -> Graph:
@@ -168,8 +484,22 @@ class GraphManager:
             raise RuntimeError("Nijedan workspace nije aktivan.")
 
         active_ws.reset_graph()
+        self.save_workspace(active_ws)
         return active_ws.current_graph
     
+    def get_filter_stats(self):
+        return dict(self.filter_service.stats)
+
+    def get_search_stats(self):
+        return dict(self.search_service.stats)
+
+    def get_cache_stats(self):
+        return dict(self._cache.stats)
+
+    def get_memory_stats(self):
+        wm = self.workspace_manager
+        return {"budget": wm.memory_budget, "used": wm.memory_usage(), **wm.stats, **self.sharing_stats}
+
     def get_applied_tags(self):
         active_ws = self.workspace_manager.get_active_workspace()
         return active_ws.active_searches, active_ws.active_filters
@@ -184,8 +514,26 @@ class GraphManager:
     
     def remove_search(self, search):
         active_ws = self.workspace_manager.get_active_workspace()
-        return active_ws.active_searches.remove(search)
+        active_ws.active_searches.remove(search)
+        self._remove_tag(active_ws, Workspace.search_key(search), search in active_ws.active_searches)
+        self.save_workspace(active_ws)
+        return active_ws.current_graph
     
     def remove_filter(self, filter):
         active_ws = self.workspace_manager.get_active_workspace()
-        return active_ws.active_filters.remove(filter)
\ No newline at end of file
+        active_ws.active_filters.remove(filter)
+        self._remove_tag(active_ws, Workspace.filter_tag_key(filter), filter in active_ws.active_filters)
+        self.save_workspace(active_ws)
+        return active_ws.current_graph
+
+    def _remove_tag(self, workspace: Workspace, key, still_applied: bool):
+        """
+        Trenutni graf se uvek gradi iznova iz preostalih maski, kao da su
+        preostali tagovi ponovo primenjeni na pocetni graf; maska ostaje ako je
+        isti tag primenjen vise puta.
+        """
+        self._sync_tag_masks(workspace)
+        if still_applied:
+            workspace.apply_tag_masks()
+        else:
+            workspace.remove_tag_mask(key)
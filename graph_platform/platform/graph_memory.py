@@ -0,0 +1,54 @@
+"""
+Procena memorije grafa, za budzet workspace-ova (`WorkspaceManager`).
+
+Velicina se racuna iz uzorka cvorova i ivica (sys.getsizeof objekta, recnika
+atributa i vrednosti) i mnozi brojem elemenata, uz fiksnu cenu hes indeksa
+po cvoru i po ivici (izmereno tracemalloc-om nad Graph-om). Procena je
+gruba, ali dovoljna da se uporede workspace-ovi i oceni budzet.
+"""
+import sys
+from typing import Sequence, Union
+
+from api.api.graph import Edge, Graph, Node
+from graph_platform.platform.graph_view import GraphView
+
+SAMPLE_SIZE = 1000
+# _node_index ulaz i mesto u listi
+NODE_INDEX_BYTES = 80
+# _edge_index (kljuc je tuple) i ulazi u _out/_in skupovima
+EDGE_INDEX_BYTES = 320
+
+
+def _sample(items: Sequence) -> Sequence:
+    step = max(1, len(items) // SAMPLE_SIZE)
+    return items[::step][:SAMPLE_SIZE]
+
+
+def _node_bytes(node: Node) -> int:
+    size = sys.getsizeof(node) + sys.getsizeof(node.__dict__) + sys.getsizeof(node.id)
+    if node.label is not node.id:
+        size += sys.getsizeof(node.label)
+    return size + sys.getsizeof(node.data) + sum(sys.getsizeof(v) for v in node.data.values())
+
+
+def _edge_bytes(edge: Edge) -> int:
+    # source i target su isti stringovi kao id-jevi cvorova
+    return (sys.getsizeof(edge) + sys.getsizeof(edge.__dict__) + sys.getsizeof(edge.weight)
+            + sys.getsizeof(edge.data) + sum(sys.getsizeof(v) for v in edge.data.values()))
+
+
+def graph_bytes(graph: Union[Graph, GraphView]) -> int:
+    """Procena bajtova koje graf drzi; nematerijalizovan pogled deli cvorove sa osnovnim grafom."""
+    if isinstance(graph, GraphView):
+        if graph._graph is None:
+            return sys.getsizeof(graph.mask)
+        graph = graph._graph
+    nodes, edges = graph.nodes, graph.edges
+    total = 0
+    if nodes:
+        sample = _sample(nodes)
+        total += len(nodes) * (sum(map(_node_bytes, sample)) // len(sample) + NODE_INDEX_BYTES)
+    if edges:
+        sample = _sample(edges)
+        total += len(edges) * (sum(map(_edge_bytes, sample)) // len(sample) + EDGE_INDEX_BYTES)
+    return total
@@ -0,0 +1,175 @@
+from typing import List, Optional, Sequence, Tuple, Union
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform import bitset
+from graph_platform.platform.induction import induce_edges
+
+
+class GraphView:
+    """
+    Podgraf bez kopiranja: osnovni graf + bitset maska cvorova.
+
+    Cvorovi se citaju iz osnovnog grafa (isti Node objekti), a ivice se
+    indukuju tek kada ih neko zatrazi. Pogled nad pogledom ne pravi lanac,
+    vec presek maski nad istim osnovnim grafom.
+
+    Pogled se ponasa kao Graph za citanje (nodes, edges, to_dict, ...).
+    Prva izmena (add_node, edit_node, dodela `nodes`, ...) ga materijalizuje
+    u pravi Graph i od tada sve operacije idu na taj graf.
+    """
+
+    def __init__(self, parent: Union[Graph, "GraphView"], mask: int, name: str = None):
+        if isinstance(parent, GraphView) and parent._graph is None:
+            base = parent.base
+            mask &= parent.mask
+        else:
+            base, _ = view_source(parent)
+        self.base: Graph = base
+        self.mask = mask
+        self.name = name if name is not None else parent.name
+        self.directed = parent.directed
+        self._graph: Optional[Graph] = None
+        self._indices: Optional[List[int]] = None
+        self._nodes: Optional[List[Node]] = None
+        self._edges: Optional[List[Edge]] = None
+
+    # --- citanje ---
+
+    def node_indices(self) -> List[int]:
+        """Indeksi izabranih cvorova u osnovnom grafu."""
+        if self._indices is None:
+            self._indices = bitset.indices(self.mask)
+        return self._indices
+
+    def source(self) -> Tuple[Graph, Sequence[int]]:
+        """(graf, indeksi cvorova u njemu) nad kojima se racunaju nove maske."""
+        if self._graph is not None:
+            return self._graph, range(len(self._graph.nodes))
+        return self.base, self.node_indices()
+
+    @property
+    def nodes(self) -> List[Node]:
+        if self._graph is not None:
+            return self._graph.nodes
+        if self._nodes is None:
+            base_nodes = self.base.nodes
+            self._nodes = [base_nodes[i] for i in self.node_indices()]
+        return self._nodes
+
+    @nodes.setter
+    def nodes(self, nodes: List[Node]):
+        self.materialize().nodes = nodes
+
+    @property
+    def edges(self) -> List[Edge]:
+        if self._graph is not None:
+            return self._graph.edges
+        if self._edges is None:
+            self._edges = induce_edges(self.base, self.node_indices())
+        return self._edges
+
+    @edges.setter
+    def edges(self, edges: List[Edge]):
+        self.materialize().edges = edges
+
+    @property
+    def version(self) -> int:
+        return self._graph.version if self._graph is not None else self.base.version
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "directed": self.directed,
+            "nodes": [n.to_dict() for n in self.nodes],
+            "edges": [e.to_dict() for e in self.edges],
+        }
+
+    def _selected(self, node_id) -> bool:
+        i = self.base.index_of(node_id)
+        return i is not None and bool(self.mask >> i & 1)
+
+    def index_of(self, node_id) -> Optional[int]:
+        if self._graph is not None:
+            return self._graph.index_of(node_id)
+        return self.base.index_of(node_id) if self._selected(node_id) else None
+
+    def has_node(self, node_id) -> bool:
+        if self._graph is not None:
+            return self._graph.has_node(node_id)
+        return self._selected(node_id)
+
+    def get_node(self, node_id) -> Optional[Node]:
+        if self._graph is not None:
+            return self._graph.get_node(node_id)
+        return self.base.get_node(node_id) if self._selected(node_id) else None
+
+    def has_edge(self, source, target) -> bool:
+        if self._graph is not None:
+            return self._graph.has_edge(source, target)
+        return self._selected(source) and self._selected(target) and self.base.has_edge(source, target)
+
+    def get_edge(self, source, target) -> Optional[Edge]:
+        if self._graph is not None:
+            return self._graph.get_edge(source, target)
+        return self.base.get_edge(source, target) if self.has_edge(source, target) else None
+
+    def successors(self, node_id):
+        if self._graph is not None:
+            return self._graph.successors(node_id)
+        if not self._selected(node_id):
+            return set()
+        return {t for t in self.base.successors(node_id) if self._selected(t)}
+
+    def predecessors(self, node_id):
+        if self._graph is not None:
+            return self._graph.predecessors(node_id)
+        if not self._selected(node_id):
+            return set()
+        return {s for s in self.base.predecessors(node_id) if self._selected(s)}
+
+    # --- izmene (materijalizuju pogled) ---
+
+    def materialize(self) -> Graph:
+        if self._graph is None:
+            self._graph = Graph(name=self.name, directed=self.directed, nodes=self.nodes, edges=self.edges)
+            self._nodes = self._edges = self._indices = None
+        return self._graph
+
+    def add_node(self, node: Node) -> bool:
+        return self.materialize().add_node(node)
+
+    def add_edge(self, edge: Edge) -> bool:
+        return self.materialize().add_edge(edge)
+
+    def edit_node(self, node_id, **properties):
+        # Node objekti su zajednicki sa osnovnim grafom, a skup cvorova se ne menja,
+        # pa izmena atributa ide kroz osnovni graf (i uvecava njegovu verziju)
+        if self._graph is None:
+            if not self._selected(node_id):
+                print(f"Node {node_id} does not exist!")
+                return
+            return self.base.edit_node(node_id, **properties)
+        result = self._graph.edit_node(node_id, **properties)
+        # materijalizovan graf i dalje deli Node objekte sa osnovnim grafom
+        node = self._graph.get_node(node_id)
+        if node is not None and node is self.base.get_node(node_id):
+            self.base.node_changed(node_id)
+        return result
+
+    def delete_node(self, node_id) -> bool:
+        return self.materialize().delete_node(node_id)
+
+    def edit_edge(self, edge_id, **properties):
+        return self.materialize().edit_edge(edge_id, **properties)
+
+    def delete_edge(self, edge_id) -> bool:
+        return self.materialize().delete_edge(edge_id)
+
+    def clear_graph(self):
+        self.materialize().clear_graph()
+
+
+def view_source(graph: Union[Graph, GraphView]) -> Tuple[Graph, Sequence[int]]:
+    """Za Graph ili GraphView vraca (osnovni graf, indeksi cvorova koje treba posmatrati)."""
+    if isinstance(graph, GraphView):
+        return graph.source()
+    return graph, range(len(graph.nodes))
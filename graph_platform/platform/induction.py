@@ -0,0 +1,90 @@
+"""
+Indukcija ivica podgrafa: ivice grafa ciji su oba kraja u zadatom skupu cvorova.
+
+Dva nacina:
+  - "adjacency": obilazi se samo izlazna CSR lista izabranih cvorova,
+    cena ~ broj izabranih cvorova + zbir njihovih izlaznih stepena,
+  - "scan": jedan prolaz kroz sve ivice grafa, cena ~ M.
+
+`choose_strategy` bira jeftiniji na osnovu procene cene. Pravljenje CSR-a je
+jednokratno po verziji grafa ali skuplje od jednog prolaza; dok CSR ne
+postoji, prolazi se kroz ivice, a CSR se pravi tek kada zbir procenjenih
+usteda koje bi obilazak susedstva doneo dostigne cenu pravljenja (kao kod
+"ski rental" problema).
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from weakref import WeakKeyDictionary
+from api.api.graph import Graph, Edge
+
+# Procena cene po jedinici posla u sekundama (izmereno sa benchmarks/bench_induction.py)
+ADJACENCY_NODE_COST = 0.15e-6
+ADJACENCY_EDGE_COST = 0.25e-6
+ADJACENCY_EMIT_COST = 0.4e-6
+SCAN_EDGE_COST = 0.085e-6
+SCAN_EMIT_COST = 0.8e-6
+CSR_BUILD_EDGE_COST = 2.5e-6
+
+STRATEGIES = ("adjacency", "scan")
+
+# graf -> (verzija, procenjena cena prolaza potrosenih dok CSR nije postojao)
+_scan_spent: "WeakKeyDictionary[Graph, Tuple[int, float]]" = WeakKeyDictionary()
+
+
+def estimate_costs(graph: Graph, node_indices: List[int]) -> Dict[str, float]:
+    """Procenjena cena (u sekundama) oba nacina, bez pravljenja CSR-a."""
+    node_count, edge_count = len(graph.nodes), len(graph.edges)
+    selected = len(node_indices)
+    if not node_count or not edge_count:
+        return {"adjacency": 0.0, "scan": 0.0, "csr_build": 0.0}
+
+    fraction = selected / node_count
+    if graph.csr_ready("out") and selected * 8 < node_count:
+        # za uske upite tacan zbir stepena (bitno kod neravnomernih stepena)
+        offsets = graph.csr("out")[0]
+        degree_sum = sum(offsets[i + 1] - offsets[i] for i in node_indices)
+    else:
+        degree_sum = edge_count * fraction
+    # ocekivan broj ivica sa oba kraja u skupu (za nasumican izbor cvorova)
+    found = degree_sum * fraction
+
+    return {
+        "adjacency": selected * ADJACENCY_NODE_COST + degree_sum * ADJACENCY_EDGE_COST + found * ADJACENCY_EMIT_COST,
+        "scan": edge_count * SCAN_EDGE_COST + found * SCAN_EMIT_COST,
+        "csr_build": 0.0 if graph.csr_ready("out") else edge_count * CSR_BUILD_EDGE_COST,
+    }
+
+
+def choose_strategy(graph: Graph, node_indices: List[int]) -> str:
+    costs = estimate_costs(graph, node_indices)
+    if costs["adjacency"] >= costs["scan"]:
+        return "scan"
+    if not costs["csr_build"]:
+        return "adjacency"
+
+    version, spent = _scan_spent.get(graph, (graph.version, 0.0))
+    if version != graph.version:
+        spent = 0.0
+    if spent + costs["scan"] - costs["adjacency"] >= costs["csr_build"]:
+        _scan_spent.pop(graph, None)
+        return "adjacency"
+    _scan_spent[graph] = (graph.version, spent + costs["scan"] - costs["adjacency"])
+    return "scan"
+
+
+def induce_edges(graph: Graph, node_indices: Iterable[int], strategy: Optional[str] = None) -> List[Edge]:
+    """
+    Ivice izmedju cvorova sa zadatim indeksima (pozicije u `graph.nodes`),
+    u redosledu iz `graph.edges`. Bez `strategy` nacin se bira po ceni.
+    """
+    node_indices = list(node_indices)
+    if strategy is None:
+        strategy = choose_strategy(graph, node_indices)
+    elif strategy not in STRATEGIES:
+        raise ValueError(f"Nepoznata strategija: {strategy}")
+
+    if strategy == "adjacency":
+        return graph.induced_edges(node_indices)
+
+    nodes = graph.nodes
+    ids = {nodes[i].id for i in node_indices}
+    return [e for e in graph.edges if e.source in ids and e.target in ids]
@@ -1,44 +1,78 @@
-from api.api.graph import Graph, Node
-from datetime import date, datetime
+from bisect import bisect_right
+from typing import List, Sequence
+from api.api.graph import Graph, Node, SEARCH_FIELD_SEPARATOR, SEARCH_NODE_SEPARATOR, search_fields
+from graph_platform.platform import bitset
+from graph_platform.platform.graph_view import GraphView, view_source
+
+
+def node_matches(node: Node, query_lower: str) -> bool:
+    return any(query_lower in field for field in search_fields(node))
+
 
 class SearchService:
     """
     Pretraga nad grafom: pretrazujemo label, nazive atributa i vrednosti atributa.
     """
-    def search(self, graph: Graph, query: str) -> Graph:
+    def __init__(self):
+        # koliko pretraga je odgovoreno iz trigram indeksa, a koliko punim prolazom
+        self.stats = {"index_hits": 0, "full_scans": 0}
+
+    def search(self, graph: Graph, query: str, index=None) -> Graph:
         if not query:
             return graph 
 
-        query_lower = query.lower()
-        matched_nodes = []
+        mask = self.match_mask(graph, query, index)
+        return GraphView(graph, mask, name=f"{graph.name} (search)")
 
-        for node in graph.nodes:
-            for key, value in node.data.items():
+    def match_mask(self, graph: Graph, query: str, index=None) -> int:
+        """
+        Bitset cvorova (indeksi osnovnog grafa) koji sadrze upit.
+        Ako je prosledjen aktuelan TrigramIndex nad osnovnim grafom i upit ima
+        bar 3 karaktera, kandidati dolaze iz indeksa i samo oni se proveravaju.
+        """
+        query_lower = query.lower()
+        base, candidates = view_source(graph)
+        base_nodes = base.nodes
 
-                if key.lower() == "id":
-                    continue
+        if index is not None and index.graph is base:
+            found = index.search(query_lower)
+            if found is not None:
+                self.stats["index_hits"] += 1
+                mask = bitset.from_indices(found, len(base_nodes))
+                if isinstance(graph, GraphView) and graph.base is base:
+                    mask &= graph.mask
+                return mask
 
-                if query_lower in key.lower():
-                    matched_nodes.append(node)
-                    break
+        self.stats["full_scans"] += 1
+        return bitset.from_indices(scan(base, candidates, query_lower), len(base_nodes))
 
-                if isinstance(value, (str, int, float)):
-                    if query_lower in str(value).lower():
-                        matched_nodes.append(node)
-                        break
 
-                elif isinstance(value, (date, datetime)):
-                    if query_lower in value.isoformat().lower():
-                        matched_nodes.append(node)
-                        break
+def scan(graph: Graph, candidates: Sequence[int], query_lower: str) -> List[int]:
+    """
+    Pun prolaz nad kesiranim tekstovima cvorova (Graph.search_blob).
+    Kada se gledaju svi cvorovi, trazi se kroz jedan spojen bafer, a pogoci
+    se preko tabele pocetaka vracaju na indekse cvorova.
+    """
+    if SEARCH_FIELD_SEPARATOR in query_lower or SEARCH_NODE_SEPARATOR in query_lower:
+        # separator u upitu bi mogao da spoji dva polja - proveravamo polje po polje
+        nodes = graph.nodes
+        return [i for i in candidates if node_matches(nodes[i], query_lower)]
 
-        new_graph = Graph(name=f"{graph.name} (search)", directed=graph.directed)
-        new_graph.nodes = matched_nodes
+    if not candidates:
+        return []
 
-        node_ids = {n.id for n in matched_nodes}
-        new_graph.edges = [
-            e for e in graph.edges
-            if e.source in node_ids and e.target in node_ids
-        ]
+    if len(candidates) < len(graph.nodes):
+        blob = graph.search_blob
+        return [i for i in candidates if query_lower in blob(i)]
 
-        return new_graph
+    buffer, starts = graph.search_buffer()
+    matched = []
+    find, count = buffer.find, len(starts)
+    pos = find(query_lower)
+    while pos != -1:
+        i = bisect_right(starts, pos) - 1
+        matched.append(i)
+        if i + 1 >= count:
+            break
+        pos = find(query_lower, starts[i + 1])
+    return matched
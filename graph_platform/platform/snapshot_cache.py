@@ -0,0 +1,152 @@
+"""
+Disk kes ucitanih grafova (snapshot), da se isti izvor ne parsira ponovo.
+
+Kljuc je otisak izvora: ime plugina, apsolutna putanja, velicina i vreme
+izmene fajla i hes parametara (parametri koji su putanje do fajlova, npr.
+sema, ulaze sa svojom velicinom i vremenom izmene). Graf se cuva u binarnom
+formatu (`graph_binary`), pa se pri pogotku cita bez parsiranja teksta.
+
+Velicina kesa je ogranicena: posle upisa se brisu najdavnije korisceni
+snapshot-i (vreme izmene snapshot fajla se osvezava pri svakom pogotku).
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from api.api.graph import Graph
+from api.api.graph_binary import VERSION, read_graph, write_graph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 2 << 30
+SUFFIX = ".graph"
+
+
+def default_directory() -> str:
+    """GRAPH_SNAPSHOT_DIR ili ~/.cache/graph_platform/snapshots."""
+    return os.environ.get("GRAPH_SNAPSHOT_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "graph_platform", "snapshots"
+    )
+
+
+class SnapshotCache:
+
+    def __init__(self, directory: str = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory or default_directory()
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0}
+
+    # --- kljuc ---
+
+    @staticmethod
+    def _fingerprint(path: str) -> Tuple[str, int, int]:
+        info = os.stat(path)
+        return os.path.abspath(path), info.st_size, info.st_mtime_ns
+
+    def key(self, plugin_name: str, params: Dict[str, Any]) -> Optional[str]:
+        """Kljuc snapshot-a ili None ako izvor nije obican fajl (nema sta da se kesira)."""
+        path = params.get("path")
+        if not isinstance(path, str) or not os.path.isfile(path):
+            return None
+        files = {
+            name: self._fingerprint(value) for name, value in params.items()
+            if name != "path" and isinstance(value, str) and os.path.isfile(value)
+        }
+        params_hash = hashlib.sha256(
+            json.dumps([params, files], sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+        fingerprint = [VERSION, plugin_name, *self._fingerprint(path), params_hash]
+        return hashlib.sha256(json.dumps(fingerprint).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + SUFFIX)
+
+    # --- citanje i upis ---
+
+    def get(self, key: str) -> Optional[Graph]:
+        path = self._path(key)
+        try:
+            graph = read_graph(path)
+        except FileNotFoundError:
+            self.stats["misses"] += 1
+            return None
+        except Exception as e:
+            # ostecen ili nedovrsen snapshot se tretira kao promasaj
+            logger.warning(f"Snapshot {path} nije citljiv, brise se: {e}")
+            self._remove(path)
+            self.stats["misses"] += 1
+            return None
+        try:
+            os.utime(path)  # najskorije koriscen
+        except OSError:
+            pass
+        self.stats["hits"] += 1
+        return graph
+
+    def put(self, key: str, graph: Graph) -> bool:
+        """Upisuje snapshot; vraca False ako graf ne moze da se zapise (kes se tada preskace)."""
+        if type(graph) is not Graph:
+            return False
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            write_graph(graph, self._path(key))
+        except Exception as e:
+            logger.warning(f"Snapshot grafa nije upisan: {e}")
+            return False
+        self._evict()
+        return True
+
+    def load(self, plugin_name: str, params: Dict[str, Any], parse: Callable[[], Graph]) -> Graph:
+        """Graf iz kesa ako je izvor nepromenjen, inace `parse()` i upis snapshot-a."""
+        key = self.key(plugin_name, params)
+        if key is None:
+            return parse()
+        graph = self.get(key)
+        if graph is None:
+            graph = parse()
+            self.put(key, graph)
+        return graph
+
+    # --- velicina ---
+
+    def entries(self) -> List[Tuple[int, int, str]]:
+        """(poslednje koriscenje, velicina, putanja) za svaki snapshot, od najdavnije koriscenog."""
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return entries
+        for name in names:
+            if name.endswith(SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    info = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((info.st_mtime_ns, info.st_size, path))
+        return sorted(entries)
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def _evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    def clear(self):
+        for _, _, path in self.entries():
+            self._remove(path)
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
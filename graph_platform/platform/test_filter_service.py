@@ -0,0 +1,109 @@
+import random
+import unittest
+from datetime import datetime
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform import bitset
+from graph_platform.platform.attribute_index import AttributeIndex
+from graph_platform.platform.filter_query import QuerySyntaxError, compile_query
+from graph_platform.platform.filter_service import FilterService
+
+
+class TestFilterServiceIndex(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(3)
+        self.graph = Graph(name="G")
+        for i in range(300):
+            data = {
+                "age": rnd.choice([rnd.randrange(10, 90), float(rnd.randrange(10, 90)), str(rnd.randrange(10, 90)), None]),
+                "role": rnd.choice(["HR", "Dev", "QA"]),
+                "joined": datetime(2020, 1, 1 + rnd.randrange(28)),
+                "tags": rnd.choice([["a"], ["b"], "a"]),
+            }
+            if rnd.random() < 0.2:
+                del data["role"]
+            self.graph.add_node(Node(id=str(i), data=data))
+        self.service = FilterService()
+
+    def test_index_matches_full_scan(self):
+        queries = [
+            ("age", op, value)
+            for op in FilterService.OPERATORS
+            for value in ["30", "30.0", "50.5", "abc"]
+        ] + [
+            ("role", "==", "HR"), ("role", "!=", "HR"), ("role", ">=", "Dev"),
+            ("joined", ">", "2020-01-10"), ("joined", "<=", "2020-01-03"),
+            ("tags", "==", "a"), ("tags", "!=", "a"), ("missing", "==", "1"),
+        ]
+        # deklarisani tipovi ne menjaju rezultat ni kad vrednosti nisu svih tog tipa
+        for schema in [{}, {"age": "int", "role": "str", "joined": "date", "tags": "str"}]:
+            self.graph.schema = schema
+            index = AttributeIndex(self.graph)
+            for attribute, operator, value in queries:
+                with self.subTest(schema=schema, attribute=attribute, operator=operator, value=value):
+                    scanned = self.service.match_mask(self.graph, attribute, operator, value)
+                    indexed = self.service.match_mask(self.graph, attribute, operator, value, index=index)
+                    self.assertEqual(bitset.indices(indexed), bitset.indices(scanned))
+        self.assertEqual(self.service.stats, {"index_hits": 2 * len(queries), "full_scans": 2 * len(queries)})
+
+    def test_edges_without_node_are_dropped(self):
+        nodes = [Node(id=str(i), data={"age": i}) for i in range(5000)]
+        edges = [Edge(source=str(i), target=str(i + 1)) for i in range(4999)] + [Edge(source="0", target="ghost")]
+        with self.assertLogs("api.api.graph", "WARNING"):
+            graph = Graph(nodes=nodes, edges=edges)
+        # ponovljeni filteri u nekom trenutku prave CSR za indukciju ivica
+        for _ in range(40):
+            result = self.service.apply_filter(graph, "age", "<", "3")
+            self.assertEqual([(e.source, e.target) for e in result.edges], [("0", "1"), ("1", "2")])
+
+    def test_view_results_are_intersected(self):
+        index = AttributeIndex(self.graph)
+        view = self.service.apply_filter(self.graph, "role", "==", "HR")
+        narrowed = self.service.apply_filter(view, "age", ">", "40", index=index)
+        expected = [n.id for n in view.nodes if type(n.data.get("age")) is int and n.data["age"] > 40]
+        self.assertEqual([n.id for n in narrowed.nodes], expected)
+
+    def test_stale_index_falls_back_to_scan(self):
+        index = AttributeIndex(self.graph)
+        self.graph.edit_node("0", role="Ops")
+        self.assertFalse(index.is_current())
+        mask = self.service.match_mask(self.graph, "role", "==", "Ops", index=index)
+        self.assertEqual(bitset.indices(mask), [0])
+        self.assertEqual(self.service.stats, {"index_hits": 0, "full_scans": 1})
+
+
+    def test_query_index_and_single_pass_agree(self):
+        index = AttributeIndex(self.graph)
+        queries = [
+            "age > 30 AND (role == 'HR' OR age <= 20.0)",
+            "NOT role = Dev AND joined >= 2020-01-15",
+            "tags == a OR NOT (age != '42')",
+            'role == "QA" AND NOT role == "QA"',
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                scanned = self.service.query_mask(self.graph, query)
+                indexed = self.service.query_mask(self.graph, query, index=index)
+                self.assertEqual(bitset.indices(indexed), bitset.indices(scanned))
+        self.assertEqual(self.service.stats, {"index_hits": len(queries), "full_scans": len(queries)})
+
+        # jedno poredjenje daje isto sto i obican filter
+        self.assertEqual(self.service.query_mask(self.graph, "age>=50"),
+                         self.service.match_mask(self.graph, "age", ">=", "50"))
+
+    def test_query_explain_and_syntax_errors(self):
+        query = compile_query("age>30 and (role=='HR' or role=='QA')")
+        self.assertEqual(str(query), "age > 30 AND (role == 'HR' OR role == 'QA')")
+
+        plan = self.service.explain(self.graph, query, index=AttributeIndex(self.graph))
+        self.assertTrue(plan.startswith("strategy: attribute index"))
+        self.assertIn("    OR\n      role == 'HR'  [index lookup: 74 nodes]", plan)
+        self.assertTrue(self.service.explain(self.graph, query).startswith("strategy: single pass over 300 nodes"))
+
+        for bad in ["", "age >", "age > 30 AND", "(age > 30", "age ! 3", "age > 30 role == 'HR'"]:
+            with self.subTest(query=bad):
+                self.assertRaises(QuerySyntaxError, compile_query, bad)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,262 @@
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from api.api.graph import Graph, Node, Edge
+from api.api.columnar_graph import ColumnarGraph
+from graph_platform.platform.graph_manager import GraphManager
+from graph_platform.platform.graph_view import GraphView
+from graph_platform.platform.snapshot_cache import SnapshotCache
+from graph_platform.platform.workspace import Workspace
+
+
+class TestTagPipeline(unittest.TestCase):
+
+    def setUp(self):
+        GraphManager._instance = None
+        self.manager = GraphManager()
+
+        graph = Graph(name="G")
+        for i in range(10):
+            graph.add_node(Node(id=f"N{i}", label=f"N{i}", data={"age": 20 + 5 * i, "role": "HR" if i % 2 else "Dev"}))
+        for i in range(9):
+            graph.add_edge(Edge(source=f"N{i}", target=f"N{i + 1}"))
+        self.graph = graph
+
+        self.workspace = Workspace(name="test", original_graph=graph, source_plugin="test", source_params={})
+        self.manager.workspace_manager.create_workspace(self.workspace)
+        self.manager.switch_workspace(self.workspace.id)
+
+    def tearDown(self):
+        GraphManager._instance = None
+
+    def ids(self):
+        return [n.id for n in self.workspace.current_graph.nodes]
+
+    def test_tags_are_anded(self):
+        self.manager.apply_filter("age", ">", "30")
+        self.manager.apply_search("hr")
+        self.assertEqual(self.ids(), ["N3", "N5", "N7", "N9"])
+        self.assertIs(self.workspace.current_graph.base, self.graph)
+        self.assertEqual(len(self.workspace.tag_masks), 2)
+
+    def test_remove_tag_does_not_replay(self):
+        self.manager.apply_filter("age", ">", "30")
+        self.manager.apply_search("hr")
+
+        calls = []
+        original = self.manager.filter_service.match_mask
+        self.manager.filter_service.match_mask = lambda *args: calls.append(args) or original(*args)
+
+        self.manager.remove_search("hr")
+        self.assertEqual(self.ids(), [f"N{i}" for i in range(3, 10)])
+        self.assertEqual(calls, [])
+
+        self.manager.remove_filter({'attribute': "age", 'operator': ">", 'value': "30"})
+        self.assertIs(self.workspace.current_graph, self.graph)
+
+    def test_tag_after_cli_applies_to_current_graph(self):
+        self.manager.apply_filter("age", ">", "25")
+        self.manager.apply_cli_command("create node --id=NEW role=HR age=99")
+        self.manager.apply_search("hr")
+        self.assertEqual(self.ids(), ["N3", "N5", "N7", "N9", "NEW"])
+
+        self.manager.reset_graph()
+        self.manager.apply_cli_command("filter age > 60")
+        self.manager.apply_filter("role", "==", "HR")
+        self.assertEqual(self.ids(), ["N9"])
+
+    def test_removing_duplicate_tag_rebuilds_graph(self):
+        self.manager.apply_search("hr")
+        self.manager.apply_search("hr")
+        self.manager.apply_cli_command("clear")
+        self.manager.remove_search("hr")
+        self.assertEqual(self.ids(), ["N1", "N3", "N5", "N7", "N9"])
+
+        # cvor napravljen CLI-jem nad filtriranim pogledom nestaje i kad je filter dupliran
+        self.manager.remove_search("hr")
+        self.manager.apply_filter("age", ">", "60")
+        self.manager.apply_filter("age", ">", "60")
+        self.manager.apply_cli_command("create node --id=NEW age=1")
+        self.manager.remove_filter({'attribute': "age", 'operator': ">", 'value': "60"})
+        self.assertEqual(self.ids(), ["N9"])
+
+    def test_cli_addresses_integer_ids(self):
+        # @id iz JSON-a moze biti int, a id u komandi je uvek string
+        self.graph.add_node(Node(id=7, label="seven"))
+        self.graph.add_node(Node(id=8, label="eight"))
+        self.graph.add_edge(Edge(source=7, target=8))
+        self.manager.apply_cli_command("edit node --id=7 role=QA")
+        self.assertEqual(self.graph.get_node(7).data, {"role": "QA"})
+        self.manager.apply_cli_command("delete edge 7 8")
+        self.assertFalse(self.graph.has_edge(7, 8))
+        self.manager.apply_cli_command("delete node --id=8")
+        self.assertFalse(self.graph.has_node(8))
+
+    def test_masks_recomputed_after_initial_graph_changes(self):
+        self.manager.apply_search("hr")
+        self.manager.apply_filter("age", ">", "60")
+        self.assertEqual(self.ids(), ["N9"])
+
+        self.graph.edit_node("N8", role="HR")
+        self.manager.remove_filter({'attribute': "age", 'operator': ">", 'value': "60"})
+        self.manager.apply_filter("age", ">", "55")
+        self.assertEqual(self.ids(), ["N8", "N9"])
+
+    def test_query_tag_and_cli_filter(self):
+        self.manager.apply_query("age > 30 AND (role == 'HR' OR age >= 60)")
+        self.assertEqual(self.ids(), ["N3", "N5", "N7", "N8", "N9"])
+        self.manager.apply_search("hr")
+        self.manager.remove_filter({'query': "age > 30 AND (role == 'HR' OR age >= 60)"})
+        self.assertEqual(self.ids(), ["N1", "N3", "N5", "N7", "N9"])
+
+        result = self.manager.apply_cli_command("filter --explain age<40 OR NOT role=='HR'")
+        self.assertIn("OR\n    age < 40", result["explain"])
+        self.manager.apply_cli_command("filter age<40 OR NOT role=='HR'")
+        self.assertEqual(self.ids(), ["N1", "N3"])
+
+
+class TestSharedGraphs(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        GraphManager._instance = None
+        self.manager = GraphManager()
+        self.manager.search_index_enabled = False
+        self.manager._cache = SnapshotCache(os.path.join(self.directory.name, "cache"))
+        self.path = os.path.join(self.directory.name, "graph.csv")
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("id,target,age\n" + "".join(f"n{i},n{i + 1},{i}\n" for i in range(100)))
+        self.tabs = [self.manager.create_workspace("CSV Data Source", {"path": self.path}) for _ in range(3)]
+
+    def tearDown(self):
+        GraphManager._instance = None
+
+    def test_same_source_shares_one_graph(self):
+        graph = self.tabs[0].initial_graph
+        self.assertTrue(all(ws.initial_graph is graph for ws in self.tabs))
+        self.assertEqual(self.manager.get_memory_stats()["shared_loads"], 2)
+        self.assertEqual(self.manager.workspace_manager.memory_usage(), self.tabs[0].memory_bytes())
+
+    def test_cli_mutation_copies_shared_graph(self):
+        first, second, third = self.tabs
+        graph = first.initial_graph
+        self.manager.switch_workspace(second.id)
+        self.manager.apply_filter("age", "<", "10")
+        self.manager.apply_cli_command("edit node --id=n1 role=HR")
+        self.assertIsNot(second.initial_graph, graph)
+        self.assertEqual(second.current_graph.get_node("n1").data["role"], "HR")
+        self.assertEqual(len(second.current_graph.nodes), 10)
+        self.assertNotIn("role", graph.get_node("n1").data)
+        self.assertIs(third.initial_graph, graph)
+
+        # filter ne menja graf, pa se ne kopira
+        self.manager.switch_workspace(third.id)
+        self.manager.apply_cli_command("filter age > 50")
+        self.assertIs(third.initial_graph, graph)
+        self.manager.apply_cli_command("clear")
+        self.assertEqual(len(graph.nodes), 101)
+        self.assertEqual(self.manager.get_memory_stats()["copies"], 2)
+
+        # jedini vlasnik menja graf na mestu, a novi workspace ga vise ne deli
+        self.manager.switch_workspace(first.id)
+        self.manager.apply_cli_command("create node --id=x")
+        self.assertIs(first.initial_graph, graph)
+        self.assertEqual(self.manager.get_memory_stats()["copies"], 2)
+        self.assertIsNot(self.manager.create_workspace("CSV Data Source", {"path": self.path}).initial_graph, graph)
+
+    def test_materialized_view_follows_copy(self):
+        first, second, _ = self.tabs
+        graph = first.initial_graph
+        self.manager.switch_workspace(second.id)
+        self.manager.apply_filter("age", "<", "10")
+        second.current_graph.materialize()
+        self.manager.apply_cli_command("edit node --id=n1 role=HR")
+
+        view = second.current_graph
+        self.assertIsInstance(view, GraphView)
+        self.assertIs(view.base, second.initial_graph)
+        self.assertIs(view.get_node("n1"), second.initial_graph.get_node("n1"))
+        self.assertEqual(second.initial_graph.get_node("n1").data["role"], "HR")
+        self.assertNotIn("role", graph.get_node("n1").data)
+        # izmena materijalizovanog pogleda se javlja kopiji (indeksi i tekst za pretragu)
+        version = second.initial_graph.version
+        self.manager.apply_cli_command("edit node --id=n2 role=QA")
+        self.assertGreater(second.initial_graph.version, version)
+
+    def test_columnar_storage(self):
+        self.manager.graph_storage = "columnar"
+        parsed = self.manager.create_workspace("CSV Data Source", {"path": self.path}, use_cache=False)
+        # snapshot iz setUp-a se cita kao objektni graf i pretvara u kolone
+        cached = self.manager.create_workspace("CSV Data Source", {"path": self.path})
+        for ws in (parsed, cached):
+            self.assertIsInstance(ws.initial_graph, ColumnarGraph)
+            self.assertEqual(ws.initial_graph.to_dict(), self.tabs[0].initial_graph.to_dict())
+        self.assertIs(self.manager.create_workspace("CSV Data Source", {"path": self.path}).initial_graph,
+                      cached.initial_graph)
+
+        self.manager.switch_workspace(cached.id)
+        self.manager.apply_filter("age", "<", "10")
+        self.manager.apply_search("n1")
+        self.assertEqual([n.id for n in cached.current_graph.nodes], ["n1"])
+        self.manager.apply_cli_command("edit node --id=n1 role=HR")
+        self.assertEqual(cached.current_graph.get_node("n1").data["role"], "HR")
+        self.assertIsInstance(cached.initial_graph, ColumnarGraph)
+
+
+class TestAsyncLoading(unittest.TestCase):
+
+    def setUp(self):
+        GraphManager._instance = None
+        self.manager = GraphManager()
+        self.manager.search_index_enabled = False
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False, encoding="utf-8") as f:
+            f.write("id,target\n" + "".join(f"n{i},n{i + 1}\n" for i in range(100)))
+        self.addCleanup(os.remove, f.name)
+        self.path = f.name
+
+    def tearDown(self):
+        if self.manager._load_executor is not None:
+            self.manager._load_executor.shutdown(wait=True)
+        GraphManager._instance = None
+
+    def test_workspace_is_returned_before_graph_is_loaded(self):
+        workspace = self.manager.create_workspace_async("CSV Data Source", {"path": self.path}, use_cache=False)
+        self.assertIn(self.manager.get_load_progress(workspace.id)["status"], ["loading", "ready"])
+        self.manager._load_executor.shutdown(wait=True)
+
+        progress = self.manager.get_load_progress(workspace.id)
+        self.assertEqual(progress["status"], "ready")
+        self.assertEqual(progress["rows"], 100)
+        self.assertEqual(progress["fraction"], 1.0)
+        self.assertEqual(len(workspace.initial_graph.nodes), 101)
+        self.assertIs(self.manager.workspace_manager.get_active_workspace(), workspace)
+
+    def test_failed_load_keeps_error(self):
+        workspace = self.manager.create_workspace_async("CSV Data Source", {"path": self.path + ".x"})
+        self.manager._load_executor.shutdown(wait=True)
+        self.assertEqual(workspace.status, "error")
+        self.assertIn("nije pronađen", self.manager.get_load_progress(workspace.id)["error"])
+        self.assertIsNone(self.manager.workspace_manager.get_active_workspace())
+
+    def test_cancel_queued_load(self):
+        # jedini radnik je zauzet, pa ucitavanje ceka u redu
+        release = threading.Event()
+        self.manager._load_executor = ThreadPoolExecutor(max_workers=1)
+        self.manager._load_executor.submit(release.wait)
+
+        workspace = self.manager.create_workspace_async("CSV Data Source", {"path": self.path}, use_cache=False)
+        self.assertEqual(self.manager.get_workspaces_info()[0]["status"], "loading")
+        self.assertTrue(self.manager.cancel_workspace_load(workspace.id))
+        release.set()
+        self.manager._load_executor.shutdown(wait=True)
+
+        self.assertEqual(self.manager.get_load_progress(workspace.id)["status"], "cancelled")
+        self.assertIsNone(self.manager.workspace_manager.get_workspace(workspace.id))
+        self.assertFalse(self.manager.cancel_workspace_load(workspace.id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform.filter_service import FilterService
+from graph_platform.platform.search_service import SearchService
+from graph_platform.platform.graph_view import GraphView
+
+
+class TestGraphView(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = Graph(name="G")
+        for node_id, age, role in [("A", 25, "HR"), ("B", 35, "Dev"), ("C", 45, "HR"), ("D", 55, "Dev")]:
+            self.graph.add_node(Node(id=node_id, label=node_id, data={"age": age, "role": role}))
+        for s, t in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "B")]:
+            self.graph.add_edge(Edge(source=s, target=t))
+
+    def test_filter_returns_view_over_base(self):
+        view = FilterService().apply_filter(self.graph, "age", ">", "30")
+        self.assertIsInstance(view, GraphView)
+        self.assertIs(view.base, self.graph)
+        self.assertEqual([n.id for n in view.nodes], ["B", "C", "D"])
+        self.assertEqual([(e.source, e.target) for e in view.edges], [("B", "C"), ("C", "D"), ("D", "B")])
+        self.assertIs(view.nodes[0], self.graph.get_node("B"))
+
+    def test_views_compose_by_mask(self):
+        first = FilterService().apply_filter(self.graph, "age", ">", "30")
+        second = SearchService().search(first, "hr")
+        self.assertIs(second.base, self.graph)
+        self.assertEqual([n.id for n in second.nodes], ["C"])
+        self.assertEqual(second.edges, [])
+        self.assertTrue(second.has_node("C"))
+        self.assertFalse(second.has_node("A"))
+
+    def test_mutation_materializes_without_touching_base(self):
+        view = FilterService().apply_filter(self.graph, "role", "==", "Dev")
+        view.add_node(Node(id="E"))
+        self.assertEqual([n.id for n in view.nodes], ["B", "D", "E"])
+        self.assertFalse(self.graph.has_node("E"))
+
+        # pogled nad materijalizovanim pogledom radi nad novim grafom
+        narrowed = FilterService().apply_filter(view, "age", ">", "40")
+        self.assertEqual([n.id for n in narrowed.nodes], ["D"])
+
+
+if __name__ == '__main__':
+    unittest.main()
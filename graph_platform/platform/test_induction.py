@@ -0,0 +1,47 @@
+import random
+import unittest
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform import induction
+from graph_platform.platform.induction import choose_strategy, estimate_costs, induce_edges
+
+
+class TestInduction(unittest.TestCase):
+
+    def setUp(self):
+        rnd = random.Random(4)
+        self.graph = Graph(name="G")
+        for i in range(200):
+            self.graph.add_node(Node(id=str(i)))
+        for _ in range(600):
+            self.graph.add_edge(Edge(source=str(rnd.randrange(200)), target=str(rnd.randrange(200))))
+        self.rnd = rnd
+
+    def test_strategies_agree(self):
+        for size in [0, 1, 20, 100, 200]:
+            selected = sorted(self.rnd.sample(range(200), size))
+            with self.subTest(size=size):
+                expected = [e for e in self.graph.edges
+                            if int(e.source) in selected and int(e.target) in selected]
+                self.assertEqual(induce_edges(self.graph, selected, "adjacency"), expected)
+                self.assertEqual(induce_edges(self.graph, selected, "scan"), expected)
+                self.assertEqual(induce_edges(self.graph, selected), expected)
+        self.assertRaises(ValueError, induce_edges, self.graph, [0], "bfs")
+
+    def test_csr_is_built_after_enough_scans(self):
+        selected = [1, 2, 3]
+        costs = estimate_costs(self.graph, selected)
+        self.assertGreater(costs["csr_build"], 0)
+        scans = 0
+        while choose_strategy(self.graph, selected) == "scan":
+            scans += 1
+            self.assertLess(scans, 1000)
+        # zbir usteda je dostigao cenu pravljenja CSR-a
+        self.assertGreaterEqual(scans * (costs["scan"] - costs["adjacency"]), costs["csr_build"] * 0.99)
+
+        self.graph.csr("out")
+        self.assertEqual(choose_strategy(self.graph, selected), "adjacency")
+        self.assertNotIn(self.graph, induction._scan_spent)
+
+
+if __name__ == '__main__':
+    unittest.main()
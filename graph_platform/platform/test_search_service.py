@@ -0,0 +1,58 @@
+import unittest
+from datetime import datetime
+from api.api.graph import Graph, Node
+from graph_platform.platform import bitset
+from graph_platform.platform.search_service import SearchService
+from graph_platform.platform.trigram_index import TrigramIndex
+
+
+class TestSearchServiceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.graph = Graph(name="G")
+        rows = [
+            {"id": "alpha", "name": "Alice Smith", "age": 31},
+            {"name": "Bob", "city": "Novi Sad", "joined": datetime(2021, 5, 17)},
+            {"name": "Carol", "score": 12.75, "active": True},
+            {"nickname": "smithy", "tags": ["x"]},
+        ]
+        for i, data in enumerate(rows):
+            self.graph.add_node(Node(id=str(i), data=data))
+        self.index = TrigramIndex(self.graph)
+        self.service = SearchService()
+
+    def test_index_matches_full_scan(self):
+        for query in ["smith", "SAD", "2021-05", "12.7", "true", "nam", "alpha", "xyz", "e s", "ali"]:
+            with self.subTest(query=query):
+                scanned = self.service.match_mask(self.graph, query)
+                indexed = self.service.match_mask(self.graph, query, index=self.index)
+                self.assertEqual(bitset.indices(indexed), bitset.indices(scanned))
+        self.assertEqual(self.service.stats["index_hits"], 10)
+
+    def test_short_query_and_stale_index_fall_back(self):
+        self.assertIsNone(self.index.search("sm"))
+        self.graph.edit_node("1", city="Beograd")
+        self.assertIsNone(self.index.search("beograd"))
+        mask = self.service.match_mask(self.graph, "beograd", index=self.index)
+        self.assertEqual(bitset.indices(mask), [1])
+        self.assertEqual(self.service.stats, {"index_hits": 0, "full_scans": 1})
+
+    def test_trigrams_do_not_cross_fields(self):
+        # "esm" postoji samo preko granice polja "nickname" | "smithy"
+        self.assertEqual(self.index.candidates("esm"), [])
+        self.assertGreater(self.index.memory_bytes, 0)
+
+    def test_search_blobs_follow_node_edits(self):
+        # pun bafer i provera po kandidatu daju isti rezultat kao provera polje po polje
+        self.assertEqual(bitset.indices(self.service.match_mask(self.graph, "smith")), [0, 3])
+        self.assertEqual(bitset.indices(self.service.match_mask(self.graph, "me\x00smi")), [])
+        self.assertEqual(self.graph.search_blob(1), "name\x00bob\x00city\x00novi sad\x00joined\x002021-05-17t00:00:00")
+
+        self.graph.edit_node("2", name="Smith")
+        self.assertEqual(bitset.indices(self.service.match_mask(self.graph, "smith")), [0, 2, 3])
+        view = self.service.search(self.graph, "o")
+        self.assertEqual(bitset.indices(self.service.match_mask(view, "smith")), [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
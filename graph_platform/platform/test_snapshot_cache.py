@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import unittest
+from api.api.graph import Graph, Node
+from graph_platform.platform.graph_manager import GraphManager
+from graph_platform.platform.snapshot_cache import SnapshotCache
+
+DATA = os.path.join(os.path.dirname(__file__), "..", "..", "data_source_csv", "data_source_csv", "data")
+
+
+class TestSnapshotCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        GraphManager._instance = None
+        self.manager = GraphManager()
+        self.manager.search_index_enabled = False
+        self.manager._cache = SnapshotCache(os.path.join(self.directory, "cache"))
+
+    def tearDown(self):
+        GraphManager._instance = None
+
+    def test_workspace_graph_is_loaded_from_snapshot(self):
+        path = os.path.join(self.directory, "graph.csv")
+        shutil.copy(os.path.join(DATA, "graph_200_nodes_directed.csv"), path)
+        params = {"path": path}
+
+        parsed = self.manager.create_workspace("CSV Data Source", params).initial_graph
+        # isti izvor u drugom workspace-u deli vec ucitan graf
+        self.assertIs(self.manager.create_workspace("CSV Data Source", params).initial_graph, parsed)
+        self.assertEqual(self.manager.get_cache_stats(), {"hits": 0, "misses": 1})
+
+        # posle restarta se graf cita iz snapshot-a
+        GraphManager._instance = None
+        self.manager = GraphManager()
+        self.manager.search_index_enabled = False
+        self.manager._cache = SnapshotCache(os.path.join(self.directory, "cache"))
+        cached = self.manager.create_workspace("CSV Data Source", params).initial_graph
+        self.assertEqual(self.manager.get_cache_stats(), {"hits": 1, "misses": 0})
+        self.assertIsNot(cached, parsed)
+        self.assertEqual(cached.to_dict(), parsed.to_dict())
+        self.assertEqual(cached.successors("N1"), parsed.successors("N1"))
+
+        # drugi parametri i izmenjen fajl imaju drugi kljuc
+        self.manager.create_workspace("CSV Data Source", {"path": path, "schema": "age:str"})
+        with open(path, "a") as f:
+            f.write("N1,N2\n")
+        self.manager.create_workspace("CSV Data Source", params)
+        self.assertEqual(self.manager.get_cache_stats(), {"hits": 1, "misses": 2})
+
+        self.manager.create_workspace("CSV Data Source", params, use_cache=False)
+        self.assertEqual(self.manager.get_cache_stats(), {"hits": 1, "misses": 2})
+        self.assertEqual(len(self.manager._cache.entries()), 3)
+
+    def test_least_recently_used_snapshots_are_evicted(self):
+        cache = self.manager._cache
+        graph = Graph()
+        for i in range(100):
+            graph.add_node(Node(id=f"N{i}", label="x" * 50))
+        for i, key in enumerate("abc"):
+            cache.put(key, graph)
+            os.utime(cache._path(key), ns=(i * 10 ** 9, i * 10 ** 9))
+        size = cache.size() // 3
+
+        self.assertIsNotNone(cache.get("a"))  # "a" postaje najskorije koriscen
+        cache.max_bytes = 3 * size
+        cache.put("d", graph)
+        self.assertEqual(sorted(os.path.basename(p)[0] for _, _, p in cache.entries()), ["a", "c", "d"])
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats, {"hits": 1, "misses": 1})
+
+        # ostecen snapshot je promasaj i brise se
+        with open(cache._path("c"), "r+b") as f:
+            f.truncate(40)
+        with self.assertLogs("graph_platform.platform.snapshot_cache", "WARNING"):
+            self.assertIsNone(cache.get("c"))
+        self.assertFalse(os.path.exists(cache._path("c")))
+
+
+if __name__ == '__main__':
+    unittest.main()
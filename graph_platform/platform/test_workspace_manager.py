@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform.graph_view import GraphView
+from graph_platform.platform.workspace import Workspace
+from graph_platform.platform.workspace_manager import WorkspaceManager
+
+
+def make_graph(name, n=200):
+    graph = Graph(name=name)
+    for i in range(n):
+        graph.add_node(Node(id=f"{name}{i}", label=f"{name}{i}", data={"age": i, "role": "HR" if i % 2 else "Dev"}))
+    for i in range(n - 1):
+        graph.add_edge(Edge(source=f"{name}{i}", target=f"{name}{i + 1}"))
+    return graph
+
+
+class TestMemoryBudget(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.manager = WorkspaceManager(memory_budget=None, spill_directory=self.tmp.name)
+        self.workspaces = []
+        for name in "ABC":
+            ws = Workspace(name=name, original_graph=make_graph(name), source_plugin="test", source_params={})
+            self.manager.create_workspace(ws)
+            self.workspaces.append(ws)
+        a, b, c = self.workspaces
+        # B je pogled (tag) nad pocetnim grafom
+        b.current_graph = GraphView(b.initial_graph, 0b1010, name="B")
+        self.manager.set_active_workspace(c.id)
+        # budzet za dva workspace-a
+        self.manager.memory_budget = a.memory_bytes() + c.memory_bytes() + 1
+
+    def test_lru_inactive_workspace_is_spilled_and_rehydrated(self):
+        a, b, c = self.workspaces
+        # pristup B proverava budzet; A je najdavnije koriscen
+        self.manager.get_workspace(b.id)
+        self.assertTrue(a.spilled)
+        self.assertIsNone(a.initial_graph)
+        self.assertTrue(os.path.exists(a.spill_path))
+        self.assertEqual(self.manager.get_all_workspaces()[0]["nodes"], 200)
+
+        restored = self.manager.get_workspace(a.id)
+        self.assertIs(restored, a)
+        self.assertFalse(a.spilled)
+        self.assertEqual([n.id for n in a.current_graph.nodes], [f"A{i}" for i in range(200)])
+        self.assertEqual(a.initial_graph.get_node("A3").data, {"age": 3, "role": "HR"})
+        # sada je B najdavnije koriscen, aktivan C ostaje u memoriji
+        self.assertTrue(b.spilled)
+        self.assertFalse(c.spilled)
+        self.assertEqual(self.manager.stats, {"evictions": 2, "rehydrations": 1})
+        self.assertEqual(os.listdir(self.tmp.name), [b.id + ".graph"])
+
+        self.manager.set_active_workspace(b.id)
+        self.assertIsInstance(b.current_graph, GraphView)
+        self.assertEqual([n.id for n in b.current_graph.nodes], ["B1", "B3"])
+        self.assertLessEqual(self.manager.memory_usage(), self.manager.memory_budget)
+
+    def test_accessed_workspace_is_not_spilled(self):
+        a, b, c = self.workspaces
+        # budzet manji od dva grafa: pored aktivnog C ne staje ni jedan workspace
+        self.manager.memory_budget = c.memory_bytes() + a.memory_bytes() // 2
+        with self.assertLogs("graph_platform.platform.workspace_manager", "WARNING"):
+            self.manager.get_workspace(b.id)
+        self.assertTrue(a.spilled)
+        self.assertFalse(b.spilled)
+
+        with self.assertLogs("graph_platform.platform.workspace_manager", "WARNING"):
+            restored = self.manager.get_workspace(a.id)
+        self.assertFalse(restored.spilled)
+        self.assertEqual(len(restored.current_graph.nodes), 200)
+        self.assertTrue(b.spilled)
+        self.assertFalse(c.spilled)
+
+    def test_materialized_view_stays_in_memory(self):
+        a, b, c = self.workspaces
+        b.current_graph.materialize()
+        self.manager.get_workspace(a.id)
+        self.manager.memory_budget = 1
+        with self.assertLogs("graph_platform.platform.workspace_manager", "WARNING"):
+            self.manager.enforce_budget()
+        self.assertTrue(a.spilled)
+        self.assertFalse(b.spilled)
+
+        self.manager.delete_workspace(a.id)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
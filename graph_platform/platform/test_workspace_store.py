@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from api.api.graph import Graph, Node, Edge
+from graph_platform.platform.graph_manager import GraphManager
+from graph_platform.platform.graph_view import GraphView
+from graph_platform.platform.workspace import Workspace
+
+
+def make_graph(name):
+    graph = Graph(name=name)
+    for i in range(10):
+        graph.add_node(Node(id=f"N{i}", label=f"N{i}", data={"age": 20 + 5 * i, "role": "HR" if i % 2 else "Dev"}))
+    for i in range(9):
+        graph.add_edge(Edge(source=f"N{i}", target=f"N{i + 1}"))
+    return graph
+
+
+class TestWorkspaceStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        GraphManager._instance = None
+        self.manager = GraphManager()
+        self.manager.search_index_enabled = False
+        self.manager.enable_persistence(self.tmp.name)
+
+    def tearDown(self):
+        GraphManager._instance = None
+
+    def open(self, name):
+        workspace = Workspace(name=name, original_graph=make_graph(name), source_plugin="test", source_params={})
+        self.manager.workspace_manager.create_workspace(workspace)
+        self.manager.switch_workspace(workspace.id)
+        return workspace
+
+    def restart(self):
+        GraphManager._instance = None
+        self.manager = GraphManager()
+        self.manager.search_index_enabled = False
+        self.manager.enable_persistence(self.tmp.name)
+        return self.manager.workspace_manager
+
+    def test_workspaces_survive_restart(self):
+        tagged = self.open("tagged")
+        self.manager.apply_filter("age", ">", "30")
+        self.manager.apply_search("hr")
+        edited = self.open("edited")
+        self.manager.apply_cli_command("create node --id=X role=HR")
+        edited.selected_visualizer = "Block Visualizer"
+        self.manager.save_workspace(edited)
+
+        wm = self.restart()
+        self.assertEqual([ws.name for ws in wm.workspaces.values()], ["tagged", "edited"])
+        self.assertEqual(wm.active_workspace_id, edited.id)
+        # samo metapodaci: grafovi se citaju pri prvom pristupu
+        self.assertTrue(all(ws.initial_graph is None for ws in wm.workspaces.values()))
+        self.assertEqual([info["nodes"] for info in wm.get_all_workspaces()], [4, 11])
+
+        restored = wm.get_workspace(edited.id)
+        self.assertEqual(restored.initial_graph.get_node("X").data, {"role": "HR"})
+        self.assertEqual(restored.selected_visualizer, "Block Visualizer")
+
+        self.manager.switch_workspace(tagged.id)
+        restored = self.manager.workspace_manager.get_active_workspace()
+        self.assertIsInstance(restored.current_graph, GraphView)
+        self.assertEqual([n.id for n in restored.current_graph.nodes], ["N3", "N5", "N7", "N9"])
+        self.assertEqual(self.manager.get_applied_searches(), ["hr"])
+        self.manager.remove_search("hr")
+        self.assertEqual(len(restored.current_graph.nodes), 7)
+
+        self.manager.delete_workspace(edited.id)
+        wm = self.restart()
+        self.assertEqual(list(wm.workspaces), [tagged.id])
+        self.assertEqual(wm.get_workspace(tagged.id).active_filters,
+                         [{'attribute': "age", 'operator': ">", 'value': "30"}])
+        self.assertEqual(sorted(os.listdir(self.tmp.name)), sorted([tagged.id + ".json", tagged.id + ".graph", "state.json"]))
+
+    def test_edited_view_is_stored_as_graph(self):
+        workspace = self.open("view")
+        self.manager.apply_filter("role", "==", "HR")
+        self.manager.apply_cli_command("edit node --id=N1 age=99")
+        data = workspace.current_graph.get_node("N1").data
+
+        restored = self.restart().get_workspace(workspace.id)
+        self.assertEqual([n.id for n in restored.current_graph.nodes], ["N1", "N3", "N5", "N7", "N9"])
+        self.assertEqual(restored.current_graph.get_node("N1").data, data)
+        self.assertEqual(data["age"], "99")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional
+from api.api.graph import Graph
+from graph_platform.platform.search_service import search_fields, scan
+
+
+def _contains(posting: array, i: int) -> bool:
+    pos = bisect_left(posting, i)
+    return pos < len(posting) and posting[pos] == i
+
+
+class TrigramIndex:
+    """
+    Invertovani indeks trigrama nad tekstovima po kojima SearchService trazi
+    (nazivi atributa, string/brojevne vrednosti, ISO datumi).
+
+    Za upit od bar 3 karaktera kandidati su presek posting lista svih
+    trigrama upita, a tacna provera (`scan`) radi se samo nad njima.
+    Trigrami se prave unutar jednog polja, pa pogodak ne moze da "preskoci"
+    granicu izmedju dva atributa. Kraci upiti vracaju None (pun prolaz).
+    """
+
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self.version = graph.version
+        postings: Dict[str, List[int]] = {}
+
+        for i, node in enumerate(graph.nodes):
+            grams = set()
+            for field in search_fields(node):
+                grams.update(field[p:p + 3] for p in range(len(field) - 2))
+            for gram in grams:
+                postings.setdefault(gram, []).append(i)
+
+        # cvorovi se obilaze redom, pa su posting liste vec sortirane
+        self.postings: Dict[str, array] = {gram: array("i", ids) for gram, ids in postings.items()}
+        self.memory_bytes = sys.getsizeof(self.postings) + sum(
+            sys.getsizeof(gram) + sys.getsizeof(ids) for gram, ids in self.postings.items()
+        )
+
+    def is_current(self) -> bool:
+        return self.graph.version == self.version
+
+    def candidates(self, query_lower: str) -> Optional[List[int]]:
+        if len(query_lower) < 3 or not self.is_current():
+            return None
+        grams = {query_lower[p:p + 3] for p in range(len(query_lower) - 2)}
+        postings = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        result = list(postings[0])
+        for posting in postings[1:]:
+            result = [i for i in result if _contains(posting, i)]
+            if not result:
+                break
+        return result
+
+    def search(self, query_lower: str) -> Optional[List[int]]:
+        """Indeksi cvorova koji sadrze upit, ili None ako indeks ne moze da odgovori."""
+        candidates = self.candidates(query_lower)
+        if candidates is None:
+            return None
+        return scan(self.graph, candidates, query_lower)
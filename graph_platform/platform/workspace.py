@@ -1,12 +1,35 @@
+import os
+import threading
+import time
 import uuid
+import weakref
+from functools import reduce
+from typing import Dict, Hashable, Optional, Tuple, Union
 # Pazite na import, prilagodite putanju ako vam je drugacija
 # Pretpostavljam da je Graph u api.api.graph
+from api.api.data_source import LoadProgress
 from api.api.graph import Graph
+from api.api.graph_binary import read_graph, write_graph
+from graph_platform.platform.attribute_index import AttributeIndex
+from graph_platform.platform.filter_query import compile_query
+from graph_platform.platform.graph_memory import graph_bytes
+from graph_platform.platform.graph_view import GraphView
+from graph_platform.platform.trigram_index import TrigramIndex
 
 class Workspace:
-    def __init__(self, name: str, original_graph: Graph, source_plugin: str, source_params: dict):
+    # stanje ucitavanja grafa (workspace bez grafa se ucitava u pozadini)
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "error"
+    CANCELLED = "cancelled"
+
+    def __init__(self, name: str, original_graph: Optional[Graph], source_plugin: str, source_params: dict):
         self.id = str(uuid.uuid4())
         self.name = name
+        self.created = time.time()
+        self.status = self.LOADING if original_graph is None else self.READY
+        self.progress: Optional[LoadProgress] = None
+        self.error: Optional[str] = None
         
         # Podaci o izvoru
         self.source_plugin = source_plugin
@@ -19,17 +42,276 @@ class Workspace:
         # Istorija promena
         self.active_searches = []
         self.active_filters = []
+        # Maska (bitset nad initial_graph) za svaki primenjeni tag; vazi dok se
+        # initial_graph ne promeni (tag_masks_version == initial_graph.version)
+        self.tag_masks: Dict[Hashable, int] = {}
+        self.tag_masks_version: Optional[int] = None
+        self.current_mask: Optional[int] = None
+        # pogled koji je napravio pipeline tagova; ako trenutni graf nije on (ni
+        # initial_graph), npr. posle CLI izmene ili CLI filtera, tag se primenjuje
+        # na trenutni graf umesto AND-a maski
+        self.tag_view: Optional[GraphView] = None
+        self._attribute_index: Optional[AttributeIndex] = None
+        # Trigram indeks za pretragu se pravi u pozadini posle kreiranja workspace-a
+        self.search_index: Optional[TrigramIndex] = None
+        self._search_index_thread: Optional[threading.Thread] = None
         # Ovde pamtimo koji vizualizator koristi OVAJ workspace
         self.selected_visualizer = "Simple Visualizer" # Default vrednost
 
+        # Budzet memorije (WorkspaceManager): poslednje koriscenje, procena
+        # velicine i snapshot na disku dok je workspace izbacen iz memorije
+        self.last_used = 0
+        self._memory: Optional[Tuple[tuple, int, int]] = None
+        self.spill_path: Optional[str] = None
+        # pogled (maska, ime) nad pocetnim grafom ili putanja snapshot-a trenutnog grafa
+        self._spilled_view: Union[Tuple[int, Optional[str]], str, None] = None
+        self._spilled_masks_valid = False
+        self._spilled_nodes = 0
+        # snapshot pripada WorkspaceStore-u: ne brise se posle citanja
+        self.spill_persistent = False
+        # grafovi koji su vec upisani u WorkspaceStore: (weakref, version)
+        self.stored_initial: Optional[Tuple[weakref.ref, int]] = None
+        self.stored_current: Optional[Tuple[weakref.ref, int]] = None
+
     def set_current_graph(self, graph: Graph):
         self.current_graph = graph
 
+    def set_loaded_graph(self, graph: Graph):
+        """Graf ucitan u pozadini postaje pocetni i trenutni graf workspace-a."""
+        self.initial_graph = graph
+        self.current_graph = graph
+        self.status = self.READY
+
+    @property
+    def ready(self) -> bool:
+        return self.status == self.READY
+
+    # --- memorija ---
+
+    def memory_bytes(self, shared: bool = True) -> int:
+        """
+        Procena memorije grafova i indeksa za pretragu (0 dok je na disku ili se ucitava).
+        shared=False: bez pocetnog grafa i indeksa nad njim, koje drugi workspace vec drzi.
+        """
+        initial, current = self.initial_graph, self.current_graph
+        if initial is None:
+            return 0
+        index = self.search_index
+        key = (id(initial), initial.version, id(current), getattr(current, "_graph", None) is not None, id(index))
+        if self._memory is None or self._memory[0] != key:
+            common = graph_bytes(initial)
+            if index is not None:
+                common += index.memory_bytes
+            own = graph_bytes(current) if current is not initial else 0
+            self._memory = (key, common, own)
+        _, common, own = self._memory
+        return common + own if shared else own
+
+    @property
+    def spilled(self) -> bool:
+        return self.spill_path is not None
+
+    @property
+    def spillable(self) -> bool:
+        """
+        Graf moze na disk ako je trenutni graf pocetni ili pogled (maska) nad njim.
+        Materijalizovan pogled deli Node objekte sa pocetnim grafom, pa bi
+        posle citanja sa diska izmene vise ne bi bile zajednicke.
+        """
+        current = self.current_graph
+        if not self.ready or self.spilled or type(self.initial_graph) is not Graph:
+            return False
+        if current is self.initial_graph:
+            return True
+        return isinstance(current, GraphView) and current._graph is None and current.base is self.initial_graph
+
+    def detach_initial_graph(self):
+        """
+        Copy-on-write: workspace dobija svoju kopiju pocetnog grafa koji deli sa
+        drugim workspace-ovima (poziva se pre CLI izmene). Trenutni graf se
+        prevezuje na kopiju, jer pogled i materijalizovan pogled dele Node i
+        Edge objekte sa pocetnim grafom. Pogled ostaje pogled nad kopijom, pa
+        izmene materijalizovanog pogleda i dalje javljaju kopiji `node_changed`.
+        """
+        shared = self.initial_graph
+        graph = shared.copy()
+        nodes = {id(old): new for old, new in zip(shared.nodes, graph.nodes)}
+        edges = {id(old): new for old, new in zip(shared.edges, graph.edges)}
+
+        def rebind(g):
+            if g is shared:
+                return graph
+            if isinstance(g, GraphView):
+                view = GraphView(rebind(g.base), g.mask, name=g.name)
+                if g._graph is not None:
+                    view._graph = rebind(g._graph)
+                return view
+            copy = Graph(name=g.name, directed=g.directed,
+                         nodes=[nodes.get(id(n), n) for n in g.nodes], edges=[edges.get(id(e), e) for e in g.edges])
+            copy.schema = dict(g.schema)
+            return copy
+
+        following = self.follows_tags
+        self.current_graph = rebind(self.current_graph)
+        self.tag_view = self.current_graph if following and self.current_graph is not graph else None
+        self.initial_graph = graph
+        if self.tag_masks_version == shared.version:
+            # redosled cvorova je isti, pa maske tagova vaze i za kopiju
+            self.tag_masks_version = graph.version
+        self._attribute_index = None
+        self.search_index = None
+
+    def node_count(self) -> int:
+        if self.spilled:
+            return self._spilled_nodes
+        return len(self.current_graph.nodes) if self.current_graph else 0
+
+    def spill(self, path: str):
+        """Zapisuje pocetni graf u snapshot i oslobadja grafove i indekse iz memorije."""
+        initial, current = self.initial_graph, self.current_graph
+        write_graph(initial, path)
+        self.set_on_disk(path, (current.mask, current.name) if current is not initial else None,
+                         self.tag_masks_version == initial.version, self.node_count())
+
+    def set_on_disk(self, path: str, view: Union[Tuple[int, Optional[str]], str, None],
+                    masks_valid: bool, nodes: int, persistent: bool = False):
+        """Graf je u snapshot-u `path`; iz memorije se oslobadjaju grafovi i indeksi."""
+        self.spill_path = path
+        self._spilled_view = view
+        self._spilled_masks_valid = masks_valid
+        self._spilled_nodes = nodes
+        self.spill_persistent = persistent
+        self.initial_graph = self.current_graph = None
+        self._attribute_index = None
+        self.search_index = None
+        self._memory = None
+
+    def rehydrate(self):
+        """Vraca graf iz snapshot-a; maske tagova vaze i dalje (redosled cvorova je isti)."""
+        graph = read_graph(self.spill_path)
+        self.initial_graph = self.current_graph = graph
+        if self._spilled_masks_valid:
+            self.tag_masks_version = graph.version
+        view = self._spilled_view
+        if isinstance(view, str):
+            self.current_graph = read_graph(view)
+        elif view is not None:
+            mask, name = view
+            self.current_graph = GraphView(graph, mask, name=name)
+            if mask == self.current_mask:
+                self.tag_view = self.current_graph
+        if self.spill_persistent:
+            # procitano iz WorkspaceStore-a: na disku je isto sto i u memoriji
+            self.stored_initial = (weakref.ref(graph), graph.version)
+            self.stored_current = (weakref.ref(self.current_graph), self.current_graph.version)
+        self.discard_spill()
+
+    def discard_spill(self):
+        if self.spill_path is not None and not self.spill_persistent:
+            try:
+                os.remove(self.spill_path)
+            except FileNotFoundError:
+                pass
+        self.spill_path = None
+        self._spilled_view = None
+        self.spill_persistent = False
+
+    @property
+    def attribute_index(self) -> AttributeIndex:
+        """Lenji indeks atributa nad initial_graph; pravi se ponovo kad se graf izmeni."""
+        index = self._attribute_index
+        if index is None or index.graph is not self.initial_graph or not index.is_current():
+            index = self._attribute_index = AttributeIndex(self.initial_graph)
+        return index
+
+    def build_search_index_async(self):
+        """Pokrece pravljenje trigram indeksa nad initial_graph u pozadinskoj niti."""
+        if self._search_index_thread is not None and self._search_index_thread.is_alive():
+            return
+        self._search_index_thread = threading.Thread(target=self._build_search_index, daemon=True)
+        self._search_index_thread.start()
+
+    def _build_search_index(self):
+        graph = self.initial_graph
+        if graph is None:
+            return
+        try:
+            index = TrigramIndex(graph)
+        except RuntimeError:
+            # graf je menjan tokom pravljenja; indeks ce se napraviti ponovo na sledeci zahtev
+            return
+        if index.graph is self.initial_graph:
+            # graf je u medjuvremenu mozda izbacen na disk
+            self.search_index = index
+
+    def current_search_index(self) -> Optional[TrigramIndex]:
+        """Aktuelan trigram indeks ili None (tada se, ako treba, pokrece novo pravljenje)."""
+        index = self.search_index
+        if index is not None and index.graph is self.initial_graph and index.is_current():
+            return index
+        self.build_search_index_async()
+        return None
+
     def reset(self):
         """Vraća workspace na početno stanje."""
         self.current_graph = self.initial_graph
         self.active_searches = []
         self.active_filters = []
+        self.tag_masks = {}
+        self.current_mask = None
+        self.tag_view = None
 
     def reset_graph(self):
-        self.current_graph = self.initial_graph
\ No newline at end of file
+        self.current_graph = self.initial_graph
+        self.current_mask = None
+        self.tag_view = None
+
+    @property
+    def follows_tags(self) -> bool:
+        """Trenutni graf je initial_graph ili nematerijalizovan pogled koji su napravili samo tagovi."""
+        current = self.current_graph
+        if current is self.initial_graph:
+            return True
+        return current is self.tag_view and current._graph is None
+
+    @staticmethod
+    def search_key(query: str) -> Hashable:
+        return ("search", query)
+
+    @staticmethod
+    def filter_key(attribute: str, operator: str, value) -> Hashable:
+        return ("filter", attribute, operator, value)
+
+    @staticmethod
+    def query_key(query) -> Hashable:
+        # kanonski oblik, pa 'age>30' i 'age > 30' dele istu masku
+        return ("query", str(query))
+
+    @staticmethod
+    def filter_tag_key(filter: dict) -> Hashable:
+        """Kljuc maske za stavku iz active_filters (prost filter ili upit)."""
+        if "query" in filter:
+            return Workspace.query_key(compile_query(filter["query"]))
+        return Workspace.filter_key(filter["attribute"], filter["operator"], filter["value"])
+
+    def add_tag_mask(self, key: Hashable, mask: int):
+        """Dodavanje taga je jedan AND nad trenutnom maskom."""
+        self.tag_masks[key] = mask
+        self._set_mask(mask if self.current_mask is None else self.current_mask & mask)
+
+    def remove_tag_mask(self, key: Hashable):
+        self.tag_masks.pop(key, None)
+        self.apply_tag_masks()
+
+    def apply_tag_masks(self):
+        """Trenutni graf je pogled nad initial_graph sa AND svih aktivnih maski."""
+        if not self.tag_masks:
+            self.current_mask = None
+            self.tag_view = None
+            self.current_graph = self.initial_graph
+            return
+        self._set_mask(reduce(lambda a, b: a & b, self.tag_masks.values()))
+
+    def _set_mask(self, mask: int):
+        self.current_mask = mask
+        self.current_graph = self.tag_view = GraphView(self.initial_graph, mask, name=self.initial_graph.name)
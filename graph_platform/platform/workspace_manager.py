@@ -1,45 +1,169 @@
+import logging
+import os
+import threading
 from typing import Dict, Optional, List
 from .workspace import Workspace
 
+logger = logging.getLogger(__name__)
+
+
+def default_spill_directory() -> str:
+    """GRAPH_SPILL_DIR ili ~/.cache/graph_platform/workspaces."""
+    return os.environ.get("GRAPH_SPILL_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "graph_platform", "workspaces"
+    )
+
+
+def default_memory_budget() -> Optional[int]:
+    """GRAPH_MEMORY_BUDGET (bajtova) ili bez ogranicenja."""
+    value = os.environ.get("GRAPH_MEMORY_BUDGET")
+    return int(value) if value else None
+
+
 class WorkspaceManager:
-    def __init__(self):
+    """
+    Workspace-ovi i aktivan workspace.
+
+    Sa budzetom memorije (`memory_budget`, bajtova) zbir procenjenih velicina
+    workspace-ova u memoriji se drzi ispod budzeta: najdavnije korisceni
+    neaktivni workspace-ovi se zapisuju u snapshot na disku (`spill_directory`)
+    i oslobadjaju, a graf se cita nazad pri sledecem pristupu preko
+    `get_workspace` / `set_active_workspace`. Aktivan workspace ostaje u memoriji.
+    """
+
+    def __init__(self, memory_budget: Optional[int] = None, spill_directory: Optional[str] = None):
         self.workspaces: Dict[str, Workspace] = {}
         self.active_workspace_id: Optional[str] = None
+        self.memory_budget = memory_budget if memory_budget is not None else default_memory_budget()
+        self.spill_directory = spill_directory or default_spill_directory()
+        self.stats = {"evictions": 0, "rehydrations": 0}
+        self._clock = 0
+        self._lock = threading.RLock()
 
     def create_workspace(self, workspace: Workspace):
         self.workspaces[workspace.id] = workspace
-        # Ako je ovo prvi workspace, postavi ga kao aktivnog
-        if self.active_workspace_id is None:
+        # Ako je ovo prvi ucitan workspace, postavi ga kao aktivnog
+        if self.active_workspace_id is None and workspace.ready:
             self.active_workspace_id = workspace.id
-    
+        self._use(workspace)
+
+    def restore_workspaces(self, workspaces: List[Workspace], active_workspace_id: Optional[str] = None):
+        """Dodaje workspace-ove sacuvane na disku; grafovi se citaju tek pri prvom pristupu."""
+        for workspace in workspaces:
+            self.workspaces[workspace.id] = workspace
+        if active_workspace_id in self.workspaces:
+            self.active_workspace_id = active_workspace_id
+        elif self.active_workspace_id is None:
+            self.active_workspace_id = next((ws.id for ws in self.workspaces.values() if ws.ready), None)
+
     def get_workspace(self, workspace_id: str) -> Optional[Workspace]:
-        return self.workspaces.get(workspace_id)
+        workspace = self.workspaces.get(workspace_id)
+        if workspace is not None:
+            self._use(workspace)
+        return workspace
 
     def get_active_workspace(self) -> Optional[Workspace]:
         if self.active_workspace_id:
-            return self.workspaces.get(self.active_workspace_id)
+            return self.get_workspace(self.active_workspace_id)
         return None
 
     def set_active_workspace(self, workspace_id: str):
-        if workspace_id in self.workspaces:
-            self.active_workspace_id = workspace_id
-        else:
+        workspace = self.workspaces.get(workspace_id)
+        if workspace is None:
             raise ValueError(f"Workspace {workspace_id} ne postoji.")
+        if not workspace.ready:
+            raise ValueError(f"Workspace {workspace_id} nije ucitan (stanje: {workspace.status}).")
+        self.active_workspace_id = workspace_id
+        self._use(workspace)
 
     def delete_workspace(self, workspace_id: str):
         if workspace_id in self.workspaces:
-            del self.workspaces[workspace_id]
+            self.workspaces.pop(workspace_id).discard_spill()
             if self.active_workspace_id == workspace_id:
-                self.active_workspace_id = next(iter(self.workspaces)) if self.workspaces else None
+                # sledeci aktivan je prvi ucitan workspace
+                self.active_workspace_id = next((ws.id for ws in self.workspaces.values() if ws.ready), None)
+                if self.active_workspace_id is not None:
+                    self._use(self.workspaces[self.active_workspace_id])
 
     def get_all_workspaces(self) -> List[dict]:
         return [
             {
-                "id": ws.id, 
-                "name": ws.name, 
+                "id": ws.id,
+                "name": ws.name,
                 "active": ws.id == self.active_workspace_id,
-                "nodes": len(ws.current_graph.nodes) if ws.current_graph else 0,
-                "visualizer": ws.selected_visualizer
+                "status": ws.status,
+                "nodes": ws.node_count(),
+                "visualizer": ws.selected_visualizer,
+                "search_index_bytes": ws.search_index.memory_bytes if ws.search_index else None,
+                "memory_bytes": ws.memory_bytes(),
+                "spilled": ws.spilled,
+                "shared": bool(self.sharing(ws)),
             }
             for ws in self.workspaces.values()
-        ]
\ No newline at end of file
+        ]
+
+    def sharing(self, workspace: Workspace) -> List[Workspace]:
+        """Ostali workspace-ovi sa istim (zajednickim) pocetnim grafom."""
+        graph = workspace.initial_graph
+        if graph is None:
+            return []
+        return [ws for ws in list(self.workspaces.values()) if ws is not workspace and ws.initial_graph is graph]
+
+    # --- budzet memorije ---
+
+    def _use(self, workspace: Workspace):
+        """Belezi koriscenje; izbacen workspace se cita sa diska, pa se proverava budzet."""
+        with self._lock:
+            self._clock += 1
+            workspace.last_used = self._clock
+            if workspace.spilled:
+                workspace.rehydrate()
+                self.stats["rehydrations"] += 1
+                self.enforce_budget(keep=workspace)
+            elif workspace.ready and self.memory_budget is not None and workspace.memory_bytes() > 0:
+                self.enforce_budget(keep=workspace)
+
+    def memory_usage(self) -> int:
+        """Zbir procenjenih velicina workspace-ova koji su u memoriji; zajednicki graf se broji jednom."""
+        total = 0
+        counted = set()
+        for ws in list(self.workspaces.values()):
+            graph = id(ws.initial_graph)
+            total += ws.memory_bytes(shared=graph not in counted)
+            counted.add(graph)
+        return total
+
+    def enforce_budget(self, keep: Optional[Workspace] = None) -> int:
+        """
+        Izbacuje na disk najdavnije koriscene neaktivne workspace-ove dok zbir ne stane u budzet.
+        `keep` (workspace kome se upravo pristupa) se ne izbacuje.
+        """
+        if self.memory_budget is None:
+            return 0
+        with self._lock:
+            used = self.memory_usage()
+            if used <= self.memory_budget:
+                return 0
+            candidates = sorted(
+                # zajednicki graf ostaje u memoriji zbog ostalih workspace-ova
+                (ws for ws in self.workspaces.values()
+                 if ws.id != self.active_workspace_id and ws is not keep and ws.spillable and not self.sharing(ws)),
+                key=lambda ws: ws.last_used,
+            )
+            spilled = 0
+            for ws in candidates:
+                if used <= self.memory_budget:
+                    break
+                size = ws.memory_bytes()
+                try:
+                    os.makedirs(self.spill_directory, exist_ok=True)
+                    ws.spill(os.path.join(self.spill_directory, ws.id + ".graph"))
+                except Exception as e:
+                    logger.warning(f"Workspace '{ws.name}' nije izbacen na disk: {e}")
+                    continue
+                used -= size
+                spilled += 1
+                self.stats["evictions"] += 1
+            if used > self.memory_budget:
+                logger.warning(f"Workspace-ovi u memoriji ({used} B) ne staju u budzet ({self.memory_budget} B)")
+            return spilled
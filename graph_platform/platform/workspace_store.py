@@ -0,0 +1,194 @@
+"""
+Trajno cuvanje workspace-ova na lokalnom disku, da prezive restart servera.
+
+Za svaki workspace se u direktorijum upisuje `<id>.json` (ime, izvor, aktivne
+pretrage i filteri, maske tagova, vizualizator i trenutni pogled) i
+`<id>.graph` sa pocetnim grafom u binarnom formatu (`graph_binary`), pa su
+sacuvane i CLI izmene nad njim. Ako trenutni graf nije pocetni graf niti
+pogled (maska) nad njim, npr. rezultat CLI filtera, upisuje se i
+`<id>.current.graph`. Graf se ponovo upisuje samo kad se promeni (version);
+ostale izmene prepisuju samo json. Aktivan workspace je u `state.json`.
+
+Pri pokretanju se citaju samo json fajlovi: workspace je "na disku" kao
+izbacen workspace (`Workspace.set_on_disk`), a graf se cita pri prvom pristupu.
+"""
+import json
+import logging
+import os
+import threading
+import weakref
+from typing import Any, List, Optional, Tuple
+
+from api.api.graph import Graph
+from api.api.graph_binary import write_graph
+from graph_platform.platform.graph_view import GraphView
+from graph_platform.platform.workspace import Workspace
+
+logger = logging.getLogger(__name__)
+
+FORMAT = 1
+STATE_FILE = "state.json"
+
+
+def default_directory() -> str:
+    """GRAPH_WORKSPACE_DIR ili ~/.local/share/graph_platform/workspaces."""
+    return os.environ.get("GRAPH_WORKSPACE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".local", "share", "graph_platform", "workspaces"
+    )
+
+
+def _is_stored(stored: Optional[Tuple[weakref.ref, int]], graph) -> bool:
+    return stored is not None and stored[0]() is graph and stored[1] == graph.version
+
+
+class WorkspaceStore:
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or default_directory()
+        self._lock = threading.Lock()
+
+    def _path(self, workspace_id: str, suffix: str) -> str:
+        return os.path.join(self.directory, workspace_id + suffix)
+
+    def _write_json(self, path: str, data: Any):
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(data, f, default=str)
+        os.replace(temporary, path)
+
+    # --- upis ---
+
+    def save(self, workspace: Workspace):
+        """Upisuje stanje workspace-a; graf samo ako se promenio od poslednjeg upisa."""
+        if not workspace.ready:
+            return
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            if workspace.spilled:
+                # graf nije u memoriji, pa nije ni menjan od poslednjeg upisa
+                view = workspace._spilled_view
+                if isinstance(view, str):
+                    current = {"graph": os.path.basename(view)}
+                else:
+                    current = None if view is None else {"mask": format(view[0], "x"), "name": view[1]}
+                masks_valid = workspace._spilled_masks_valid
+            else:
+                current = self._save_graphs(workspace)
+                masks_valid = workspace.tag_masks_version == workspace.initial_graph.version
+            self._write_json(self._path(workspace.id, ".json"), {
+                "format": FORMAT,
+                "id": workspace.id,
+                "name": workspace.name,
+                "created": workspace.created,
+                "source_plugin": workspace.source_plugin,
+                "source_params": workspace.source_params,
+                "selected_visualizer": workspace.selected_visualizer,
+                "active_searches": workspace.active_searches,
+                "active_filters": workspace.active_filters,
+                # maske su hex, jer int sa mnogo cifara ne moze u decimalni string
+                "tag_masks": [[list(key), format(mask, "x")] for key, mask in workspace.tag_masks.items()],
+                "masks_valid": masks_valid,
+                "current_mask": None if workspace.current_mask is None else format(workspace.current_mask, "x"),
+                "current": current,
+                "nodes": workspace.node_count(),
+            })
+
+    def _save_graphs(self, workspace: Workspace) -> Optional[dict]:
+        """Upisuje izmenjene grafove; vraca opis trenutnog grafa za json."""
+        initial, current = workspace.initial_graph, workspace.current_graph
+        if not _is_stored(workspace.stored_initial, initial):
+            write_graph(initial, self._path(workspace.id, ".graph"))
+            workspace.stored_initial = (weakref.ref(initial), initial.version)
+
+        current_path = self._path(workspace.id, ".current.graph")
+        if current is initial or (isinstance(current, GraphView) and current._graph is None
+                                  and current.base is initial):
+            self._remove(current_path)
+            workspace.stored_current = None
+            if current is initial:
+                return None
+            return {"mask": format(current.mask, "x"), "name": current.name}
+
+        if not _is_stored(workspace.stored_current, current):
+            graph = current
+            if not isinstance(graph, Graph):
+                graph = Graph(name=current.name, directed=current.directed, nodes=current.nodes, edges=current.edges)
+            write_graph(graph, current_path)
+            workspace.stored_current = (weakref.ref(current), current.version)
+        return {"graph": os.path.basename(current_path)}
+
+    def save_active(self, workspace_id: Optional[str]):
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            self._write_json(os.path.join(self.directory, STATE_FILE), {"active": workspace_id})
+
+    def remove(self, workspace_id: str):
+        with self._lock:
+            for suffix in (".json", ".graph", ".current.graph"):
+                self._remove(self._path(workspace_id, suffix))
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    # --- citanje ---
+
+    @staticmethod
+    def _read_json(path: str) -> Any:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def load(self) -> Tuple[List[Workspace], Optional[str]]:
+        """Workspace-ovi sa diska (bez grafova, koji se citaju pri prvom pristupu) i id aktivnog."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return [], None
+        workspaces = []
+        for name in names:
+            if not name.endswith(".json") or name == STATE_FILE:
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                workspaces.append(self._workspace(self._read_json(path)))
+            except Exception as e:
+                logger.warning(f"Workspace {path} nije ucitan: {e}")
+        workspaces.sort(key=lambda ws: ws.created)
+
+        try:
+            active = self._read_json(os.path.join(self.directory, STATE_FILE)).get("active")
+        except (OSError, ValueError):
+            active = None
+        return workspaces, active
+
+    def _workspace(self, data: dict) -> Workspace:
+        if data.get("format") != FORMAT:
+            raise ValueError(f"nepodrzan format {data.get('format')}")
+        graph_path = self._path(data["id"], ".graph")
+        if not os.path.isfile(graph_path):
+            raise FileNotFoundError(graph_path)
+
+        workspace = Workspace(name=data["name"], original_graph=None,
+                              source_plugin=data["source_plugin"], source_params=data["source_params"])
+        workspace.id = data["id"]
+        workspace.created = data["created"]
+        workspace.status = Workspace.READY
+        workspace.selected_visualizer = data["selected_visualizer"]
+        workspace.active_searches = data["active_searches"]
+        workspace.active_filters = data["active_filters"]
+        workspace.tag_masks = {tuple(key): int(mask, 16) for key, mask in data["tag_masks"]}
+        if data["current_mask"] is not None:
+            workspace.current_mask = int(data["current_mask"], 16)
+
+        current = data["current"]
+        if current is None:
+            view = None
+        elif "mask" in current:
+            view = (int(current["mask"], 16), current["name"])
+        else:
+            view = os.path.join(self.directory, current["graph"])
+        workspace.set_on_disk(graph_path, view, data["masks_valid"], data["nodes"], persistent=True)
+        return workspace